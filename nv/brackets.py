@@ -0,0 +1,200 @@
+import re
+from bisect import bisect_left
+
+from sublime import Region
+
+from NeoVintageous.nv.session import get_session_view_value, set_session_view_value
+
+
+# The brackets in strings and comments are skipped by the lone bracket motions
+# and text objects, unless they start in a string or comment.
+LONE_BRACKET_SELECTOR = 'source - string - comment, text - string - comment'
+
+# The size of the region indexed either side of the point of a query to begin
+# with. It's doubled until the query is answered or the region is the view.
+_WINDOW_SIZE = 4096
+
+
+class BracketIndex:
+    """The nesting of a pair of single character brackets in a region of a view.
+
+    The index is built with one pass over the text of the region and answers
+    the bracket matching queries with binary searches. It's valid until the
+    view is modified. Brackets preceded by a backslash are skipped if
+    escapable, and brackets that don't match the selector are skipped if one
+    is given. The brackets outside of the region are not known, so a query
+    that finds nothing may find a bracket in a bigger region, unless the
+    region reaches the start or end of the view that the query looks towards.
+    """
+
+    def __init__(self, view, opening: str, closing: str, region: Region,
+                 escapable: bool = False, selector: str = None):
+        self.change_count = view.change_count()
+        self.region = region
+        self.at_bof = region.begin() == 0
+        self.at_eof = region.end() == view.size()
+
+        # The sorted positions of the brackets.
+        self.positions = []  # type: list
+
+        # The index of the innermost opening bracket that's still open after
+        # each bracket, or -1 if there is none.
+        self.enclosing = []  # type: list
+
+        # The position of the closing bracket of each matched opening bracket,
+        # keyed by the index of the opening bracket.
+        self.closings = {}  # type: dict
+
+        # The sorted positions of the closing brackets without an opening one.
+        self.unmatched = []  # type: list
+
+        # The text starts one character before the region, if there is one, so
+        # that the first bracket can be checked for an escape.
+        base = max(0, region.begin() - 1)
+        text = view.substr(Region(base, region.end()))
+        stack = []  # type: list
+        brackets = re.compile('[' + re.escape(opening) + re.escape(closing) + ']')
+        for match in brackets.finditer(text, region.begin() - base):
+            i = match.start()
+            if escapable and i > 0 and text[i - 1] == '\\':
+                continue
+
+            pt = base + i
+            if selector and not view.match_selector(pt, selector):
+                continue
+
+            if text[i] == opening:
+                stack.append(len(self.positions))
+            elif stack:
+                self.closings[stack.pop()] = pt
+            else:
+                self.unmatched.append(pt)
+
+            self.positions.append(pt)
+            self.enclosing.append(stack[-1] if stack else -1)
+
+    def is_valid(self, view) -> bool:
+        return self.change_count == view.change_count()
+
+    def _innermost(self, pt: int) -> int:
+        i = bisect_left(self.positions, pt) - 1
+
+        return self.enclosing[i] if i >= 0 else -1
+
+    def find_opening(self, pt: int, count: int = 1):
+        """Return the opening bracket before pt that isn't closed before pt.
+
+        A count greater than one goes out that many levels of nesting. Returns
+        the position of the bracket, or None if there is no such bracket in
+        the region.
+        """
+        i = self._innermost(pt)
+        for _ in range(count - 1):
+            if i <= 0:
+                return None
+
+            i = self.enclosing[i - 1]
+
+        if i >= 0:
+            return self.positions[i]
+
+        return None
+
+    def find_closing(self, pt: int, count: int = 1):
+        """Return the closing bracket at or after pt that isn't opened at or after pt.
+
+        A count greater than one goes out that many levels of nesting. Returns
+        the position of the bracket, or None if there is no such bracket in
+        the region.
+        """
+        closing = None
+        for _ in range(count):
+            i = self._innermost(pt)
+            if i >= 0:
+                closing = self.closings.get(i)
+                if closing is None:
+                    return None
+            else:
+                j = bisect_left(self.unmatched, pt)
+                if j == len(self.unmatched):
+                    return None
+
+                closing = self.unmatched[j]
+
+            pt = closing + 1
+
+        return closing
+
+
+def _find_bracket(view, pt: int, forward: bool, opening: str, closing: str, count: int,
+                  escapable: bool, selector: str):
+    indexes = get_session_view_value(view, 'bracket_index')
+    if indexes is None:
+        indexes = {}
+        set_session_view_value(view, 'bracket_index', indexes)
+
+    key = (opening, closing, escapable, selector)
+    index = indexes.get(key)
+    if index is None or not index.is_valid(view) or not index.region.contains(pt):
+        index = None
+
+    size = view.size()
+    window_size = _WINDOW_SIZE
+    while True:
+        if index is None:
+            region = Region(max(0, pt - window_size), min(size, pt + window_size))
+            index = indexes[key] = BracketIndex(view, opening, closing, region, escapable, selector)
+
+        bracket = index.find_closing(pt, count) if forward else index.find_opening(pt, count)
+        if bracket is not None or (index.at_eof if forward else index.at_bof):
+            return bracket
+
+        # Nothing was found in the region, so the bracket is outside of it.
+        window_size = 2 * max(pt - index.region.begin(), index.region.end() - pt)
+        index = None
+
+
+def find_opening_bracket(view, pt: int, opening: str, closing: str, count: int = 1,
+                         escapable: bool = False, selector: str = None):
+    """Return the opening bracket before pt that isn't closed before pt.
+
+    A count greater than one goes out that many levels of nesting. Returns the
+    position of the bracket, or None if there is no such bracket. The brackets
+    are indexed per view, in a region around pt that grows until the bracket
+    is found.
+    """
+    return _find_bracket(view, pt, False, opening, closing, count, escapable, selector)
+
+
+def find_closing_bracket(view, pt: int, opening: str, closing: str, count: int = 1,
+                         escapable: bool = False, selector: str = None):
+    """Return the closing bracket at or after pt that isn't opened at or after pt.
+
+    See find_opening_bracket().
+    """
+    return _find_bracket(view, pt, True, opening, closing, count, escapable, selector)
+
+
+def get_lone_bracket_selector(view, pt: int):
+    if view.match_selector(pt, 'string, comment'):
+        return None
+
+    return LONE_BRACKET_SELECTOR
+
+
+# Returns the opening and closing characters of a pair of search patterns, if
+# they are single characters e.g. ('\\(', '\\)') and ('<', '>'), otherwise None.
+def get_single_char_brackets(patterns) -> tuple:
+    brackets = []
+    for pattern in patterns:
+        if len(pattern) == 2 and pattern[0] == '\\' and not pattern[1].isalnum():
+            brackets.append(pattern[1])
+        elif len(pattern) == 1 and pattern not in '\\.^$*+?{}[]|()':
+            brackets.append(pattern)
+        else:
+            return None
+
+    if len(brackets) != 2 or brackets[0] == brackets[1]:
+        return None
+
+    return tuple(brackets)
@@ -53,6 +53,8 @@ DEF['gen_def'] = {
   'searchcurstyle'                	: dict(t=str ,v="fill"     	,key='search_cur_style'                   ),
   'searchincstyle'                	: dict(t=str ,v="fill"     	,key='search_inc_style'                   ),
   'searchoccstyle'                	: dict(t=str ,v="fill"     	,key='search_occ_style'                   ),
+  'searchviewportonly'            	: dict(t=bool,v=False      	,key='search_viewport_only'               ),
+  'incsearchdelay'                	: dict(t=int ,v=0          	,key='incsearch_delay'                    ),
   'bell'                          	: dict(t=str ,v="blink"    	,key='bell'                               ),
   'bellcolorscheme'               	: dict(t=str ,v="dark"     	,key='bell_color_scheme'                  ),
   'autonohlsearchonnormalenter'   	: dict(t=bool,v=True       	,key='auto_nohlsearch_on_normal_enter'    ),
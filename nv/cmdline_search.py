@@ -1,12 +1,16 @@
+from sublime import set_timeout
+
 from NeoVintageous.nv.cmdline import Cmdline
 from NeoVintageous.nv.history import history_update
 from NeoVintageous.nv.history import reset_cmdline_history
 from NeoVintageous.nv.search import add_search_highlighting
 from NeoVintageous.nv.search import clear_search_highlighting
 from NeoVintageous.nv.search import find_search_occurrences
+from NeoVintageous.nv.search import find_visible_search_occurrences
 from NeoVintageous.nv.search import process_search_pattern
 from NeoVintageous.nv.settings import append_sequence
 from NeoVintageous.nv.settings import get_count
+from NeoVintageous.nv.settings import get_setting
 from NeoVintageous.nv.settings import set_reset_during_init
 from NeoVintageous.nv.state import evaluate_state
 from NeoVintageous.nv.state import reset_command_data
@@ -26,6 +30,7 @@ class CmdlineSearch():
         self.view = view
         self.forward = forward
         self.type = Cmdline.SEARCH_FORWARD if self.forward else Cmdline.SEARCH_BACKWARD
+        self._changes = 0
 
     def run(self, edit, pattern: str = '') -> None:
         set_reset_during_init(self.view, False)
@@ -40,6 +45,7 @@ class CmdlineSearch():
         self._cmdline.prompt(pattern)
 
     def on_done(self, pattern: str) -> None:
+        self._changes += 1
         history_update(self.type + pattern)
         reset_cmdline_history()
         clear_search_highlighting(self.view)
@@ -51,6 +57,7 @@ class CmdlineSearch():
         evaluate_state(self.view)
 
     def on_change(self, pattern: str) -> None:
+        self._changes += 1
         count = get_count(self.view)
         sel = self.view.sel()[0]
         pattern, flags = process_search_pattern(self.view, pattern)
@@ -82,10 +89,34 @@ class CmdlineSearch():
         if not match:
             return status_message('E486: Pattern not found: %s', pattern)
 
-        add_search_highlighting(self.view, find_search_occurrences(self.view, pattern, flags), [match])
         show_if_not_visible(self.view, match)
 
+        # Highlighting all the occurrences is the expensive part, so with a
+        # delay it's only done once typing pauses. Until then only the match is
+        # highlighted. Pending jobs are dropped when the pattern changes again.
+        delay = get_setting(self.view, 'incsearch_delay')
+        if delay:
+            add_search_highlighting(self.view, [], [match])
+            changes = self._changes
+            set_timeout(lambda: self._add_search_highlighting(changes, pattern, flags, match), delay)
+        else:
+            self._add_search_highlighting(self._changes, pattern, flags, match)
+
+    def _add_search_highlighting(self, changes: int, pattern: str, flags: int, match) -> None:
+        if changes != self._changes:
+            return
+
+        if get_setting(self.view, 'search_viewport_only'):
+            # The highlighting is redone on every change to the pattern, so
+            # only the occurrences around the match are searched for.
+            occurrences = find_visible_search_occurrences(self.view, pattern, flags)
+        else:
+            occurrences = find_search_occurrences(self.view, pattern, flags)
+
+        add_search_highlighting(self.view, occurrences, [match])
+
     def on_cancel(self) -> None:
+        self._changes += 1
         clear_search_highlighting(self.view)
         reset_command_data(self.view)
         reset_cmdline_history()
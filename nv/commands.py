@@ -13,7 +13,7 @@ from NeoVintageous.nv                  import macros
 from NeoVintageous.nv.cmdline          import Cmdline
 from NeoVintageous.nv.cmdline_search   import CmdlineSearch
 from NeoVintageous.nv.ex.completions   import insert_best_cmdline_completion, on_change_cmdline_completion_prefix, reset_cmdline_completion_state
-from NeoVintageous.nv.ex_cmds          import do_ex_cmd_edit_wrap, do_ex_cmdline, do_ex_command
+from NeoVintageous.nv.ex_cmds          import do_ex_cmd_edit_wrap, do_ex_cmdline, do_ex_command, substitute_confirm
 from NeoVintageous.nv.feed_key         import FeedKeyHandler
 from NeoVintageous.nv.feed_cmd         import FeedTextCmdHandler
 from NeoVintageous.nv.goto             import GotoView, get_linewise_non_blank_target, jump_to_mark
@@ -30,7 +30,7 @@ from NeoVintageous.nv.process_notation import ProcessNotationHandler
 from NeoVintageous.nv.process_text_cmd import ProcessCmdTextHandler
 from NeoVintageous.nv.rc               import open_rc, open_config_file_kdl, reload_rc
 from NeoVintageous.nv.registers        import registers_get_for_paste, registers_op_change, registers_op_delete, registers_op_yank, _reset
-from NeoVintageous.nv.search           import add_search_highlighting, clear_search_highlighting, find_search_occurrences, find_word_search_occurrences, get_search_occurrences, process_search_pattern, process_word_search_pattern, process_str_search_pattern
+from NeoVintageous.nv.search           import add_search_highlighting, clear_search_highlighting, get_search_index, get_search_occurrences, process_search_pattern, process_word_search_pattern, process_str_search_pattern
 from NeoVintageous.nv.settings         import get_glue_until_normal_mode, get_last_search_pattern, get_last_search_pattern_command, get_mode, get_normal_insert_count, get_repeat_data, get_sequence, get_partial_sequence, get_partial_text, get_partial_sequence, get_setting, get_xpos, is_processing_notation, set_glue_until_normal_mode, set_last_char_search, set_last_search_pattern, set_mode, set_normal_insert_count, set_repeat_data, set_reset_during_init, set_xpos, toggle_ctrl_keys, toggle_super_keys, get_config, get_capture_register, get_register, get_action_count,  get_motion_count
 from NeoVintageous.nv.state            import reset_command_data, update_status_line, get_action, get_motion
 from NeoVintageous.nv.ui               import ui_bell, ui_highlight_yank, ui_highlight_yank_clear
@@ -367,6 +367,8 @@ class nv_view(TextCommand):
             self.view.insert(edit, 0, **kwargs)
         elif action == 'replace_line':
             replace_line(self.view, edit, **kwargs)
+        elif action == 'substitute_confirm':
+            substitute_confirm(self.view, edit, **kwargs)
 
 
 class Neovintageous(WindowCommand):
@@ -2432,6 +2434,7 @@ class nv_vi_search_forward_impl(TextCommand):
 
         sel = self.view.sel()[0]
         pattern, flags = process_search_pattern(self.view, pattern)
+        index = get_search_index(self.view, pattern, flags)
         start = get_insertion_point_at_b(sel) + 1
         end = self.view.size()
 
@@ -2440,7 +2443,8 @@ class nv_vi_search_forward_impl(TextCommand):
                               start=start,
                               end=end,
                               flags=flags,
-                              times=count)
+                              times=count,
+                              index=index)
         if not match:
             return status_message('E486: Pattern not found: %s', pattern)
 
@@ -2460,7 +2464,7 @@ class nv_vi_search_forward_impl(TextCommand):
 
         target = get_insertion_point_at_a(match)
         regions_transformer(self.view, f)
-        add_search_highlighting(self.view, find_search_occurrences(self.view, pattern, flags))
+        add_search_highlighting(self.view, index.regions)
 
 
 class nv_vi_move_char_right(TextCommand):
@@ -3180,7 +3184,8 @@ class nv_vi_find_word(TextCommand):
                 start = view.word(s.end()).end(),
                 end   = view.size(),
                 flags = flags,
-                times = count
+                times = count,
+                index = index
             )
 
             if match:
@@ -3208,11 +3213,12 @@ class nv_vi_find_word(TextCommand):
             pattern, flags = process_word_search_pattern(self.view, word)
         else:
             pattern, flags = process_str_search_pattern (self.view, word)
+        index = get_search_index(self.view, pattern, flags)
 
         with jumplist_updater  (self.view):
             regions_transformer(self.view, f)
 
-        add_search_highlighting(self.view, find_word_search_occurrences(self.view, pattern, flags))
+        add_search_highlighting(self.view, index.regions)
 
         if save:
             set_last_search_pattern(self.view, word, 'nv_vi_find_word')
@@ -3228,7 +3234,8 @@ class nv_vi_find_word_rev(TextCommand):
                 start = 0,
                 end   = (s.b if s.a > s.b else s.a),
                 flags = flags,
-                times = count
+                times = count,
+                index = index
             )
 
             if match:
@@ -3257,11 +3264,12 @@ class nv_vi_find_word_rev(TextCommand):
             pattern, flags = process_word_search_pattern(self.view, word)
         else:
             pattern, flags = process_str_search_pattern (self.view, word)
+        index = get_search_index(self.view, pattern, flags)
 
         with jumplist_updater  (self.view):
             regions_transformer(self.view, f)
 
-        add_search_highlighting(self.view, find_word_search_occurrences(self.view, pattern, flags))
+        add_search_highlighting(self.view, index.regions)
 
         if save:
             set_last_search_pattern(self.view, word, 'nv_vi_find_word_rev')
@@ -3585,6 +3593,7 @@ class nv_vi_question_mark_impl(TextCommand):
 
         sel = self.view.sel()[0]
         pattern, flags = process_search_pattern(self.view, pattern)
+        index = get_search_index(self.view, pattern, flags)
         start = 0
         end = sel.b + 1 if not sel.empty() else sel.b
 
@@ -3593,7 +3602,8 @@ class nv_vi_question_mark_impl(TextCommand):
                                       start=start,
                                       end=end,
                                       flags=flags,
-                                      times=count)
+                                      times=count,
+                                      index=index)
 
         if not match:
             return status_message('E486: Pattern not found: %s', pattern)
@@ -3614,7 +3624,7 @@ class nv_vi_question_mark_impl(TextCommand):
 
         target = get_insertion_point_at_a(match)
         regions_transformer(self.view, f)
-        add_search_highlighting(self.view, find_search_occurrences(self.view, pattern, flags))
+        add_search_highlighting(self.view, index.regions)
 
 
 class nv_vi_question_mark(TextCommand):
@@ -6,8 +6,9 @@ from sublime_plugin import EventListener
 from NeoVintageous.nv.modeline  import do_modeline
 from NeoVintageous.nv.options   import get_option
 from NeoVintageous.nv.registers import set_alternate_file_register
+from NeoVintageous.nv.search    import update_search_highlighting
 from NeoVintageous.nv.session   import session_on_close, session_on_exit, get_session_value, get_session_view_value
-from NeoVintageous.nv.settings  import get_mode, get_setting
+from NeoVintageous.nv.settings  import get_mode, get_setting, settings_on_close
 from NeoVintageous.nv.state     import init_view
 from NeoVintageous.nv.utils     import fix_eol_cursor, is_view, update_xpos
 from NeoVintageous.nv.modes     import INSERT, INTERNAL_NORMAL, NORMAL, OPERATOR_PENDING, REPLACE, SELECT, UNKNOWN, VISUAL, VISUAL_BLOCK, VISUAL_LINE
@@ -31,9 +32,33 @@ def _check_query_context_value(value: bool, operator: int, operand: bool, match_
     return False
 
 
+# on_query_context is called for every key binding ST evaluates on every key
+# press, so the view settings the mode contexts depend on are kept in a per
+# view snapshot. The snapshot is cleared by the view settings on_change
+# listener, e.g. entering and leaving command mode sets 'command_mode'.
+_CONTEXT_TAG = 'NeoVintageous.query_context'
+_view_contexts = {}  # type: dict
+
+
+def _get_view_context(view) -> dict:
+    view_id = view.id()
+    try:
+        context = _view_contexts[view_id]
+    except KeyError:
+        context = _view_contexts[view_id] = {}
+        view.settings().add_on_change(_CONTEXT_TAG, context.clear)
+
+    if not context:
+        context['is_view'] = is_view(view)
+        context['command_mode'] = bool(view.settings().get('command_mode'))
+
+    return context
+
+
 def _is_command_mode(view, operator: int = OP_EQUAL, operand: bool = True, match_all: bool = False) -> bool:
+    context = _get_view_context(view)
     return _check_query_context_value(
-        (view.settings().get('command_mode') and is_view(view)),
+        (context['command_mode'] and context['is_view']),
         operator,
         operand,
         match_all
@@ -44,21 +69,22 @@ def _is_insert_mode(view, operator: int, operand: bool, match_all: bool) -> bool
     # TODO This currently returns true for all non-normal modes e.g. Replace
     # mode. Fixing this will break things, for example <Esc> in replace mode
     # would break, a few things need to be reworked to fix this.
+    context = _get_view_context(view)
     return _check_query_context_value(
-        (not view.settings().get('command_mode') and is_view(view)),
+        (not context['command_mode'] and context['is_view']),
         operator,
         operand,
         match_all
     )
 def _is_insert_mode_real(view, operator: int, operand: bool, match_all: bool) -> bool:
-    return _check_query_context_value(((get_session_view_value(view,'mode')==INSERT) and is_view(view)),operator,operand,match_all)
+    return _check_query_context_value(((get_session_view_value(view,'mode')==INSERT) and _get_view_context(view)['is_view']),operator,operand,match_all)
 def _is_normal_mode     (view, operator: int, operand: bool, match_all: bool) -> bool:
-    return _check_query_context_value(((get_session_view_value(view,'mode')==NORMAL) and is_view(view)),operator,operand,match_all)
+    return _check_query_context_value(((get_session_view_value(view,'mode')==NORMAL) and _get_view_context(view)['is_view']),operator,operand,match_all)
 
 
 def _command_or_insert(view, operator: int, operand: bool, match_all: bool) -> bool:
     return _check_query_context_value(
-        is_view(view),
+        _get_view_context(view)['is_view'],
         operator,
         operand,
         match_all
@@ -132,6 +158,24 @@ _query_contexts = {
 }  # type: dict
 
 
+# Counts of the context keys queried (including other packages' keys), only
+# collected while profiling is enabled
+_query_context_counts = None  # type: dict
+
+
+def profile_query_context(enable: bool = True) -> None:
+    global _query_context_counts
+    _query_context_counts = {} if enable else None
+
+
+def get_query_context_counts() -> list:
+    """Return (key, count) pairs, most queried first."""
+    if not _query_context_counts:
+        return []
+
+    return sorted(_query_context_counts.items(), key=lambda item: item[1], reverse=True)
+
+
 class NeoVintageousEvents(EventListener):
     _last_deactivated_file_name = None
 
@@ -140,10 +184,12 @@ class NeoVintageousEvents(EventListener):
         #→ operand: str|bool      e.g.: key=nv_handle_key operator=0 operand=<C-c>
         #← bool  If the context is   known
         #  None  If the context is unknown
-        try:
-            return _query_contexts[key](view, operator, operand, match_all)
-        except KeyError:
-            pass
+        if _query_context_counts is not None:
+            _query_context_counts[key] = _query_context_counts.get(key, 0) + 1
+
+        handler = _query_contexts.get(key)  # most queried keys belong to other packages
+        if handler:
+            return handler(view, operator, operand, match_all)
 
     def on_text_command(self, view, command: str, args: dict):
         # Called when a text command is issued.
@@ -200,6 +246,14 @@ class NeoVintageousEvents(EventListener):
                     if args['event']['button'] == 1:
                         update_xpos(view)
 
+        # Commands can scroll the view, see the search_viewport_only setting.
+        update_search_highlighting(view)
+
+    def on_post_window_command(self, window, command, args):
+        view = window.active_view()
+        if view:
+            update_search_highlighting(view)
+
     def on_load(self, view):
         if is_view(view) and get_option(view, 'modeline'):
             do_modeline(view)
@@ -212,6 +266,8 @@ class NeoVintageousEvents(EventListener):
 
     def on_close(self, view):
         session_on_close(view)
+        settings_on_close(view)
+        _view_contexts.pop(view.id(), None)
 
     def on_activated(self, view):
         if is_view(view):
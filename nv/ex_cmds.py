@@ -7,11 +7,8 @@ import traceback
 
 import sublime
 
-from sublime import DIALOG_CANCEL
-from sublime import DIALOG_YES
 from sublime import Region
 from sublime import set_timeout, version
-from sublime import yes_no_cancel_dialog
 
 from NeoVintageous.nv.rc        import cfgU
 from NeoVintageous.nv           import shell, variables
@@ -26,10 +23,11 @@ from NeoVintageous.nv.options   import get_option, set_option, toggle_option
 from NeoVintageous.nv.polyfill  import has_dirty_buffers, has_newline_at_eof, is_file_read_only, is_view_read_only, reload_syntax, set_selection, spell_add, spell_undo, truncate, view_find_all_in_range, view_to_region
 from NeoVintageous.nv.registers import get_alternate_file_register, is_alternate_file_register, registers_get_all, registers_set
 from NeoVintageous.nv.search    import clear_search_highlighting
-from NeoVintageous.nv.search    import is_smartcase_pattern
-from NeoVintageous.nv.settings  import get_cmdline_cwd, get_ex_global_last_pattern, get_ex_shell_last_command, get_last_substitute_search_pattern, get_last_substitute_string, get_mode, get_setting, reset_setting, set_cmdline_cwd, set_ex_global_last_pattern, set_ex_shell_last_command, set_last_substitute_search_pattern, set_last_substitute_string, set_setting
+from NeoVintageous.nv.search    import compile_search_pattern
+from NeoVintageous.nv.session   import get_session_view_value, set_session_view_value
+from NeoVintageous.nv.settings  import get_cmdline_cwd, get_ex_global_last_pattern, get_ex_shell_last_command, get_last_search_pattern, get_last_substitute_search_pattern, get_last_substitute_string, get_mode, get_setting, reset_setting, set_cmdline_cwd, set_ex_global_last_pattern, set_ex_shell_last_command, set_last_substitute_search_pattern, set_last_substitute_string, set_setting
 from NeoVintageous.nv.ui        import ui_bell
-from NeoVintageous.nv.utils     import adding_regions, current_working_directory, expand_path, expand_to_realpath, get_line_count, glue_undo_groups, next_non_blank, regions_transformer, row_at, save_view, show_ascii
+from NeoVintageous.nv.utils     import current_working_directory, expand_path, expand_to_realpath, get_line_count, next_non_blank, row_at, save_view, show_ascii
 from NeoVintageous.nv.modes     import INSERT, INTERNAL_NORMAL, NORMAL, OPERATOR_PENDING, REPLACE, SELECT, UNKNOWN, VISUAL, VISUAL_BLOCK, VISUAL_LINE
 from NeoVintageous.nv.vim       import enter_normal_mode, status_message
 from NeoVintageous.nv.window    import open_alternate_file, vnew, window_buffer_control, window_control, window_quit_view, window_quit_views, window_tab_control
@@ -187,10 +185,13 @@ def ex_close(window, forceit: bool = False, **kwargs) -> None:
     window_control(window, 'c', close_if_last=forceit)
 
 
-def ex_copy(view, edit, line_range: RangeNode, address=None, **kwargs) -> None:
+def ex_copy(view, edit, line_range: RangeNode, address=None, global_lines=None, **kwargs) -> None:
     if address is None:
         return status_message("E14: Invalid address")
 
+    if global_lines:
+        return _global_copy_or_move(view, edit, global_lines, address, move=False)
+
     source = line_range.resolve(view)
 
     destination = resolve_address(view, address)
@@ -213,6 +214,46 @@ def ex_copy(view, edit, line_range: RangeNode, address=None, **kwargs) -> None:
     enter_normal_mode(view)
 
 
+# Copies or moves the lines of :global to the top or the bottom of the view in
+# one edit. Like running the command on each line in turn, the lines end up in
+# reverse order at the top and in order at the bottom. Other addresses depend
+# on where the previous lines went, so are not supported.
+def _global_copy_or_move(view, edit, global_lines: list, address: str, move: bool) -> None:
+    address = address.strip()
+    if address not in ('0', '$'):
+        return status_message('Command not supported: %s %s', 'move' if move else 'copy', address)
+
+    newline_at_eof = has_newline_at_eof(view)
+
+    start = global_lines[0][0]
+    text = view.substr(Region(start, global_lines[-1][1]))
+    lines = [text[a - start:b - start] for (a, b) in global_lines]
+    if not lines[-1].endswith('\n'):
+        lines[-1] += '\n'
+
+    if move:
+        _delete_lines(view, edit, global_lines)
+
+    if address == '0':
+        lines.reverse()
+        pt = 0
+    else:
+        pt = view.size()
+        if pt > 0 and not has_newline_at_eof(view):
+            view.insert(edit, pt, '\n')
+            pt += 1
+
+    text = ''.join(lines)
+    view.insert(edit, pt, text)
+
+    if not newline_at_eof and has_newline_at_eof(view):
+        view.erase(edit, Region(view.size() - 1, view.size()))
+
+    # The cursor goes to the line that would have been copied or moved last.
+    set_selection(view, 0 if address == '0' else pt + len(text) - len(lines[-1]))
+    enter_normal_mode(view)
+
+
 def ex_cquit(window, **kwargs) -> None:
     window.run_command('exit')
 
@@ -227,49 +268,48 @@ def ex_delete(view, edit, register: str, line_range: RangeNode, global_lines=Non
     if r == Region(-1, -1):
         r = view.full_line(0)
 
-    rs = [r]
-
     # If :global called us, ignore the parsed range.
     if global_lines:
-        rs = [Region(a, b) for (a, b) in global_lines]
+        deleted, pt = _delete_lines(view, edit, global_lines)
+    else:
+        deleted, pt = _delete_lines(view, edit, [(r.a, r.b)])
 
-    def _select(view, regions: list, register: str) -> None:
-        view.sel().clear()
-        to_store = []
-        for r in regions:
-            view.sel().add(r)
-            if register:
-                to_store.append(view.substr(view.full_line(r)))
+    # Save stuff to be deleted in register
+    if register:
+        if not deleted.endswith('\n'):
+            deleted += '\n'
 
-        if register:
-            text = ''.join(to_store)
-            if not text.endswith('\n'):
-                text = text + '\n'
+        registers_set(view, register, [deleted])
 
-            registers_set(view, register, [text])
+    set_selection(view, pt)
+    enter_normal_mode(view)
 
-    # Save stuff to be deleted in register
-    if global_lines:
-        _select(view, [Region(r.a, r.b - 1) for r in rs], register)
-    else:
-        _select(view, [Region(r.a, r.b) for r in rs], register)
 
-    # Build regions to be selected after deletion
-    deleted_so_far = 0
-    new_sel_pos = []
-    for r in rs:
-        new_sel_pos.append(r.a - deleted_so_far)
-        size_of_region = r.b - r.a
-        deleted_so_far += size_of_region
+# Deletes the sorted lines, given as (begin, end) pairs, with one replace, and
+# returns the deleted text and where the last of the lines was. Adjacent lines
+# are merged into runs, and the text between the runs is rebuilt from the same
+# extract of the span that they cover.
+def _delete_lines(view, edit, lines: list) -> tuple:
+    runs = []  # type: list
+    for a, b in lines:
+        if runs and runs[-1][1] == a:
+            runs[-1][1] = b
+        else:
+            runs.append([a, b])
 
-    # Delete
-    for r in reversed(rs):
-        view.erase(edit, r)
+    span = Region(runs[0][0], runs[-1][1])
+    text = view.substr(span)
+    kept = []
+    deleted = []
+    pt = span.a
+    for a, b in runs:
+        kept.append(text[pt - span.a:a - span.a])
+        deleted.append(text[a - span.a:b - span.a])
+        pt = b
 
-    new_sel = view.sel()[-1].b
+    view.replace(edit, span, ''.join(kept))
 
-    set_selection(view, new_sel)
-    enter_normal_mode(view)
+    return ''.join(deleted), runs[-1][0] - sum(b - a for (a, b) in runs[:-1])
 
 
 def ex_double_ampersand(view, edit, flags, count: int, line_range: RangeNode, **kwargs) -> None:
@@ -362,22 +402,34 @@ def ex_global(window, view, pattern: str, line_range: RangeNode, cmd='print', **
     if not matches:
         return status_message('Pattern not found: %s', pattern)
 
-    matches = [view.full_line(r.begin()) for r in matches]
-    matches = [[r.a, r.b] for r in matches]
+    # A line is a target if a match starts on it. The `!` of `:g!`/`:global!`
+    # is translated into `kwargs['forceit'] == True` and means we should pick
+    # all lines _not_ matching the pattern. The lines are passed to the command
+    # in one go, so that it can apply them as a single edit.
+    inverse = kwargs.get('forceit', False)
+    size = view.size()
+    matches = iter(matches)
+    match = next(matches, None)
+    global_lines = []
+    for line in view.lines(region):
+        while match is not None and match.begin() < line.begin():
+            match = next(matches, None)
+
+        if (match is not None and match.begin() <= line.end()) != inverse:
+            global_lines.append([line.a, line.b + 1 if line.b < size else line.b])
+
+    if not global_lines:
+        if inverse:
+            return status_message('Pattern found in every line: %s', pattern)
+
+        return status_message('Pattern not found: %s', pattern)
 
-    # Handle `:g!`/`:global!`
-    # The `!` is translated into `kwargs['forceit'] == True` and means we should
-    # pick all lines _not_ matching the pattern.
-    if kwargs.get('forceit', False):
-        inv_pos = region.a
-        new_matches = []
-        for a, b in matches:
-            new_matches.append([inv_pos, a])
-            inv_pos = b
-        new_matches.append([inv_pos, region.b])
-        matches = new_matches
+    # An empty substitute pattern is the last search pattern, which for the
+    # lines of :global is its own pattern.
+    if cmd.target == 'substitute' and cmd.params.get('pattern') == '':
+        cmd.params['pattern'] = pattern
 
-    cmd.params['global_lines'] = matches
+    cmd.params['global_lines'] = global_lines
 
     do_ex_command(window, cmd.target, cmd.params)
     set_ex_global_last_pattern(pattern)
@@ -411,10 +463,13 @@ def ex_let(name, value, **kwargs) -> None: # mapleader <space>
     variables.set(name, re.sub('^(?:"|\')(.*)(?:"|\')$', '\\1', value))
 
 
-def ex_move(view, edit, line_range: RangeNode, address: str = None, **kwargs) -> None:
+def ex_move(view, edit, line_range: RangeNode, address: str = None, global_lines=None, **kwargs) -> None:
     if address is None:
         return status_message("E14: Invalid address")
 
+    if global_lines:
+        return _global_copy_or_move(view, edit, global_lines, address, move=True)
+
     source = line_range.resolve(view)
     if any(s.contains(source) for s in view.sel()):
         return status_message("E134: Move lines into themselves")
@@ -756,24 +811,130 @@ def ex_snoremap(lhs: str = None, rhs: str = None, **kwargs) -> None:
     mappings_add(SELECT, lhs, rhs)
 
 
-def ex_sort(view, options: str = '', forceit=False, **kwargs) -> None:
-    case_sensitive = True if 'i' not in options else False
+# The numbers that the :sort options n, x, o and b sort on, and their bases. A
+# leading minus sign is included, and a base prefix is ignored.
+_SORT_NUMBER_PATTERNS = {
+    'n': (re.compile('(-?)(\\d+)'), 10),
+    'x': (re.compile('(-?)(?:0[xX])?([0-9a-fA-F]+)'), 16),
+    'o': (re.compile('(-?)(0[oO][0-7]+|\\d+)'), 8),
+    'b': (re.compile('(-?)(?:0[bB])?([01]+)'), 2),
+}
+
+# Like Vim, the number the :sort option o finds is only octal if it has a
+# leading 0 or 0o and all of its digits are octal, otherwise it's decimal.
+_SORT_OCTAL_PATTERN = re.compile('0[oO]?[0-7]+')
+
+# The float that the :sort option f sorts on, which like Vim's str2float() must
+# be at the start of the text.
+_SORT_FLOAT_PATTERN = re.compile('\\s*\\+?\\s*(-?(?:(?:\\d+\\.?\\d*|\\.\\d+)(?:[eE][-+]?\\d+)?|inf))')
+
+
+def _get_sort_key(text: str, kind: str, ignorecase: bool):
+    if kind == 'f':
+        if not text.strip():
+            return float('-inf')
+
+        match = _SORT_FLOAT_PATTERN.match(text)
+
+        return float(match.group(1)) if match else 0.0
+
+    if kind:
+        pattern, base = _SORT_NUMBER_PATTERNS[kind]
+        match = pattern.search(text)
+        if not match:
+            # Lines without a number sort before the lines with one.
+            return (False, 0)
+
+        digits = match.group(2)
+        if kind == 'o' and not _SORT_OCTAL_PATTERN.fullmatch(digits):
+            base = 10
+
+        number = int(digits, base)
+
+        return (True, -number if match.group(1) else number)
+
+    return text.lower() if ignorecase else text
 
-    with glue_undo_groups(view):
-        view.run_command('sort_lines', {
-            'case_sensitive': case_sensitive,
-            'reverse': forceit
-        })
 
-        if 'u' in options:
-            view.run_command('permute_lines', {'operation': 'unique'})
+def ex_sort(view, edit, line_range: RangeNode, options: str = '', pattern: str = None,
+            forceit: bool = False, **kwargs) -> None:
+    kinds = set(options) & set('bfnox')
+    if len(kinds) > 1:
+        return status_message('E474: Invalid argument')
 
-        def f(view, s: Region) -> Region:
-            return Region(next_non_blank(view, s.begin()))
+    kind = kinds.pop() if kinds else None
+    ignorecase = 'i' in options
 
-        regions_transformer(view, f)
-        enter_normal_mode(view)
-        view.show(view.sel()[-1], False)
+    compiled_pattern = None
+    if pattern is not None:
+        if not pattern:
+            pattern = get_last_search_pattern(view)
+            if not pattern:
+                return status_message('E35: No previous regular expression')
+
+        # The pattern is translated like a search, and uses the ignorecase and
+        # smartcase options, not the i option.
+        try:
+            compiled_pattern = compile_search_pattern(view, pattern)
+        except Exception as e:
+            return status_message('[regex error]: {} ... in pattern {}'.format(str(e), pattern))
+
+    # The default line specifier for :sort is the whole file (1,$).
+    if line_range.is_empty:
+        region = view_to_region(view)
+    else:
+        region = line_range.resolve(view)
+
+    lines = view.lines(region)
+    if not lines:
+        return
+
+    span = Region(lines[0].begin(), lines[-1].end())
+    text = view.substr(span)
+    texts = text.split('\n')
+
+    # The keys are computed once per line, and the lines are sorted by their
+    # index so that the sort is stable, as in Vim. With a pattern, the key is
+    # the text after the match, or the match itself with the r option. Lines
+    # without a match have an empty key, so they keep their order before the
+    # other lines.
+    keys = []
+    for line_text in texts:
+        if compiled_pattern:
+            match = compiled_pattern.search(line_text)
+            if not match:
+                line_text = ''
+            elif 'r' in options:
+                line_text = match.group()
+            else:
+                line_text = line_text[match.end():]
+
+        keys.append(_get_sort_key(line_text, kind, ignorecase))
+
+    order = sorted(range(len(texts)), key=keys.__getitem__)
+    if forceit:
+        order.reverse()
+
+    if 'u' in options:
+        # Only the first of a sequence of identical lines is kept, ignoring
+        # case with the i option.
+        sorted_texts = []
+        previous = None
+        for i in order:
+            compare = texts[i].lower() if ignorecase else texts[i]
+            if compare != previous:
+                sorted_texts.append(texts[i])
+                previous = compare
+    else:
+        sorted_texts = [texts[i] for i in order]
+
+    sorted_text = '\n'.join(sorted_texts)
+    if sorted_text != text:
+        view.replace(edit, span, sorted_text)
+
+    set_selection(view, next_non_blank(view, span.begin()))
+    enter_normal_mode(view)
+    view.show(view.sel()[-1], False)
 
 
 def ex_split(window, file: str = None, **kwargs) -> None:
@@ -790,7 +951,7 @@ def ex_spellundo(word: str, **kwargs) -> None:
 
 def ex_substitute(view, edit, line_range: RangeNode,
                   pattern: str = None, replacement: str = '', flags: list = None,
-                  count: int = 1, **kwargs) -> None:
+                  count: int = 1, global_lines=None, **kwargs) -> None:
     if flags is None:
         flags = []
 
@@ -810,16 +971,10 @@ def ex_substitute(view, edit, line_range: RangeNode,
     set_last_substitute_search_pattern(pattern)
     set_last_substitute_string(replacement)
 
-    computed_flags = 0
-
-    computed_flags |= re.MULTILINE
-
-    if (get_option(view, 'ignorecase') or 'i' in flags) and 'I' not in flags:
-        if not is_smartcase_pattern(view, pattern):
-            computed_flags |= re.IGNORECASE
+    ignorecase = (get_option(view, 'ignorecase') or 'i' in flags) and 'I' not in flags
 
     try:
-        compiled_pattern = re.compile(pattern, flags=computed_flags)
+        compiled_pattern = compile_search_pattern(view, pattern, ignorecase)
     except Exception as e:
         return status_message('[regex error]: {} ... in pattern {}'.format(str(e), pattern))
 
@@ -829,75 +984,175 @@ def ex_substitute(view, edit, line_range: RangeNode,
 
     replace_count = 0 if (flags and 'g' in flags) else 1
 
+    # If :global called us, ignore the parsed range.
+    if global_lines:
+        lines = [view.line(a) for (a, b) in global_lines]
+    else:
+        lines = view.lines(target_region)
+
+    if not lines:
+        return status_message('E486: Pattern not found: {}'.format(pattern))
+
     if 'c' in flags:
+        matches = _find_substitute_matches(view, lines, compiled_pattern, replacement, replace_count)
+        if not matches:
+            return status_message('E486: Pattern not found: {}'.format(pattern))
+
+        set_session_view_value(view, 'substitute_confirm', {
+            'matches': matches,
+            'index': 0,
+            'accepted': [],
+            'change_count': view.change_count()
+        })
 
-        def _replace_confirming(view, edit, pattern: str, compiled_pattern,
-                                replacement: str, replace_count: int, target_region: Region) -> None:
+        return _prompt_substitute_confirm(view)
+
+    # The lines are substituted in one pass over the text of the range, and
+    # only the lines that changed are replaced, so that the regions and marks
+    # on the other lines are left alone.
+    changes = []
+    substitutions = 0
+    substituted_lines = 0
+    for pt, line_str in _extract_lines(view, lines):
+        new_line_str, n = compiled_pattern.subn(replacement, line_str, count=replace_count)
+        if n:
+            substitutions += n
+            substituted_lines += 1
+            if new_line_str != line_str:
+                changes.append((Region(pt, pt + len(line_str)), new_line_str))
+
+    if not substitutions:
+        return status_message('E486: Pattern not found: {}'.format(pattern))
 
-            last_row = row_at(view, target_region.b - 1)
-            start = target_region.begin()
+    # The cursor goes to the last line of the range, which is moved by the
+    # changes on the lines before it.
+    last_line_pt = lines[-1].begin()
+    for region, text in changes:
+        if region.begin() < lines[-1].begin():
+            last_line_pt += len(text) - region.size()
 
-            while True:
-                if start >= view.size():
-                    break
+    for region, text in reversed(changes):
+        view.replace(edit, region, text)
 
-                match = view.find(pattern, start)
+    # TODO Refactor set position cursor after operation into reusable api.
+    # Put cursor on first non-whitespace char of current line.
+    set_selection(view, last_line_pt)
+    line = view.line(last_line_pt)
+    if line.size() > 0:
+        set_selection(view, view.find('^\\s*', line.begin()).end())
 
-                # no match or match out of range -- stop
-                if (match == Region(-1)) or (row_at(view, match.a) > last_row):
-                    view.show(view.sel()[0].begin())
-                    return
+    _report_substitutions(substitutions, substituted_lines)
 
-                size_before = view.size()
+    enter_normal_mode(view)
 
-                with adding_regions(view, 's_confirm', [match], 'comment'):
-                    view.show(match.a, True)
-                    response = yes_no_cancel_dialog('Replace with "%s"?' % replacement)
-                    if response == DIALOG_CANCEL:
-                        break
 
-                    if response == DIALOG_YES:
-                        text = view.substr(match)
-                        substituted = re.sub(compiled_pattern, replacement, text, count=replace_count)
-                        view.replace(edit, match, substituted)
+# Yields the start and text of each of the sorted lines, which are sliced from
+# one extract of the text they span.
+def _extract_lines(view, lines: list):
+    start = lines[0].begin()
+    text = view.substr(Region(start, lines[-1].end()))
+    for line in lines:
+        yield line.begin(), text[line.begin() - start:line.end() - start]
+
 
-                start = match.b + (view.size() - size_before) + 1
+# Returns the matches of the substitution in the lines, as a list of the match
+# start, end, replacement and line number, with one pass over their text.
+def _find_substitute_matches(view, lines: list, compiled_pattern, replacement: str, replace_count: int) -> list:
+    matches = []
+    for line_number, (pt, line_str) in enumerate(_extract_lines(view, lines)):
+        for i, match in enumerate(compiled_pattern.finditer(line_str)):
+            if replace_count and i == replace_count:
+                break
 
-        return _replace_confirming(view, edit, pattern, compiled_pattern, replacement, replace_count, target_region)
+            matches.append((pt + match.start(), pt + match.end(), match.expand(replacement), line_number))
 
-    lines = view.lines(target_region)
-    if not lines:
-        return status_message('E486: Pattern not found: {}'.format(pattern))
+    return matches
 
-    new_lines = []
-    dirty = False
-    for line in lines:
-        line_str = view.substr(line)
-        new_line_str = re.sub(compiled_pattern, replacement, line_str, count=replace_count)
-        new_lines.append(new_line_str)
-        if new_line_str != line_str:
-            dirty = True
 
-    new_region_text = '\n'.join(new_lines)
-    if view.size() > line.end():
-        new_region_text += '\n'
+def _report_substitutions(substitutions: int, substituted_lines: int) -> None:
+    # Like Vim with the default 'report' option.
+    if substitutions > 2:
+        status_message('{} substitution{} on {} line{}'.format(
+            substitutions, 's' if substitutions > 1 else '',
+            substituted_lines, 's' if substituted_lines > 1 else ''))
 
-    if not dirty:
-        return status_message('E486: Pattern not found: {}'.format(pattern))
 
-    # Reposition cursor before replacing target region so that the cursor
-    # will auto adjust in sync with the replacement.
-    set_selection(view, line.begin())
+_SUBSTITUTE_CONFIRM_ANSWERS = (
+    ('y', 'substitute this match'),
+    ('n', 'skip this match'),
+    ('a', 'substitute this and all remaining matches'),
+    ('q', 'quit substituting'),
+    ('l', 'substitute this match and then quit'),
+)
 
-    view.replace(edit, target_region, new_region_text)
 
-    # TODO Refactor set position cursor after operation into reusable api.
-    # Put cursor on first non-whitespace char of current line.
-    line = view.line(view.sel()[0].b)
-    if line.size() > 0:
-        set_selection(view, view.find('^\\s*', line.begin()).end())
+# Highlights the current match of a :s///c and asks what to do with it. The
+# quick panel doesn't block, the answer is applied by substitute_confirm().
+def _prompt_substitute_confirm(view) -> None:
+    state = get_session_view_value(view, 'substitute_confirm')
+    start, end, replacement, _ = state['matches'][state['index']]
+    match = Region(start, end)
 
-    enter_normal_mode(view)
+    view.add_regions('s_confirm', [match], 'comment')
+    view.show(match.a, True)
+
+    def on_done(index: int) -> None:
+        answer = _SUBSTITUTE_CONFIRM_ANSWERS[index][0] if index >= 0 else 'q'
+        view.run_command('nv_view', {'action': 'substitute_confirm', 'answer': answer})
+
+    kwargs = {}
+    if int(version()) >= 4081:
+        kwargs['placeholder'] = 'replace with {}'.format(replacement)
+
+    view.window().show_quick_panel(
+        ['{}: {}'.format(key, description) for key, description in _SUBSTITUTE_CONFIRM_ANSWERS],
+        on_done,
+        **kwargs
+    )
+
+
+# The accepted matches are only highlighted until the last answer, and are
+# then all replaced in one edit, so that the substitution is one undo step.
+def substitute_confirm(view, edit, answer: str) -> None:
+    state = get_session_view_value(view, 'substitute_confirm')
+    if not state:
+        return
+
+    # The matches were found before the first prompt, so if the view has been
+    # modified by something else since then they can't be trusted anymore.
+    if state['change_count'] != view.change_count():
+        return _end_substitute_confirm(view, [])
+
+    matches = state['matches']
+    index = state['index']
+
+    if answer in ('y', 'l'):
+        state['accepted'].append(index)
+    elif answer == 'a':
+        state['accepted'].extend(range(index, len(matches)))
+
+    state['index'] = index + 1 if answer in ('y', 'n') else len(matches)
+
+    if state['index'] < len(matches):
+        view.add_regions('s_confirm_accepted', [Region(*matches[i][:2]) for i in state['accepted']], 'string')
+        return _prompt_substitute_confirm(view)
+
+    accepted = [matches[i] for i in state['accepted']]
+
+    # Replaced in reverse order so that the regions of the ones before are not
+    # moved.
+    for start, end, replacement, _ in reversed(accepted):
+        view.replace(edit, Region(start, end), replacement)
+
+    _end_substitute_confirm(view, [line_number for _, _, _, line_number in accepted])
+
+
+def _end_substitute_confirm(view, substituted: list) -> None:
+    set_session_view_value(view, 'substitute_confirm', None)
+    view.erase_regions('s_confirm')
+    view.erase_regions('s_confirm_accepted')
+    view.show(view.sel()[0].begin())
+    _report_substitutions(len(substituted), len(set(substituted)))
 
 
 def ex_sunmap(lhs: str, **kwargs) -> None:
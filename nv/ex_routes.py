@@ -109,6 +109,7 @@ def _ex_route_close(state) -> TokenCommand:
 
 def _ex_route_copy(state) -> TokenCommand:
     command = _create_route(state, 'copy', addressable=True)
+    command.cooperates_with_global = True
 
     state.skip(' ')
     state.ignore()
@@ -298,6 +299,7 @@ def _ex_route_delmarks(state) -> TokenCommand:
 
 def _ex_route_move(state) -> TokenCommand:
     command = _create_route(state, 'move', addressable=True)
+    command.cooperates_with_global = True
 
     state.skip(' ')
     state.ignore()
@@ -463,7 +465,17 @@ def _ex_route_sunmap(state) -> TokenCommand:
 def _ex_route_sort(state) -> TokenCommand:
     command = _create_route(state, 'sort', forcable=True, addressable=True)
 
-    return _resolve(state, command, r'\s*(?P<options>[iu]+)')
+    # The options can be on either side of the pattern e.g. ":sort n /x/ u".
+    m = state.match(r'(?P<options>[ bfilnorux]*)(?:/(?P<pattern>(?:\\.|[^\\/])*)/)?(?P<more_options>[ bfilnorux]*)$')
+    if m:
+        options = (m.group('options') + m.group('more_options')).replace(' ', '')
+        if options:
+            command.params['options'] = options
+
+        if m.group('pattern') is not None:
+            command.params['pattern'] = m.group('pattern')
+
+    return command
 
 
 def _ex_route_spellgood(state) -> TokenCommand:
@@ -481,6 +493,7 @@ def _ex_route_split(state) -> TokenCommand:
 def _ex_route_substitute(state) -> TokenCommand:
     command = TokenCommand('substitute')
     command.addressable = True
+    command.cooperates_with_global = True
 
     delim = state.consume()
 
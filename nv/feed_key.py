@@ -2,7 +2,7 @@ import logging
 import time
 from datetime import datetime
 
-from NeoVintageous.nv.mappings import IncompleteMapping, Mapping, mappings_can_resolve, mappings_can_resolve_text, mappings_resolve, mappings_resolve_text
+from NeoVintageous.nv.mappings import IncompleteMapping, Mapping, mappings_resolve_key
 from NeoVintageous.nv.mappings_handler import evaluate_mapping, evaluate_mapping_text
 from NeoVintageous.nv.settings import append_sequence, append_seq_icon, get_count, get_action_count, get_capture_register, get_mode, get_motion_count, get_partial_sequence, get_partial_text, get_sequence, get_setting, is_interactive, set_action_count, set_capture_register, set_mode, set_motion_count, set_partial_sequence, set_partial_text, set_register
 from NeoVintageous.nv.state import evaluate_state, get_action, get_motion, init_view, is_runnable, must_collect_input, reset_command_data, set_action, set_motion, update_status_line
@@ -22,7 +22,8 @@ _log.setLevel(DEFAULT_LOG_LEVEL)
 if _log.hasHandlers(): # clear existing handlers, including sublime's
     logging.getLogger(__name__).handlers.clear()
     # _log.addHandler(stream_handler)
-_L = True if _log.isEnabledFor(logging.KEY) else False
+_L  = True if _log.isEnabledFor(logging.KEY ) else False
+_LT = True if _log.isEnabledFor(logging.KEYT) else False
 
 
 class FeedKeyHandler():
@@ -34,6 +35,7 @@ class FeedKeyHandler():
         self.do_eval             = do_eval
         self.check_user_mappings = check_user_mappings
         self.mode                = get_mode(self.view)
+        self._bare_seq           = None  # type: str
         if _L:
             seq  = get_sequence        (view)
             seqP = get_partial_sequence(view)
@@ -74,8 +76,9 @@ class FeedKeyHandler():
         return False
 
     def _append_sequence(self) -> None:
-        _log.keyt('‘%s’ icon status ‘%s’ @%s'
-            ,self.key,"",fname())
+        if _LT:
+            _log.keyt('‘%s’ icon status ‘%s’ @%s'
+                ,self.key,"",fname())
         append_sequence         (self.view, self.key)
 
         update_status_line      (self.view)
@@ -133,8 +136,9 @@ class FeedKeyHandler():
             self._dbg_seq, self._dbg_txt = '',''
             # _log.key("  @_h ⌨️%s %s #%s Eval=%s usrMap=%s",self.key,self.mode,self.repeat_count,self.do_eval,self.check_user_mappings) # ⏰%s,TFMT.format(t=datetime.now()))
         # If the user has defined a mapping that starts with a number i.e. count then the count handler has to be skipped otherwise it won't resolve. See https://github.com/NeoVintageous/NeoVintageous/issues/434
-        can_resolve_txt = mappings_can_resolve_text(self.view, self.key)
-        can_resolve_seq = mappings_can_resolve     (self.view, self.key)
+        res = mappings_resolve_key(self.view, self.key, check_user_mappings=self.check_user_mappings) # reads mode/partial state once for both text and sequence mappings
+        can_resolve_txt = res.can_resolve_text
+        can_resolve_seq = res.can_resolve_seq
         if _L:
             self._dbg_txt += f"{'✓' if can_resolve_txt else '✗'}TXT ⌨️{self.key}"
             self._dbg_seq += f"{'✓' if can_resolve_seq else '✗'}SEQ ⌨️{self.key}"
@@ -144,13 +148,14 @@ class FeedKeyHandler():
                     self._dbg_txt += f" ↩ _hCount"
                 return
 
-        self._part_txt = get_partial_text    (self.view) + [self.key]
-        self._part_seq = get_partial_sequence(self.view) +  self.key
+        self._part_txt = res.part_text
+        self._part_seq = res.part_seq
         set_partial_text                (self.view, self._part_txt)
         set_partial_sequence            (self.view, self._part_seq)
 
-        cmdT = mappings_resolve_text(self.view, check_user_mappings=self.check_user_mappings)
-        cmdS = mappings_resolve     (self.view, check_user_mappings=self.check_user_mappings)
+        self.res = res
+        cmdT = res.cmd_text
+        cmdS = res.cmd_seq
         if _L:
             self._dbg_txt += f" ¦{self._part_txt}¦partT"
             self._dbg_seq += f" ¦{self._part_seq}¦partS"
@@ -196,12 +201,13 @@ class FeedKeyHandler():
             self._handle_mapping     (cmd)
             return
         if isinstance(cmd, CommandNotFound): # TODO We shouldn't need to try resolve the command again. The resolver should handle commands correctly the first time. The reason this logic is still needed is because we might be looking at a command like 'dd', which currently doesn't resolve properly. The first 'd' is mapped for NORMAL mode, but 'dd' is not mapped in OPERATOR PENDING mode, so we get a missing command, and here we try to fix that (user mappings are excluded, since they've already been given a chance to evaluate).
+            bare_seq = self._bare_sequence()
             if get_mode(self.view) == OPERATOR_PENDING:
-                cmd = mappings_resolve(self.view, sequence=to_bare_command_name(get_sequence(self.view)),mode=NORMAL, check_user_mappings=False)
-                _log.keyy(" Ⓞ seq‘%s’ barecmd‘%s’ cmd‘%s’",get_sequence(self.view),to_bare_command_name(get_sequence(self.view)), cmd)
+                cmd = self.res.resolve_sequence(bare_seq, mode=NORMAL, check_user_mappings=False)
+                _log.keyy(" Ⓞ barecmd‘%s’ cmd‘%s’", bare_seq, cmd)
             else:
-                cmd = mappings_resolve(self.view, sequence=to_bare_command_name(get_sequence(self.view)))
-                _log.keyy("notⓄ seq‘%s’ barecmd‘%s’ cmd‘%s’",get_sequence(self.view),to_bare_command_name(get_sequence(self.view)), cmd)
+                cmd = self.res.resolve_sequence(bare_seq)
+                _log.keyy("notⓄ barecmd‘%s’ cmd‘%s’", bare_seq, cmd)
             if self._handle_command_not_found(cmd):
                 if _L:
                     self._dbg_seq += f" ↩− cmd=NotFound×2/2"
@@ -212,7 +218,7 @@ class FeedKeyHandler():
         if (isinstance(cmd, ViOperatorDef) and get_mode(self.view) == OPERATOR_PENDING): # TODO This should be unreachable code. The mapping resolver should handle anything that can still reach this point (the first time). We're expecting a motion, but we could still get an action. For example, dd, g~g~ or g~~ remove counts. It looks like it might only be the '>>' command that needs this code.
             if _L:
                 self._dbg_seq += f" ¦{cmd}¦cmd=ⓄOperatorDef"
-            cmd = mappings_resolve(self.view, sequence=to_bare_command_name(get_sequence(self.view)), mode=NORMAL)
+            cmd = self.res.resolve_sequence(self._bare_sequence(), mode=NORMAL)
             if self._handle_command_not_found(cmd):
                 if _L:
                     self._dbg_seq += f" ↩ cmd=NotFound"
@@ -232,6 +238,11 @@ class FeedKeyHandler():
             _log.key(self._dbg_seq)
         self._handle_command(cmd, self.do_eval)
 
+    def _bare_sequence(self) -> str:
+        if self._bare_seq is None:
+            self._bare_seq = to_bare_command_name(get_sequence(self.view))
+        return self._bare_seq
+
     def _handle_text(self) -> bool:
         cmdS = self.cmdS
         cmdT = self.cmdT
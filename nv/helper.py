@@ -108,3 +108,40 @@ def file_hash(file_path, algo='sha256'):
     while chunk := file.read(4096): # read the file in chunks of 4096 bytes
       hash_func.update(chunk)
   return hash_func.hexdigest()
+
+class LRUCache(OrderedDict):
+  """Dict that keeps only the `maxsize` most recently used items, counting `get` hits/misses"""
+  def __init__(self, maxsize:int=128):
+    super().__init__()
+    self.maxsize = maxsize
+    self.hits    = 0
+    self.misses  = 0
+  def get(self, key, default=None):
+    try:
+      value = self[key]
+    except KeyError:
+      self.misses += 1
+      return default
+    self.move_to_end(key)
+    self.hits += 1
+    return value
+  def __setitem__(self, key, value):
+    super().__setitem__(key, value)
+    self.move_to_end(key)
+    if len(self) > self.maxsize:
+      self.popitem(last=False)
+
+_interned = {}  # type: dict
+def intern_command(cls, *args, **kwargs):
+  """Return the shared instance of a command registered with `*args` and `**kwargs`
+  A command is mapped to many sequences in many modes, so one instance is shared by all of them instead of instantiating the class for each (live commands are private copies, see state)
+  Text commands aren't interned since user mappings store per-command properties (desc, icon) on them
+  """
+  try:
+    key = (cls, args, tuple(sorted(kwargs.items())))
+    hash(key)
+  except TypeError: # unhashable arguments
+    return cls(*args, **kwargs)
+  if (cmd := _interned.get(key)) is None:
+    cmd = _interned[key] = cls(*args, **kwargs)
+  return cmd
@@ -18,19 +18,17 @@ def add_module_logger_levels():
   addLoggingLevel('T', DEFAULT_LOG_LEVEL - 20)
 
 stream_handler = logging.StreamHandler()
-formatter = logging.Formatter('NV%(levelname)-1s_%(filename)10s:%(lineno)-3d %(message)s')
-stream_handler.setFormatter(formatter)
-
 def filter_levelname(s:str):
   return filter_levelname_dict.get(s,s)
 
-old_factory = logging.getLogRecordFactory()
-def record_factory(*args, **kwargs):
-  rec           = old_factory(*args, **kwargs)
-  rec.levelname = filter_levelname(rec.levelname)
-  # record.custom_attribute = "my-attr"
-  return rec
-logging.setLogRecordFactory(record_factory)
+class LevelnameFormatter(logging.Formatter):
+  """Replaces level names with their short symbols when a record is formatted, so records that aren't emitted (and other packages' records) don't pay for it like they would with a global record factory"""
+  def format(self, record):
+    record.levelname = filter_levelname(record.levelname)
+    return super().format(record)
+
+formatter = LevelnameFormatter('NV%(levelname)-1s_%(filename)10s:%(lineno)-3d %(message)s')
+stream_handler.setFormatter(formatter)
 
 # https://stackoverflow.com/a/35804945
 def addLoggingLevel(levelName, levelNum, methodName=None):
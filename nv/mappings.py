@@ -2,6 +2,8 @@ import logging
 import re
 import traceback
 
+from time import perf_counter
+from types import MappingProxyType
 from typing import Union
 
 from NeoVintageous.nv.log import DEFAULT_LOG_LEVEL
@@ -24,6 +26,7 @@ _log.setLevel(DEFAULT_LOG_LEVEL)
 if _log.hasHandlers(): # clear existing handlers, including sublime's
     logging.getLogger(__name__).handlers.clear()
     # _log.addHandler(stream_handler)
+_LM = True if _log.isEnabledFor(logging.MAP) else False # guard key path logging so disabled logging doesn't even build its arguments
 
 _mappings = {
     INSERT: {},
@@ -71,161 +74,238 @@ re_flags = 0
 re_flags |= re.MULTILINE | re.IGNORECASE
 key_non_lt = r"^<[^<>]+>"
 re_key_non_lt = re.compile(key_non_lt, flags=re_flags)
-def _has_partial_matches(view, mode: str, lhs: str) -> bool:
-    for map_lhs, map_rhs in _mappings[mode].items():
-        if isinstance(map_rhs, str):
-            if map_lhs.startswith(lhs):
-                if   lhs == '<lt>':
-                    return True
-                elif lhs == '<':
-                    if   map_lhs.startswith('<lt>'):
-                        return True
-                    elif re_key_non_lt.match(map_lhs):
-                        continue
-                    else:
-                        return True
-                else:
-                    return True
-        else:
-            file_type = get_file_type(view)
-            if file_type and file_type in map_rhs:
-                if map_lhs.startswith(lhs):
-                    if lhs == '<':
-                        if map_lhs.startswith('<lt>'):
-                            return True
-                        elif re_key_non_lt.match(map_lhs):
-                            continue
-                        else:
-                            return True
-                    else:
-                        return True
-            elif '' in map_rhs:
-                if map_lhs.startswith(lhs):
-                    if lhs == '<':
-                        if map_lhs.startswith('<lt>'):
-                            return True
-                        elif re_key_non_lt.match(map_lhs):
-                            continue
-                        else:
-                            return True
-                    else:
-                        return True
 
-    return False
+_ANY_FILE_TYPE = '*' # scope of mappings that apply to every file type (plain rhs or the '' file type fallback)
 
-def _has_partial_matches_text(view, mode: str, lhs: str) -> bool:
-    for map_lhs, map_rhs in _mappings_text[mode].items():
-        if isinstance(map_rhs, str ) or\
-           isinstance(map_rhs, list): #bb ['movetoeol']
-            if map_lhs.startswith(lhs):
-                if lhs == '<':
-                    if map_lhs.startswith('<lt>'):
-                        return True
-                    elif re_key_non_lt.match(map_lhs):
-                        continue
-                    else:
-                        return True
-                else:
-                    return True
-        else:
-            file_type = get_file_type(view)
-            if file_type and file_type in map_rhs:
-                if map_lhs.startswith(lhs):
-                    if lhs == '<':
-                        if map_lhs.startswith('<lt>'):
-                            return True
-                        elif re_key_non_lt.match(map_lhs):
-                            continue
-                        else:
-                            return True
-                    else:
-                        return True
-            elif '' in map_rhs:
-                if map_lhs.startswith(lhs):
-                    if lhs == '<':
-                        if map_lhs.startswith('<lt>'):
-                            return True
-                        elif re_key_non_lt.match(map_lhs):
-                            continue
-                        else:
-                            return True
-                    else:
-                        return True
 
-    return False
+def _rhs_scopes(rhs) -> frozenset:
+    if isinstance(rhs, dict): # {'': 'cmd', 'php': 'cmd'}, '' is the fallback for all other file types
+        return frozenset(_ANY_FILE_TYPE if file_type == '' else file_type for file_type in rhs)
+    return frozenset((_ANY_FILE_TYPE,)) # str and list (['movetoeol']) commands
+
+
+def _is_lt_partial(lhs: str) -> bool:
+    # A lone '<' only partially matches '<lt>…' and '<…' that isn't a named key like '<C-w>'
+    return lhs.startswith('<lt>') or (lhs.startswith('<') and not re_key_non_lt.match(lhs))
+
+
+class _KeyTrieNode:
+
+    __slots__ = ('children', 'scopes', 'entry')
+
+    def __init__(self):
+        self.children = {}  # type: dict
+        self.scopes = set()  # type: set # file type scopes of all the entries at and below this node
+        self.entry = None  # type: tuple # (registration order, lhs, scopes) of the entry ending at this node
+
+
+class _KeyTrie:
+    """Character prefix trie over the lhs of a mode's mapping table.
+
+    Every node keeps the union of the file type scopes of the mappings below it,
+    so a partial match is a single walk down the trie instead of a scan of all
+    the mappings with startswith().
+    """
+
+    def __init__(self, entries: dict):
+        self.root = _KeyTrieNode()
+        self.lt_scopes = set()  # type: set # scopes of the entries a lone '<' partially matches
+        for order, (lhs, rhs) in enumerate(entries.items()):
+            self._insert(order, lhs, _rhs_scopes(rhs))
+
+    def _insert(self, order: int, lhs: str, scopes: frozenset) -> None:
+        node = self.root
+        node.scopes |= scopes
+        for c in lhs:
+            child = node.children.get(c)
+            if child is None:
+                child = node.children[c] = _KeyTrieNode()
+            node = child
+            node.scopes |= scopes
+        node.entry = (order, lhs, scopes)
+        if _is_lt_partial(lhs):
+            self.lt_scopes |= scopes
+
+    def _find(self, lhs: str):
+        node = self.root
+        for c in lhs:
+            node = node.children.get(c)
+            if node is None:
+                return None
+        return node
+
+    def has_partial(self, view, lhs: str) -> bool:
+        if lhs == '<':
+            return _scopes_match(view, self.lt_scopes)
+        node = self._find(lhs)
+        return node is not None and _scopes_match(view, node.scopes)
+
+    def partials(self, view, lhs: str) -> list:
+        """Return the lhs of all the entries lhs is a prefix of, in registration order."""
+        node = self._find(lhs)
+        if node is None or not _scopes_match(view, node.scopes):
+            return []
+        file_type = None
+        found = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children.values())
+            if node.entry is None:
+                continue
+            order, map_lhs, scopes = node.entry
+            if lhs == '<' and not _is_lt_partial(map_lhs):
+                continue
+            if _ANY_FILE_TYPE not in scopes:
+                if file_type is None:
+                    file_type = get_file_type(view)
+                if not file_type or file_type not in scopes:
+                    continue
+            found.append((order, map_lhs))
+        found.sort()
+        return [map_lhs for _, map_lhs in found]
+
+
+def _scopes_match(view, scopes) -> bool:
+    if not scopes:
+        return False
+    if _ANY_FILE_TYPE in scopes:
+        return True
+    file_type = get_file_type(view)
+    return bool(file_type) and file_type in scopes
+
+
+_tries = {}  # type: dict # (table id, mode) → (generation, mode table, trie)
+_mappings_generation = 0
+
+
+def _invalidate_mappings() -> None:
+    # Tries and keymaps are rebuilt lazily on the next lookup, so loading hundreds of user mappings builds each one only once
+    global _mappings_generation
+    _mappings_generation += 1
+
+
+def _get_trie(table: dict, mode: str) -> _KeyTrie:
+    entries = table[mode]
+    key = (id(table), mode)
+    cached = _tries.get(key)
+    if cached and cached[0] == _mappings_generation and cached[1] is entries: # mode tables are swapped out by clear_mappings() and by mocks
+        return cached[2]
+    trie = _KeyTrie(entries)
+    _tries[key] = (_mappings_generation, entries, trie)
+    return trie
+
+
+def _has_partial_matches(view, mode: str, lhs: str) -> bool:
+    return _get_trie(_mappings, mode).has_partial(view, lhs)
+
+def _has_partial_matches_text(view, mode: str, lhs: str) -> bool:
+    return _get_trie(_mappings_text, mode).has_partial(view, lhs)
 def _get_partial_matches_help(view, mode: str, lhs: str) -> dict:
-    part_match = dict()
-    for map_lhs, map_rhs in _mappings_text[mode].items():
-        map_rhs_help = _mappings_help[mode].get(map_lhs,None)
-        if isinstance(map_rhs, str ) or\
-           isinstance(map_rhs, list): #bb ['movetoeol']
-            if map_lhs.startswith(lhs):
-                if lhs == '<':
-                    if map_lhs.startswith('<lt>'):
-                        part_match[map_lhs] = map_rhs_help
-                    elif re_key_non_lt.match(map_lhs):
-                        continue
-                    else:
-                        part_match[map_lhs] = map_rhs_help
+    help_mode = _mappings_help[mode]
+    return {map_lhs: help_mode.get(map_lhs, None) for map_lhs in _get_trie(_mappings_text, mode).partials(view, lhs)}
+
+
+class _UserKeymap:
+    """User mappings of one mode with the file type variants already merged.
+
+    fallback holds the mappings for all file types ('' included), typed holds a
+    merged copy per file type that has its own mappings, so a full match is one
+    dict probe and the file type is only looked up for lhs that have variants.
+    """
+
+    __slots__ = ('fallback', 'typed', 'typed_lhs')
+
+    def __init__(self, entries: dict):
+        fallback = {}
+        typed = {}  # type: dict
+        for lhs, rhs in entries.items():
+            if not rhs:
+                continue
+            if not isinstance(rhs, dict): # str, or list for text commands (['movetoeol'])
+                fallback[lhs] = rhs
+                continue
+            for file_type, file_type_rhs in rhs.items():
+                if file_type == '':
+                    fallback[lhs] = file_type_rhs
                 else:
-                    part_match[map_lhs] = map_rhs_help
-        else:
-            file_type = get_file_type(view)
-            if file_type and file_type in map_rhs:
-                if map_lhs.startswith(lhs):
-                    if lhs == '<':
-                        if map_lhs.startswith('<lt>'):
-                            part_match[map_lhs] = map_rhs_help
-                        elif re_key_non_lt.match(map_lhs):
-                            continue
-                        else:
-                            part_match[map_lhs] = map_rhs_help
-                    else:
-                        part_match[map_lhs] = map_rhs_help
-            elif '' in map_rhs:
-                if map_lhs.startswith(lhs):
-                    if lhs == '<':
-                        if map_lhs.startswith('<lt>'):
-                            part_match[map_lhs] = map_rhs_help
-                        elif re_key_non_lt.match(map_lhs):
-                            continue
-                        else:
-                            part_match[map_lhs] = map_rhs_help
-                    else:
-                        part_match[map_lhs] = map_rhs_help
-    return part_match
+                    typed.setdefault(file_type, {})[lhs] = file_type_rhs
+        self.fallback = MappingProxyType(fallback)
+        self.typed = MappingProxyType({ft: MappingProxyType({**fallback, **ft_d}) for ft, ft_d in typed.items()})
+        self.typed_lhs = frozenset(lhs for ft_d in typed.values() for lhs in ft_d)
+
+    def find(self, view, lhs: str):
+        if lhs in self.typed_lhs:
+            return self.typed.get(get_file_type(view), self.fallback).get(lhs)
+        return self.fallback.get(lhs)
+
+
+class _ModeKeymap:
+    """Frozen lookup of everything a key sequence can resolve to in one mode.
+
+    Merges the core (keys.mappings) and plugin command tables into a single
+    {seq: (plugin command, core command)} table and compiles the user sequence
+    and text mappings with _UserKeymap.
+    """
+
+    __slots__ = ('generation', 'entries', 'entries_text', 'commands', 'user', 'user_text')
+
+    def __init__(self, mode: str):
+        self.generation = _mappings_generation
+        self.entries = _mappings[mode]
+        self.entries_text = _mappings_text[mode]
+        commands = {seq: (None, command) for seq, command in keys.mappings.get(mode, {}).items()}
+        for seq, plugin_command in plugin.mappings.get(mode, {}).items():
+            commands[seq] = (plugin_command, commands.get(seq, (None, None))[1])
+        self.commands = MappingProxyType(commands)
+        self.user = _UserKeymap(self.entries)
+        self.user_text = _UserKeymap(self.entries_text)
+
+    def is_current(self, mode: str) -> bool:
+        return (self.generation == _mappings_generation and
+                self.entries is _mappings[mode] and
+                self.entries_text is _mappings_text[mode])
+
+
+_keymaps = {}  # type: dict # mode → _ModeKeymap
+
+
+def _get_keymap(mode: str) -> _ModeKeymap:
+    keymap = _keymaps.get(mode)
+    if keymap is None or not keymap.is_current(mode):
+        keymap = _keymaps[mode] = _ModeKeymap(mode)
+    return keymap
+
+
+def compile_keymaps() -> float:
+    """(Re)build the keymap of every mode, → build time in seconds.
+
+    Called after the user config is (re)loaded. Keymaps are also rebuilt lazily
+    when the mappings change afterwards, e.g. :nnoremap from the command line.
+    """
+    t0 = perf_counter()
+    _keymaps.clear()
+    for mode in _mappings:
+        _get_keymap(mode)
+    elapsed = perf_counter() - t0
+    _log.info('compiled keymaps in %.2fms: %d core/plugin, %d user, %d user text mappings'
+        ,elapsed * 1000
+        ,sum(len(km.commands) for km in _keymaps.values())
+        ,sum(len(km.entries) for km in _keymaps.values())
+        ,sum(len(km.entries_text) for km in _keymaps.values()))
+    return elapsed
 
 
 def _find_full_match(view, mode: str, lhs: str):
-    rhs = _mappings[mode].get(lhs)
-    if rhs:
-        if isinstance(rhs, str):
-            return rhs
-
-        try:
-            return _mappings[mode][lhs][get_file_type(view)]
-        except KeyError:
-            try:
-                return _mappings[mode][lhs]['']
-            except KeyError:
-                pass
+    return _get_keymap(mode).user.find(view, lhs)
 
 def _find_full_match_text(view, mode: str, lhs: str):
-    rhs     = _mappings_text[mode].get(lhs)
+    user_text = _get_keymap(mode).user_text
+    rhs       = user_text.find(view, lhs)
     if not rhs\
        and lhs == '<':
-        lhs     = '<lt>'
-        rhs =          _mappings_text[mode].get(lhs)
-    if rhs:
-        if isinstance(rhs, (str, list)):
-            return    rhs
-        try:
-            return     _mappings_text[mode][lhs][get_file_type(view)]
-        except     KeyError:
-            try:
-                return _mappings_text[mode][lhs]['']
-            except KeyError:
-                pass
+        rhs   = user_text.find(view, '<lt>')
+    return rhs
 
 
 def _normalise_lhs(lhs: str) -> str:
@@ -267,6 +347,7 @@ def mappings_add(mode:Union[str,list], lhs: str, rhs: str) -> None:
     for m in modes:
         modes_enum |= mode_names_rev[m]
     key = _normalise_lhs(lhs)
+    _invalidate_mappings()
     _log.map(" @map+ %s lhs¦key=%s ¦ %s rhs=%s"
         ,    modes_enum,lhs,key,        rhs)
     # tag = None
@@ -380,6 +461,7 @@ def mappings_add(mode:Union[str,list], lhs: str, rhs: str) -> None:
 def mappings_add_text(mode:str, key:str, cmd:Union[str,list], cmd_o:Union[str,list]='', prop:dict={}) -> None:
     #           mode_normal     W        movebybigwords       MoveByBigWords           {file:['txt','rs']}
     key_norm = _normalise_lhs(key)
+    _invalidate_mappings()
     old_cmd_ftype = _mappings_text[mode].get(key_norm)
     old_hlp_ftype = _mappings_help[mode].get(key_norm)
     _log.mapp(" map+txt ¦%s¦ ‹¦%s ≈ %s¦⟶¦%s¦› @file¦%s¦ oldcmd¦%s¦"
@@ -429,11 +511,13 @@ def mappings_add_text(mode:str, key:str, cmd:Union[str,list], cmd_o:Union[str,li
                 cmd_cls.cmdo = cmd_ot # MoveByBigWords
 
 def mappings_remove(mode: str, lhs: str) -> None:
+    _invalidate_mappings()
     del _mappings[mode][_normalise_lhs(lhs)]
     del _mappings_text[mode][_normalise_lhs(lhs)]
 
 
 def clear_mappings() -> None:
+    _invalidate_mappings()
     for mode in _mappings:
         _mappings[mode] = {}
     for mode in _mappings_text:
@@ -483,8 +567,9 @@ def _text_to_command(view, text:str):
     """
     cmd_plugin  = plugin.map_textcmd2cmd.get(text)
     cmd_keys    =   keys.map_textcmd2cmd.get(text)
-    _log.map(" cmd_text ‘%s’ → cmd_plugin ‘%s’ cmd_keys = ‘%s’"
-        ,               text,       cmd_plugin,         cmd_keys)
+    if _LM:
+        _log.map(" cmd_text ‘%s’ → cmd_plugin ‘%s’ cmd_keys = ‘%s’"
+            ,               text,       cmd_plugin,         cmd_keys)
     if cmd_plugin\
         and (not view or (view and is_plugin_enabled(view, cmd_plugin))):
         return cmd_plugin
@@ -500,15 +585,15 @@ def _seq_to_command(view, seq: str, mode: str):
     mode  str : Forces the use of this mode instead of the global state's.
     → ViCommandDefBase | CommandNotFound
     """
-    if mode in plugin.mappings:
-        if (plugin_command := plugin.mappings[mode].get(seq)):
-            if is_plugin_enabled(view, plugin_command):
+    if mode in _mappings and (commands := _get_keymap(mode).commands.get(seq)):
+        plugin_command, command = commands
+        if plugin_command and is_plugin_enabled(view, plugin_command):
+            if _LM:
                 _log.map("  ‘%s’cmd_plug ←‘%s’seq",plugin_command,seq)
-                return plugin_command
-    if mode in keys.mappings:
-        command = keys.mappings[mode].get(seq)
+            return plugin_command
         if command:
-            _log.map("  ‘%s’cmd_keys ←‘%s’seq",command,seq)
+            if _LM:
+                _log.map("  ‘%s’cmd_keys ←‘%s’seq",command,seq)
             return command
     return CommandNotFound()
 
@@ -533,11 +618,12 @@ def mappings_resolve(view, sequence: str = None, mode: str = None, check_user_ma
                     _log.debug("→IncompleteMapping no cmdU/seqIn, but partial match")
                     return IncompleteMapping()
     cmd = cmdU if cmdU else (cmdS:=_seq_to_command(view, to_bare_command_name(seq), mode or get_mode(view)))
-    _log.map(' @mapResS ‹‘%s’=‘%s’› (%s usr%s cmd: ‘%s’in ‘%s’usr ‘%s’S¦‘%s’Spart ‘%s’cmd ‘%s’cmd_cls)'
-        ,cmd.lhs if hasattr(cmd,'lhs') else ''
-        ,cmd.rhs if hasattr(cmd,'rhs') else ''
-        ,mode if mode else 'm0','1' if check_user_mappings else '0'
-        ,seqIn,'✓map' if cmdU else '✗map',cmdS,cmdSpart, cmd, cmd.__class__.__mro__)
+    if _LM:
+        _log.map(' @mapResS ‹‘%s’=‘%s’› (%s usr%s cmd: ‘%s’in ‘%s’usr ‘%s’S¦‘%s’Spart ‘%s’cmd ‘%s’cmd_cls)'
+            ,cmd.lhs if hasattr(cmd,'lhs') else ''
+            ,cmd.rhs if hasattr(cmd,'rhs') else ''
+            ,mode if mode else 'm0','1' if check_user_mappings else '0'
+            ,seqIn,'✓map' if cmdU else '✗map',cmdS,cmdSpart, cmd, cmd.__class__.__mro__)
     return cmd
 
 def mappings_resolve_text(view, text_command:str = None, mode: str = None, check_user_mappings: bool = True):
@@ -551,7 +637,8 @@ def mappings_resolve_text(view, text_command:str = None, mode: str = None, check
     cmdIn = text_command if text_command else ''
     cmdTpart = get_partial_text(view) # We usually need to look at the partial sequence, but some commands do weird things, like ys, which isn't a namespace but behaves as such
     cmdTxt = cmdIn or ''.join(cmdTpart)
-    _log.map("  TXT ¦%s¦in ¦%s¦part",cmdIn,cmdTpart)
+    if _LM:
+        _log.map("  TXT ¦%s¦in ¦%s¦part",cmdIn,cmdTpart)
     if check_user_mappings:
         cmdU = _text_cmd_to_mapping(view, cmdTxt)
         if     not cmdU:
@@ -560,10 +647,94 @@ def mappings_resolve_text(view, text_command:str = None, mode: str = None, check
                     _log.debug("→IncompleteMapping no cmdU/cmdTxt, but partial match for ‘%s’cmdTxt",cmdTxt)
                     return IncompleteMapping()
     cmd = cmdU if cmdU else (cmdT:=_text_to_command(view, cmdTxt))
-    _log.map(' @mapResT %s ‹‘%s’=‘%s’› (%s usr%s cmd: ‘%s’in ‘%s’usr ‘%s’T¦‘%s’Tpart ‘%s’cmd ‘%s’cmd_cls)'
-        ,cmd.__class__.__name__
-        ,cmd.lhs if hasattr(cmd,'lhs') else ''
-        ,cmd.rhs if hasattr(cmd,'rhs') else ''
-        ,mode if mode else 'm0','1' if check_user_mappings else '0'
-        ,cmdIn,'✓map' if cmdU else '✗map',cmdT,cmdTpart, cmd, cmd.__class__.__mro__)
+    if _LM:
+        _log.map(' @mapResT %s ‹‘%s’=‘%s’› (%s usr%s cmd: ‘%s’in ‘%s’usr ‘%s’T¦‘%s’Tpart ‘%s’cmd ‘%s’cmd_cls)'
+            ,cmd.__class__.__name__
+            ,cmd.lhs if hasattr(cmd,'lhs') else ''
+            ,cmd.rhs if hasattr(cmd,'rhs') else ''
+            ,mode if mode else 'm0','1' if check_user_mappings else '0'
+            ,cmdIn,'✓map' if cmdU else '✗map',cmdT,cmdTpart, cmd, cmd.__class__.__mro__)
     return cmd
+
+
+class KeyResolution:
+    """Resolution of a key against the text and the sequence mappings in one pass.
+
+    The mode and the partial text/sequence are read once. The commands are only
+    resolved when first accessed, so a key consumed as a count skips them.
+    """
+
+    def __init__(self, view, key: str, check_user_mappings: bool = True):
+        self.view = view
+        self.check_user_mappings = check_user_mappings
+        self.mode = get_mode(view)
+        self.part_text = get_partial_text(view) + [key]
+        self.part_seq = get_partial_sequence(view) + key
+        self.text = ''.join(self.part_text)
+        self.full_text = _find_full_match_text(view, self.mode, self.text)
+        self.full_seq = _find_full_match(view, self.mode, self.part_seq)
+        self.partial_seq = bool(not self.full_seq and _has_partial_matches(view, self.mode, self.part_seq))
+        self.can_resolve_text = bool(self.full_text)
+        self.can_resolve_seq = bool(self.full_seq) or self.partial_seq
+        self._bare_seq = None  # type: str
+        self._bare_cmd = None
+        self._cmd_text = None
+        self._cmd_seq = None
+
+    @property
+    def bare_seq(self) -> str:
+        if self._bare_seq is None:
+            self._bare_seq = to_bare_command_name(self.part_seq)
+        return self._bare_seq
+
+    def _bare_command(self):
+        if self._bare_cmd is None:
+            self._bare_cmd = _seq_to_command(self.view, self.bare_seq, self.mode)
+        return self._bare_cmd
+
+    @property
+    def cmd_text(self):
+        """→ Mapping | IncompleteMapping | ViCommandDefBase | CommandNotFound (same as mappings_resolve_text)"""
+        if self._cmd_text is None:
+            if self.check_user_mappings and self.full_text:
+                self._cmd_text = Mapping(self.text, self.full_text)
+            elif self.check_user_mappings and _has_partial_matches_text(self.view, self.mode, self.text):
+                self._cmd_text = IncompleteMapping()
+            else:
+                self._cmd_text = _text_to_command(self.view, self.text)
+            if _LM:
+                _log.map(' @mapResT ‘%s’→‘%s’ m=%s usr%s', self.text, self._cmd_text, self.mode, int(self.check_user_mappings))
+        return self._cmd_text
+
+    @property
+    def cmd_seq(self):
+        """→ Mapping | IncompleteMapping | ViCommandDefBase | CommandNotFound (same as mappings_resolve)"""
+        if self._cmd_seq is None:
+            if self.check_user_mappings and self.full_seq:
+                self._cmd_seq = Mapping(self.part_seq, self.full_seq)
+            elif self.check_user_mappings and self.partial_seq:
+                self._cmd_seq = IncompleteMapping()
+            else:
+                self._cmd_seq = self._bare_command()
+            if _LM:
+                _log.map(' @mapResS ‘%s’→‘%s’ m=%s usr%s', self.part_seq, self._cmd_seq, self.mode, int(self.check_user_mappings))
+        return self._cmd_seq
+
+    def resolve_sequence(self, sequence: str, mode: str = None, check_user_mappings: bool = True):
+        """Resolve an explicit bare sequence, like mappings_resolve(view, sequence, mode, check_user_mappings).
+
+        The lookups of this pass are reused when the sequence and the mode are
+        the ones already resolved, which is the common CommandNotFound retry.
+        """
+        if sequence == self.part_seq and (mode or self.mode) == self.mode:
+            if check_user_mappings and self.full_seq:
+                return Mapping(sequence, self.full_seq)
+            return self._bare_command()
+        return mappings_resolve(self.view, sequence=sequence, mode=mode, check_user_mappings=check_user_mappings)
+
+
+def mappings_resolve_key(view, key: str, check_user_mappings: bool = True) -> KeyResolution:
+    """Resolve key appended to the partial text and sequence against all mappings.
+    → KeyResolution  with can_resolve_text/can_resolve_seq and the lazily resolved cmd_text/cmd_seq
+    """
+    return KeyResolution(view, key, check_user_mappings)
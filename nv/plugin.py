@@ -1,3 +1,4 @@
+from NeoVintageous.nv.helper import intern_command
 from NeoVintageous.nv.modes import INSERT as _INSERT
 from NeoVintageous.nv.modes import NORMAL as _NORMAL
 from NeoVintageous.nv.modes import OPERATOR_PENDING as _OPERATOR_PENDING
@@ -41,11 +42,12 @@ def register(seq: list, modes: tuple, *args, **kwargs):
     @keys: A list of (`mode:tuple`, `sequence:list`) pairs to map the decorated class to
     """
     def inner(cls):
+        cmd = intern_command(cls, *args, **kwargs)
         for mode in modes:
             for seq_lng in seq:
-                mappings[mode][seq_lng] = cls(*args, **kwargs)
-                if (T := type(cls(*args, **kwargs))) not in mappings_reverse[mode]: # store only the first letter map
-                    mappings_reverse[mode][T] = seq_lng
+                mappings[mode][seq_lng] = cmd
+                if cls not in mappings_reverse[mode]: # store only the first letter map
+                    mappings_reverse[mode][cls] = seq_lng
                 classes[cls.__name__] = cls
         return cls
     return inner
@@ -64,7 +66,7 @@ def register_text(commands: list, modes: tuple, *args, icon:str='', **kwargs):
             if (C := cmd.lower())               not in map_textcmd2cmd:
                 map_textcmd2cmd[C] = cls(*args,**kwargs)
             classes[cls.__name__] = cls
-        if     (T := type(cls(*args,**kwargs))) not in map_cmd2textcmd:
-            map_cmd2textcmd    [T] = commands
+        if      cls                             not in map_cmd2textcmd:
+            map_cmd2textcmd  [cls] = commands
         return cls
     return inner
@@ -49,9 +49,10 @@ class StFocusSideBar(ViOperatorDef):
 @register_text(['StFocusGroup7'], ACTION_MODES, group=7)
 @register_text(['StFocusGroup8'], ACTION_MODES, group=8)
 class StFocusGroup(ViOperatorDef):
+    _serializable = ViOperatorDef._serializable | {'_group'}
+
     def __init__(self, *args, group=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self._serializable.append('_group')
         self._group = group
         self.updates_xpos = True
         self.scroll_into_view = True
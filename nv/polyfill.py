@@ -4,6 +4,8 @@ import re
 import stat
 import sys
 
+from sublime import IGNORECASE
+from sublime import LITERAL
 from sublime import Region
 from sublime import active_window as _active_window
 from sublime import load_settings
@@ -174,13 +176,44 @@ def view_find(view, pattern: str, start_pt: int, flags: int = 0):
 
 # There's no Sublime API to find patterns in reverse direction.
 # @see https://github.com/SublimeTextIssues/Core/issues/245
+#
+# Yields the matches ending at or before start_pt, nearest first. The buffer is
+# scanned backwards in line aligned windows that double in size, so the cost is
+# proportional to the distance to the matches that are consumed rather than to
+# the size of the buffer. A window's scan stops at the matches already yielded,
+# which also finds the matches spanning a window boundary.
+#
+# A window without matches makes find() run on to the next match after it.
+# When that overshoots by more than the window, the rest of the buffer is
+# scanned in one pass instead, so buffers without nearby matches cost about
+# the same as a find_all().
+_RFIND_WINDOW_SIZE = 4096
+
+
 def view_rfind_all(view, pattern: str, start_pt: int, flags: int = 0):
-    matches = view.find_all(pattern, flags)
-    for region in matches:
-        if region.b > start_pt:
-            return reversed(matches[:matches.index(region)])
+    done = start_pt + 1  # matches starting at or after done have been yielded
+    size = _RFIND_WINDOW_SIZE
+    while done > 0:
+        lo = view.line(max(0, done - size)).a
+        matches = []
+        pos = lo
+        match = None
+        while pos <= start_pt:
+            match = view_find(view, pattern, pos, flags)
+            if match is None or match.a >= done or match.b > start_pt:
+                break
+
+            matches.append(match)
+            pos = match.b + 1 if match.empty() else match.b
+
+        yield from reversed(matches)
+
+        if not matches and (match is None or match.a - done > size):
+            size = lo  # scan the rest in one pass
+        else:
+            size *= 2
 
-    return reversed(matches)
+        done = lo
 
 
 # There's no Sublime API to find a pattern in reverse direction.
@@ -211,9 +244,18 @@ def view_rfind(view, pattern: str, start_pt: int, flags: int = 0):
 # @see https://github.com/sublimehq/sublime_text/issues/2797
 # @see https://github.com/SublimeTextIssues/Core/issues/534
 def view_find_in_range(view, pattern: str, pos: int, endpos: int, flags: int = 0):
-    match = view_find(view, pattern, pos, flags)
-    if match is not None and match.b <= endpos:
-        return match
+    regex = _get_range_regex(pattern, flags, pos, endpos)
+    if regex is None:
+        match = view_find(view, pattern, pos, flags)
+        if match is not None and match.b <= endpos:
+            return match
+
+        return None
+
+    base, text = _get_range_text(view, pos, endpos)
+    match = regex.search(text, pos - base)
+    if match and base + match.end() <= endpos:
+        return Region(base + match.start(), base + match.end())
 
 
 # There's no Sublime API to find all matching pattern within a range.
@@ -225,21 +267,95 @@ def view_find_in_range(view, pattern: str, pos: int, endpos: int, flags: int = 0
 # @todo Refactor to generator
 def view_find_all_in_range(view, pattern: str, pos: int, endpos: int, flags: int = 0) -> list:
     matches = []
+    regex = _get_range_regex(pattern, flags, pos, endpos)
+    if regex is None:
+        while pos <= endpos:
+            match = view.find(pattern, pos, flags)
+            if match is None or match.b == -1:
+                break
+
+            pos = match.b
+            if match.size() == 0:
+                pos += 1
+
+            if match.b <= endpos:
+                matches.append(match)
+
+        return matches
+
+    base, text = _get_range_text(view, pos, endpos)
     while pos <= endpos:
-        match = view.find(pattern, pos, flags)
-        if match is None or match.b == -1:
+        match = regex.search(text, pos - base)
+        if not match:
             break
 
-        pos = match.b
-        if match.size() == 0:
-            pos += 1
+        a, b = base + match.start(), base + match.end()
+        if b > endpos:
+            break
 
-        if match.b <= endpos:
-            matches.append(match)
+        matches.append(Region(a, b))
+        pos = b + 1 if a == b else b
 
     return matches
 
 
+# view.find() has no end position so it searches past the end of a range when
+# there's no match in it. Small ranges are searched by extracting their text
+# once and running a compiled Python regex over it instead. The text extends
+# one character either side of the range, which is all the context that ^, $
+# and \b look at, so that they match like they do in the view. It doesn't
+# extend to whole lines, which can be megabytes long in minified files.
+#
+# Only literal patterns, and patterns made entirely of syntax that Python and
+# Sublime's regex engine read the same way, are run as Python regexes. Anything
+# else is left to view.find() e.g. the word anchors \< and \>, which Python
+# reads as literal < and >, POSIX classes, inline flags, and lookarounds that
+# can look outside of the extracted text.
+_RANGE_TEXT_MAX = 65536
+_RANGE_PORTABLE = re.compile(r'''(?:
+    [^\\\[(]
+  | \\[dDwWsSbBntrfv1-9]
+  | \\[^A-Za-z0-9<>`']
+  | \((?!\?)
+  | \(\?:
+  | \[\^?\]?(?:[^\]\\\[]|\\[dDwWsSntrfv]|\\[^A-Za-z0-9]|\[(?![:.=]))*\]
+)*\Z''', re.VERBOSE)
+_range_regexes = {}  # type: dict
+
+
+def _get_range_regex(pattern: str, flags: int, pos: int, endpos: int):
+    if endpos - pos > _RANGE_TEXT_MAX:
+        return None
+
+    key = (pattern, flags)
+    try:
+        return _range_regexes[key]
+    except KeyError:
+        pass
+
+    regex = None
+    if flags & LITERAL:
+        regex = re.compile(re.escape(pattern), re.IGNORECASE if flags & IGNORECASE else 0)
+    elif pattern and _RANGE_PORTABLE.match(pattern):
+        try:
+            regex = re.compile(pattern, re.MULTILINE | (re.IGNORECASE if flags & IGNORECASE else 0))
+        except re.error:
+            pass
+
+    if len(_range_regexes) >= 256:
+        _range_regexes.clear()
+
+    _range_regexes[key] = regex
+
+    return regex
+
+
+def _get_range_text(view, pos: int, endpos: int) -> tuple:
+    base = max(0, pos - 1)
+
+    return base, view.substr(Region(base, min(endpos + 1, view.size())))
+
+
 # Polyfill to work around bug in internal APIs.
 # @see https://github.com/SublimeTextIssues/Core/issues/2879
 def view_indentation_level(view, pt: int):
@@ -1,7 +1,7 @@
 import logging
 
-from NeoVintageous.nv.settings import get_mode, get_sequence, get_partial_sequence, set_interactive, set_mode, set_repeat_data, get_register, get_capture_register, get_count, get_action_count,  get_motion_count
-from NeoVintageous.nv.state    import evaluate_state, get_action, get_motion, is_runnable, must_collect_input, reset_command_data
+from NeoVintageous.nv.settings import get_mode, get_sequence, get_partial_sequence, is_status_line_deferred, set_interactive, set_status_line_deferred, set_mode, set_repeat_data, get_register, get_capture_register, get_count, get_action_count,  get_motion_count
+from NeoVintageous.nv.state    import evaluate_state, get_action, get_motion, is_runnable, must_collect_input, reset_command_data, update_status_line
 from NeoVintageous.nv.ui       import ui_bell
 from NeoVintageous.nv.utils    import gluing_undo_groups, translate_char
 from NeoVintageous.nv.vi.keys  import tokenize_keys, map_cmd2textcmd
@@ -38,6 +38,17 @@ class ProcessNotationHandler():
         self.cont                = cont # force continuation for sequences that come after text commands, not after sequences, so they aren't processed in one batch, thus state set within HProcNotation isn't checked before processing the first key
 
     def handle(self) -> None:
+        # Write the status line once when the whole notation is processed instead of on every key
+        deferred = is_status_line_deferred(self.view)
+        set_status_line_deferred(self.view, True)
+        try:
+            self._handle()
+        finally:
+            set_status_line_deferred(self.view, deferred)
+            if not deferred:
+                update_status_line(self.view)
+
+    def _handle(self) -> None:
         keys = self.keys
         repeat_count = self.repeat_count
         check_user_mappings = self.check_user_mappings
@@ -95,6 +95,10 @@ def _load() -> None:
         pass
         # t1=ttime() ;print("⏲✓load_kdl_cache ∑{:.2f}s".format((t1-t0)/ns))
 
+    # Imports are inline to avoid circular dependency errors.
+    from NeoVintageous.nv.mappings import compile_keymaps
+    compile_keymaps() # merge core, plugin and user mappings into per mode lookups, rebuilt on every (re)load
+
 
 from NeoVintageous.plugin import PACKAGE_NAME
 from NeoVintageous.nv.modes import INSERT, INTERNAL_NORMAL, NORMAL, OPERATOR_PENDING, REPLACE, SELECT, UNKNOWN, VISUAL, VISUAL_BLOCK, VISUAL_LINE
@@ -298,6 +302,8 @@ class cfgU(metaclass=Singleton):
 
         _import_plugins_with_user_data_kdl()
         cfgU.save_cache()
+        from NeoVintageous.nv.settings import clear_settings_cache
+        clear_settings_cache() # general config could've changed
 
     @staticmethod
     def unload_kdl():
@@ -312,6 +318,8 @@ class cfgU(metaclass=Singleton):
             _log.debug('@cfgU.unload_kdl: erased current cfgU.text_commands')
         nvcfg.CFG = copy.deepcopy(nvcfg.DEF) # reset to defaults on reload
         _import_plugins_with_user_data_kdl() # reset plugin defaults
+        from NeoVintageous.nv.settings import clear_settings_cache
+        clear_settings_cache()
 
 def _import_plugins_with_user_data_kdl():
     from NeoVintageous.nv.vi import text_objects
@@ -1,23 +1,51 @@
 import re
+from bisect import bisect_left, bisect_right
 
 from sublime import IGNORECASE
 from sublime import LITERAL
 
+from NeoVintageous.nv.helper import LRUCache
 from NeoVintageous.nv.options import get_option
-from NeoVintageous.nv.settings import get_setting_neo
+from NeoVintageous.nv.polyfill import view_find_all_in_range
+from NeoVintageous.nv.session import get_session_view_value, set_session_view_value
+from NeoVintageous.nv.settings import get_setting, get_setting_neo
 from NeoVintageous.nv.ui import ui_region_flags
+from NeoVintageous.nv.vi.search import find_in_range, reverse_search
 
 
 def clear_search_highlighting(view) -> None:
     view.erase_regions('_nv_search_occ')
     view.erase_regions('_nv_search_cur')
     view.erase_regions('_nv_search_inc')
+    set_session_view_value(view, 'search_highlight', None)
 
 
 def get_search_occurrences(view) -> list:
+    # With the search_viewport_only setting only the occurrences around the
+    # visible region are drawn, the full list is kept until the buffer changes.
+    highlight = get_session_view_value(view, 'search_highlight')
+    if highlight and highlight[0] == view.change_count():
+        return highlight[1]
+
     return view.get_regions('_nv_search_occ')
 
 
+# A read-only sequence view of the begin points of sorted regions, so they can
+# be probed with bisect without copying them into a list first.
+class _RegionBegins:
+
+    __slots__ = ('regions',)
+
+    def __init__(self, regions: list):
+        self.regions = regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def __getitem__(self, i: int) -> int:
+        return self.regions[i].begin()
+
+
 def add_search_highlighting(view, occurrences: list, incremental: list = None) -> None:
     # Incremental search match string highlighting: while typing a search
     # command, where the pattern, as it was typed so far, matches.
@@ -32,24 +60,22 @@ def add_search_highlighting(view, occurrences: list, incremental: list = None) -
     # Occurrences and current search match string highlighting: when there are
     # search matches, highlight all the matches and the current active one too.
     if occurrences and get_option(view, 'hlsearch'):
-        view.add_regions(
-            '_nv_search_occ',
-            occurrences,
-            scope='string neovintageous_search_occ',
-            flags=ui_region_flags(get_setting_neo(view, 'search_occ_style'))
-        )
-
-        sels = []
+        if get_setting(view, 'search_viewport_only'):
+            _add_visible_occurrences(view, occurrences)
+        else:
+            _add_occurrences(view, occurrences)
+
+        # The occurrences are sorted and don't overlap, so the only one that
+        # can contain a selection is the last one that begins at or before it.
+        begins = _RegionBegins(occurrences)
+        current = []
         for sel in view.sel():
             if sel.empty():
                 sel.b += 1
-            sels.append(sel)
 
-        current = []
-        for region in occurrences:
-            for sel in sels:
-                if region.contains(sel):
-                    current.append(region)
+            i = bisect_right(begins, sel.begin())
+            if i and occurrences[i - 1].contains(sel):
+                current.append(occurrences[i - 1])
 
         if current:
             view.add_regions(
@@ -60,18 +86,127 @@ def add_search_highlighting(view, occurrences: list, incremental: list = None) -
             )
 
 
+def _add_occurrences(view, occurrences: list) -> None:
+    view.add_regions(
+        '_nv_search_occ',
+        occurrences,
+        scope='string neovintageous_search_occ',
+        flags=ui_region_flags(get_setting_neo(view, 'search_occ_style'))
+    )
+
+
+# The visible region plus a screen above and below it, so that scrolling by a
+# page or less doesn't need to redraw the occurrences.
+def _get_viewport_window(view) -> tuple:
+    visible = view.visible_region()
+    margin = visible.size()
+
+    return max(0, visible.begin() - margin), min(view.size(), visible.end() + margin)
+
+
+def _add_visible_occurrences(view, occurrences: list) -> None:
+    lo, hi = _get_viewport_window(view)
+    set_session_view_value(view, 'search_highlight', (view.change_count(), occurrences, lo, hi))
+    begins = _RegionBegins(occurrences)
+    _add_occurrences(view, occurrences[bisect_left(begins, lo):bisect_right(begins, hi)])
+
+
+# Redraws the occurrences when the view has scrolled out of the window that
+# was drawn. It's a no-op unless the search_viewport_only setting is enabled.
+def update_search_highlighting(view) -> None:
+    highlight = get_session_view_value(view, 'search_highlight')
+    if not highlight:
+        return
+
+    change_count, occurrences, lo, hi = highlight
+    if change_count != view.change_count():
+        # The drawn regions are kept up to date by Sublime Text, but the
+        # stored ones are not, so it's no longer safe to draw more of them.
+        set_session_view_value(view, 'search_highlight', None)
+        return
+
+    visible = view.visible_region()
+    if visible.begin() < lo or visible.end() > hi:
+        _add_visible_occurrences(view, occurrences)
+
+
+def find_visible_search_occurrences(view, pattern: str, flags: int) -> list:
+    lo, hi = _get_viewport_window(view)
+
+    return view_find_all_in_range(view, pattern, lo, hi, flags)
+
+
 def is_smartcase_pattern(view, pattern: str) -> bool:
     return get_option(view, 'smartcase') and any(p.isupper() for p in pattern)
 
 
-def process_search_pattern(view, pattern: str) -> tuple:
-    flags = 0
+# Translated search patterns keyed by the pattern and the options that affect
+# the translation. Searches are often repeated e.g. n, N, :s with &, :g. The
+# Python regex of a pattern is compiled into the same entry, when a command
+# that runs the pattern in Python needs it.
+_search_patterns = LRUCache(256)
 
-    if get_option(view, 'ignorecase') and not is_smartcase_pattern(view, pattern):
-        flags |= IGNORECASE
 
+def _get_search_pattern(pattern: str, ignorecase: bool, smartcase: bool, is_magic: bool) -> list:
+    key = (pattern, ignorecase, smartcase, is_magic)
+    entry = _search_patterns.get(key)
+    if entry is None:
+        entry = _search_patterns[key] = list(_process_search_pattern(pattern, ignorecase, smartcase, is_magic)) + [None]
+
+    return entry
+
+
+def process_search_pattern(view, pattern: str) -> tuple:
     # Changes the special characters that can be used in search patterns.
     is_magic = get_option(view, 'magic')
+    ignorecase = get_option(view, 'ignorecase')
+    smartcase = get_option(view, 'smartcase')
+
+    pattern, flags, _ = _get_search_pattern(pattern, ignorecase, smartcase, is_magic)
+
+    return pattern, flags
+
+
+def compile_search_pattern(view, pattern: str, ignorecase: bool = None):
+    """Return the search pattern translated like a search, as a Python regex.
+
+    The ignorecase option is used unless ignorecase is given, and smartcase
+    applies either way. Raises re.error if the pattern isn't valid.
+    """
+    if ignorecase is None:
+        ignorecase = get_option(view, 'ignorecase')
+
+    entry = _get_search_pattern(pattern, ignorecase, get_option(view, 'smartcase'), get_option(view, 'magic'))
+    if entry[2] is None:
+        pattern, flags, _ = entry
+        if flags & LITERAL:
+            pattern = re.escape(pattern)
+        else:
+            pattern = _SUBLIME_ESCAPES.sub(_to_python_escape, pattern)
+
+        entry[2] = re.compile(pattern, re.MULTILINE | (re.IGNORECASE if flags & IGNORECASE else 0))
+
+    return entry[2]
+
+
+# The word anchors \< and \> of Sublime's regex engine, which Python reads as
+# literal < and >. Other escapes are left as they are.
+_SUBLIME_ESCAPES = re.compile('\\\\(.)', re.DOTALL)
+_PYTHON_ESCAPES = {
+    '<': '\\b(?=\\w)',
+    '>': '\\b(?<=\\w)',
+}
+
+
+def _to_python_escape(match) -> str:
+    return _PYTHON_ESCAPES.get(match.group(1), match.group(0))
+
+
+def _process_search_pattern(pattern: str, ignorecase: bool, smartcase: bool, is_magic: bool) -> tuple:
+    flags = 0
+
+    if ignorecase and not (smartcase and any(p.isupper() for p in pattern)):
+        flags |= IGNORECASE
 
     # Pattern modes can be specified anywhere within the pattern itself and the
     # effect of the mode applies to the entire pattern:
@@ -158,9 +293,83 @@ def process_str_search_pattern(view, pattern: str) -> tuple:
     return pattern, flags
 
 
+class SearchIndex:
+    """Sorted matches of a search pattern in a view, valid until the buffer changes.
+
+    The matches are found once, so repeated searches for the same pattern
+    (n, N, *, #, hlsearch) are bisect lookups instead of buffer scans.
+    """
+
+    def __init__(self, view, pattern: str, flags: int):
+        self.pattern = pattern
+        self.flags = flags
+        self.change_count = view.change_count()
+        self.regions = view.find_all(pattern, flags)
+        self._starts = None  # type: list
+        self._ends = None  # type: list
+
+    def is_valid(self, view, pattern: str, flags: int) -> bool:
+        return self.pattern == pattern and self.flags == flags and self.change_count == view.change_count()
+
+    @property
+    def starts(self) -> list:
+        if self._starts is None:
+            self._starts = [region.a for region in self.regions]
+        return self._starts
+
+    @property
+    def ends(self) -> list:
+        if self._ends is None:
+            self._ends = [region.b for region in self.regions]
+        return self._ends
+
+    def _straddles(self, pt: int) -> bool:
+        # A search starting inside a match can find a match overlapping it,
+        # which isn't indexed because matches are found without overlaps.
+        i = bisect_left(self.starts, pt)
+        return i > 0 and self.ends[i - 1] > pt
+
+    def find(self, view, start: int, end: int):
+        """Return the first match at or after start, if it ends before end (same as find_in_range())."""
+        if self._straddles(start):
+            return find_in_range(view, self.pattern, start, end, self.flags)
+
+        i = bisect_left(self.starts, start)
+        if i < len(self.regions):
+            match = self.regions[i]
+            if match and match.b <= end:
+                return match
+
+    def rfind(self, view, start: int, end: int):
+        """Return the last match ending before end, starting on start's line or after (same as reverse_search())."""
+        if start < 0 or end > view.size():
+            return None
+
+        lo = view.full_line(start).a
+        if self._straddles(lo):
+            return reverse_search(view, self.pattern, start, end, self.flags)
+
+        i = bisect_right(self.ends, end) - 1
+        if i >= 0 and self.starts[i] >= lo:
+            match = self.regions[i]
+            if match:
+                return match
+
+            return reverse_search(view, self.pattern, start, end, self.flags)
+
+
+def get_search_index(view, pattern: str, flags: int) -> SearchIndex:
+    index = get_session_view_value(view, 'search_index')
+    if index is None or not index.is_valid(view, pattern, flags):
+        index = SearchIndex(view, pattern, flags)
+        set_session_view_value(view, 'search_index', index)
+
+    return index
+
+
 def find_search_occurrences(view, pattern: str, flags: int) -> list:
-    return view.find_all(pattern, flags)
+    return get_search_index(view, pattern, flags).regions
 
 
 def find_word_search_occurrences(view, pattern: str, flags: int) -> list:
-    return view.find_all(pattern, flags)
+    return get_search_index(view, pattern, flags).regions
@@ -2,6 +2,7 @@ import os
 import logging
 
 from sublime import active_window
+from sublime import load_settings
 
 from NeoVintageous.nv.polyfill    import toggle_preference
 from NeoVintageous.nv.session     import get_session_value, get_session_view_value, set_session_value, set_session_view_value
@@ -31,16 +32,57 @@ def get_config(path:str, default=None):
         return None
     return cfgU.flat.get(clean_path(path), default)
 
+# Settings are read on every key press (and in on_query_context for every key binding ST evaluates), so the values are cached per view: {view_id: {name: value}}
+# A view's cache is cleared by its settings on_change listener (which also covers syntax/project settings), by changes to the Preferences and by config (re)loads
+# Returned values are shared, treat them as read-only
+_settings_cache = {}  # type: dict
+settings_cache_stats = {'hits': 0, 'misses': 0}
+_SETTINGS_CACHE_TAG = 'NeoVintageous.settings_cache'
+_UNSET = object()
+_listening_to_preferences = False
+
+def _read_setting(view, name: str):
+    settings = view.settings()
+    if         settings.has  ('vintageous_%s' % name):
+        return settings.get  ('vintageous_%s' % name)
+    return   nvcfg.CFG['general'].get(name, _UNSET)
+
+def _get_view_settings_cache(view) -> dict:
+    global _listening_to_preferences
+    try:
+        return _settings_cache[view.id()]
+    except KeyError:
+        values = _settings_cache[view.id()] = {}
+        view.settings().add_on_change(_SETTINGS_CACHE_TAG, values.clear)
+        if not _listening_to_preferences:
+            load_settings('Preferences.sublime-settings').add_on_change(_SETTINGS_CACHE_TAG, clear_settings_cache)
+            _listening_to_preferences = True
+        return values
+
+def clear_settings_cache() -> None:
+    for values in _settings_cache.values():
+        values.clear()
+
+def settings_on_close(view) -> None:
+    try:
+        del _settings_cache[view.id()]
+    except KeyError:
+        pass
+
 def get_setting  (view, name: str, default=None):
-    if         view.settings().has  ('vintageous_%s' % name):
-        return view.settings().get  ('vintageous_%s' % name)
-    elif name in nvcfg.CFG['general']:
-        return   nvcfg.CFG['general'].get  (           name, default)
-    else:
-        return default
+    values = _get_view_settings_cache(view)
+    try:
+        value = values[name]
+        settings_cache_stats['hits'  ] += 1
+    except KeyError:
+        value = values[name] = _read_setting(view, name)
+        settings_cache_stats['misses'] += 1
+    return default if value is _UNSET else value
 def set_setting  (view, name: str, value) -> None:
+    _get_view_settings_cache(view).pop(name, None)
     view           .settings().set  ('vintageous_%s' % name, value  )
 def reset_setting(view, name: str       ) -> None:
+    _get_view_settings_cache(view).pop(name, None)
     view           .settings().erase('vintageous_%s' % name         )
 
 
@@ -276,6 +318,13 @@ def set_interactive(view, value: bool) -> None:
     set_session_view_value(view, 'interactive', value)
 
 
+# Status line updates are deferred while notation is replayed (macros, '.', user mappings) and written once at the end, see ProcessNotationHandler
+def is_status_line_deferred(view) -> bool:
+    return get_session_view_value(view, 'status_line_deferred', False)
+def set_status_line_deferred(view, value: bool) -> None:
+    set_session_view_value(view, 'status_line_deferred', value)
+
+
 # Sometimes we need to store a partial sequence to obtain the commands' full
 # name. Such is the case of `gD`, for example.
 def get_partial_sequence(view) -> str:
@@ -435,5 +484,14 @@ def toggle_super_keys() -> None:
     toggle_preference('vintageous_use_super_keys')
 
 
+_plugin_setting_names = {}  # type: dict
+
+
 def is_plugin_enabled(view, plugin: object) -> bool:
-    return get_setting(view, 'enable_%s' % plugin.__class__.__module__[24:])
+    module = plugin.__class__.__module__
+    try:
+        name = _plugin_setting_names[module]
+    except KeyError:
+        name = _plugin_setting_names[module] = 'enable_%s' % module[24:]
+
+    return get_setting(view, name)
@@ -5,14 +5,12 @@ import sublime  # noqa: E402
 from sublime import active_window, PopupFlags
 
 from NeoVintageous.nv import macros
-from NeoVintageous.nv import plugin
 from NeoVintageous.nv.macros import add_macro_step
 from NeoVintageous.nv.polyfill import run_window_command
 from NeoVintageous.nv.session import get_session_view_value, set_session_view_value
-from NeoVintageous.nv.settings import get_glue_until_normal_mode, get_mode, get_reset_during_init, get_sequence, get_seq_icon, get_setting, is_interactive, is_processing_notation, set_action_count, set_capture_register, set_mode, set_motion_count, set_partial_sequence, set_text, set_partial_text, set_register, set_repeat_data, set_reset_during_init, set_sequence, set_seq_icon
+from NeoVintageous.nv.settings import get_glue_until_normal_mode, get_mode, get_reset_during_init, get_sequence, get_seq_icon, get_setting, is_interactive, is_status_line_deferred, is_processing_notation, set_action_count, set_capture_register, set_mode, set_motion_count, set_partial_sequence, set_text, set_partial_text, set_register, set_repeat_data, set_reset_during_init, set_sequence, set_seq_icon
 from NeoVintageous.nv.utils import get_visual_block_sel_b
 from NeoVintageous.nv.utils import get_visual_repeat_data, is_view, save_previous_selection, update_xpos
-from NeoVintageous.nv.vi import cmd_defs
 from NeoVintageous.nv.vi.cmd_base import ViMotionDef, ViOperatorDef
 from NeoVintageous.nv.vi.cmd_defs import ViToggleMacroRecorder
 from NeoVintageous.nv.modes import INSERT, INTERNAL_NORMAL, NORMAL, OPERATOR_PENDING, REPLACE, SELECT, UNKNOWN, VISUAL, VISUAL_BLOCK, VISUAL_LINE
@@ -28,6 +26,7 @@ from NeoVintageous.nv.log import DEFAULT_LOG_LEVEL
 _log = logging.getLogger(__name__)
 _log.setLevel(DEFAULT_LOG_LEVEL)
 _L = True if _log.isEnabledFor(logging.KEY) else False
+_LD = True if _log.isEnabledFor(logging.DEBUG) else False
 
 DEF = dict(
      enable   	= True
@@ -85,30 +84,39 @@ re_flags |= re.MULTILINE | re.IGNORECASE
 re_cmd_count_p = r"<k([0-9])>"
 re_cmd_count   = re.compile(re_cmd_count_p, flags=re_flags)
 def update_status_line(view) -> None:
+    if is_status_line_deferred(view): # written once when the replay ends
+        return
     mode_txt  = get_mode(view) # mode_insert
     mode_enum = mode_names_rev.get(mode_txt,None) # Mode.Insert
     if mode_enum in vim.CFGM and vim.CFGM[mode_enum] is not None:
         mode_name = vim.CFGM[mode_enum]
     else:
         mode_name = mode_to_name(mode_txt)
-    if mode_name:
-        view.set_status(vim.CFG['idmode'], f"{vim.CFG['prefix']}{mode_name}{vim.CFG['suffix']}")
+    mode_status = f"{vim.CFG['prefix']}{mode_name}{vim.CFG['suffix']}" if mode_name else None
 
-    seq_txt = get_sequence(view)
+    seq_txt  = get_sequence(view)
     seq_icon = get_seq_icon(view)
-    view.set_status(vim.CFG['idseq'], seq_icon)
-    _log.key("set ‘idseq’ status to ‘%s’ from ‘%s’ m‘%s’ @%s",seq_icon,seq_txt,get_mode(view),fname())
-
-    if CFG['enable'] and (match := re_cmd_count.findall(seq_txt)): # show popup
-        count_s = ''.join(match)
+    count_s  = ''.join(re_cmd_count.findall(seq_txt)) if (CFG['enable'] and '<' in seq_txt) else ''
+
+    # Skip the host calls for values that haven't changed since the last write (reset_status_line invalidates them)
+    last = get_session_view_value(view, 'status_line') or (None, None, '')
+    if mode_status is not None and mode_status != last[0]:
+        view.set_status(vim.CFG['idmode'], mode_status)
+    if seq_icon != last[1]:
+        view.set_status(vim.CFG['idseq'], seq_icon)
+        if _L:
+            _log.key("set ‘idseq’ status to ‘%s’ from ‘%s’ m‘%s’ @%s",seq_icon,seq_txt,mode_txt,fname())
+    if count_s and count_s != last[2]: # show popup
         show_popup_count(view, count_s)
+    set_session_view_value(view, 'status_line', (mode_status if mode_status is not None else last[0], seq_icon, count_s))
 
 
 def must_collect_input(view, motion: ViMotionDef, action: ViOperatorDef) -> bool:
-    _log.debug("must_collect_input? mtn‘%s’⎀?%s‘%s’ act‘%s’⎀?%s‘%s’"
-        ,motion,motion.accept_input if motion else '_',motion.inp if motion else '_'
-        ,action,action.accept_input if action else '_',action.inp if action else '_'
-        )
+    if _LD:
+        _log.debug("must_collect_input? mtn‘%s’⎀?%s‘%s’ act‘%s’⎀?%s‘%s’"
+            ,motion,motion.accept_input if motion else '_',motion.inp if motion else '_'
+            ,action,action.accept_input if action else '_',action.inp if action else '_'
+            )
     if motion and action:
         if motion.accept_input:
             return True
@@ -186,36 +194,32 @@ def _scroll_into_active_view() -> None:
             _scroll_into_view(view, get_mode(view))
 
 
-def _create_definition(view, name: str):
-    cmd = get_session_view_value(view, name)
-    if cmd:
-        cls = getattr(cmd_defs, cmd['name'], None)
-
-        if cls is None:
-            cls = plugin.classes.get(cmd['name'], None)
-
-            if cls is None:
-                raise ValueError('unknown %s: %s' % (name, cmd))
-
-        return cls.from_json(cmd['data'])
+# The action and motion are kept per view as live command instances instead of
+# being serialized into the session and rebuilt on every get, which used to cost
+# several constructions and dict copies per key. View values are never written
+# to the session file, so serialize() is only needed by explicit callers.
+def _set_live_command(view, name: str, value) -> None:
+    if value is not None and value is not get_session_view_value(view, name):
+        # Commands resolved from the mappings are shared instances, so store a
+        # private copy that can accept input without touching the registered one.
+        value = type(value).from_json(value.serialize()['data'])
+    set_session_view_value(view, name, value)
 
 
 def get_action(view):
-    return _create_definition(view, 'action')
+    return get_session_view_value(view, 'action')
 
 
 def set_action(view, value) -> None:
-    serialized = value.serialize() if value else None
-    set_session_view_value(view, 'action', serialized)
+    _set_live_command(view, 'action', value)
 
 
 def get_motion(view):
-    return _create_definition(view, 'motion')
+    return get_session_view_value(view, 'motion')
 
 
 def set_motion(view, value) -> None:
-    serialized = value.serialize() if value else None
-    set_session_view_value(view, 'motion', serialized)
+    _set_live_command(view, 'motion', value)
 
 
 def reset_command_data(view,setReg:bool=True,setACount:bool=True) -> None:
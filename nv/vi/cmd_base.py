@@ -9,7 +9,7 @@ from NeoVintageous.nv.utils import translate_char
 
 class ViCommandDefBase:
 
-    _serializable = ['_inp', ]
+    _serializable = frozenset(('_inp', ))
 
     def __init__(self, *args, **kwargs):
         self.input_parser = None
@@ -52,7 +52,7 @@ class ViCommandDefBase:
         """Serialize the command as JSON object."""
         return {
             'name': self.__class__.__name__,
-            'data': {k: v for k, v in self.__dict__.items() if k in self._serializable}
+            'data': {k: self.__dict__[k] for k in self._serializable if k in self.__dict__}
         }
 
 
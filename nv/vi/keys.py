@@ -1,6 +1,7 @@
 import re
 
 from NeoVintageous.nv import variables
+from NeoVintageous.nv.helper import LRUCache, intern_command
 from NeoVintageous.nv.vi import seqs
 from NeoVintageous.nv.modes import INSERT, INTERNAL_NORMAL, NORMAL, OPERATOR_PENDING, REPLACE, SELECT, UNKNOWN, VISUAL, VISUAL_BLOCK, VISUAL_LINE
 
@@ -88,7 +89,7 @@ _NAMED_KEYS_NEST = [
     seqs.SEQ['F20'],
 
 ]
-_NAMED_KEYS = [item for sublist in _NAMED_KEYS_NEST for item in sublist]
+_NAMED_KEYS = frozenset(item for sublist in _NAMED_KEYS_NEST for item in sublist)
 
 
 
@@ -119,6 +120,7 @@ class KeySequenceTokenizer():
         """Sequence of key names in Vim notation."""
         self.idx = -1
         self.source = source
+        self.expanded = False  # whether a variable like <leader> was expanded
 
     def _consume(self):
         self.idx += 1
@@ -207,11 +209,32 @@ class KeySequenceTokenizer():
             yield token
 
     def _expand_vars(self, c: str) -> str:
-        return variables.get(c) if variables.is_key_name(c) else c
+        if variables.is_key_name(c):
+            self.expanded = True
+            return variables.get(c)
+        return c
 
 
-def tokenize_keys(keys: str) -> list:
-    return KeySequenceTokenizer(keys)._iter_tokenize()
+# The same sequences are tokenized over and over (feeding keys, replaying
+# notation, resolving mappings), so the results are cached. Sequences that
+# expand variables like <leader> aren't cached since those can change.
+_tokens_cache = LRUCache(512)
+_bare_command_name_cache = LRUCache(512)
+
+
+def _tokenize(keys: str) -> tuple:
+    tokens = _tokens_cache.get(keys)
+    if tokens is None:
+        tokenizer = KeySequenceTokenizer(keys)
+        tokens = tuple(tokenizer._iter_tokenize())
+        if not tokenizer.expanded:
+            _tokens_cache[keys] = tokens
+
+    return tokens
+
+
+def tokenize_keys(keys: str):
+    return iter(_tokenize(keys))
 
 
 _BARE_COMMAND_NAME_PATTERN = re.compile(r'^(?:".)?(?:[1-9]+)?')
@@ -228,10 +251,15 @@ def to_bare_command_name(seq: str) -> str:
     if seq == '0':
         return seq
 
-    # Account for d2d and similar sequences.
-    new_seq = list(tokenize_keys(_BARE_COMMAND_NAME_PATTERN.sub('', seq)))
+    name = _bare_command_name_cache.get(seq)
+    if name is None:
+        # Account for d2d and similar sequences.
+        keys = _BARE_COMMAND_NAME_PATTERN.sub('', seq)
+        name = ''.join(k for k in _tokenize(keys) if not k.isdigit())
+        if keys in _tokens_cache:  # not cached if it expanded variables
+            _bare_command_name_cache[seq] = name
 
-    return ''.join(k for k in new_seq if not k.isdigit())
+    return name
 
 
 def assign(seq: list, modes, *args, **kwargs):
@@ -245,11 +273,12 @@ def assign(seq: list, modes, *args, **kwargs):
     'mappings_reverse' is a '{mode : {cmd : sequence}}' dict (only 1st sequence is stored)
     """
     def inner(cls):
+        cmd = intern_command(cls, *args, **kwargs)
         for mode in modes:
             for seq_lng in seq:
-                mappings[mode][seq_lng] = cls(*args, **kwargs)
-                if (T := type(cls(*args, **kwargs))) not in mappings_reverse[mode]: # store only the first letter map
-                    mappings_reverse[mode][T] = seq_lng
+                mappings[mode][seq_lng] = cmd
+                if cls not in mappings_reverse[mode]: # store only the first letter map
+                    mappings_reverse[mode][cls] = seq_lng
         return cls
     return inner
 
@@ -267,7 +296,7 @@ def assign_text(commands:list, modes:tuple, *args, icon:str='', **kwargs):
         for cmd in commands:  # 'EnterInsertMode' → class ViEnterInsertMode(ViOperatorDef)
             if (C := cmd.lower())               not in map_textcmd2cmd:
                 map_textcmd2cmd[C] = cls(*args,**kwargs)
-        if     (T := type(cls(*args,**kwargs))) not in map_cmd2textcmd:
-            map_cmd2textcmd    [T] = commands
+        if      cls                             not in map_cmd2textcmd:
+            map_cmd2textcmd  [cls] = commands
         return cls
     return inner
@@ -1,43 +1,43 @@
-from sublime import Region
-
 from NeoVintageous.nv.options import get_option
+from NeoVintageous.nv.polyfill import view_find_all_in_range
+from NeoVintageous.nv.polyfill import view_find_in_range
+from NeoVintageous.nv.polyfill import view_rfind_all
 
 
 # DEPRECATED Use view_find_in_range()
 def find_in_range(view, term: str, start: int, end: int, flags: int = 0):
-    found = view.find(term, start, flags)
-    if found and found.b <= end:
+    found = view_find_in_range(view, term, start, end, flags)
+    if found:
         return found
 
 
 # DEPRECATED Use view_find_all()
 def find_all_in_range(view, term: str, start: int, end: int, flags: int = 0) -> list:
     matches = []  # type: list
+    for match in view_find_all_in_range(view, term, start, end, flags):
+        if match.empty():
+            break
 
-    while True:
-        m = find_in_range(view, term, start, end, flags)
-
-        if m == Region(-1, -1):
-            return matches
-
-        if not m:
-            return matches
-
-        if m.end() > end or m.begin() < start:
-            return matches
+        matches.append(match)
 
-        matches.append(m)
-        start = m.end()
+    return matches
 
 
-def find_wrapping(view, term: str, start: int, end: int, flags: int = 0, times: int = 1):
+# The optional @index (see nv.search.get_search_index) answers the searches
+# from the indexed matches of @term instead of searching the view.
+def find_wrapping(view, term: str, start: int, end: int, flags: int = 0, times: int = 1, index=None):
     try:
         current_sel = view.sel()[0]
     except IndexError:
         return
 
+    def _find(start, end):
+        if index:
+            return index.find(view, start, end)
+        return find_in_range(view, term, start, end, flags)
+
     for x in range(times):
-        match = find_in_range(view, term, start, end, flags)
+        match = _find(start, end)
         # make sure we wrap around the end of the buffer
         if not match:
             if not get_option(view, 'wrapscan'):
@@ -49,7 +49,7 @@ def find_wrapping(view, term: str, start: int, end: int, flags: int = 0, times:
             # See https://github.com/NeoVintageous/NeoVintageous/issues/223.
             end = current_sel.a
             end = view.word(current_sel.a).b
-            match = find_in_range(view, term, start, end, flags)
+            match = _find(start, end)
             if not match:
                 return
 
@@ -58,15 +58,20 @@ def find_wrapping(view, term: str, start: int, end: int, flags: int = 0, times:
     return match
 
 
-def reverse_find_wrapping(view, term: str, start: int, end: int, flags: int = 0, times: int = 1):
+def reverse_find_wrapping(view, term: str, start: int, end: int, flags: int = 0, times: int = 1, index=None):
     try:
         current_sel = view.sel()[0]
     except IndexError:
         return
 
+    def _rfind(start, end):
+        if index:
+            return index.rfind(view, start, end)
+        return reverse_search(view, term, start, end, flags)
+
     # Search wrapping around the end of the buffer.
     for x in range(times):
-        match = reverse_search(view, term, start, end, flags)
+        match = _rfind(start, end)
         # Start searching in the lower half of the buffer if we aren't doing it yet.
         if not match and start <= current_sel.b:
             if not get_option(view, 'wrapscan'):
@@ -77,7 +82,7 @@ def reverse_find_wrapping(view, term: str, start: int, end: int, flags: int = 0,
             # See https://github.com/NeoVintageous/NeoVintageous/issues/223.
             start = view.word(current_sel.b).a
             end = view.size()
-            match = reverse_search(view, term, start, end, flags)
+            match = _rfind(start, end)
             if not match:
                 return
         # No luck in the whole buffer.
@@ -90,15 +95,9 @@ def reverse_find_wrapping(view, term: str, start: int, end: int, flags: int = 0,
 
 
 def find_last_in_range(view, term: str, start: int, end: int, flags: int = 0):
-    found = find_in_range(view, term, start, end, flags)
-    last_found = found
-    while found:
-        found = find_in_range(view, term, found.b, end, flags)
-        if not found or found.b > end:
-            break
-        last_found = found if found else last_found
-
-    return last_found
+    matches = find_all_in_range(view, term, start, end, flags)
+    if matches:
+        return matches[-1]
 
 
 # The @start position is linewise.
@@ -126,53 +125,27 @@ def reverse_search(view, term: str, start: int, end: int, flags: int = 0):
     if start < 0 or end > view.size():
         return None
 
-    lo_line = view.full_line(start)
-    hi_line = view.full_line(end)
-
-    while True:
-        low_row, hi_row = view.rowcol(lo_line.a)[0], view.rowcol(hi_line.a)[0]
-        middle_row = (low_row + hi_row) // 2
-
-        middle_line = view.full_line(view.text_point(middle_row, 0))
-
-        lo_region = Region(lo_line.a, middle_line.b)
-        hi_region = Region(middle_line.b, min(hi_line.b, end))
-
-        if find_in_range(view, term, hi_region.a, hi_region.b, flags):
-            lo_line = view.full_line(middle_line.b)
-        elif find_in_range(view, term, lo_region.a, lo_region.b, flags):
-            hi_line = view.full_line(middle_line.a)
-        else:
-            return None
-
-        if lo_line == hi_line:
-            # we found the line we were looking for, now extract the match.
-            return find_last_in_range(view, term, hi_line.a, min(hi_line.b, end), flags)
+    return _reverse_search(view, term, view.full_line(start).a, end, flags)
 
 
 def reverse_search_by_pt(view, term: str, start: int, end: int, flags: int = 0):
     if start < 0 or end > view.size():
         return None
 
-    lo_line = view.full_line(start)
-    hi_line = view.full_line(end)
-
-    while True:
-        low_row, hi_row = view.rowcol(lo_line.a)[0], view.rowcol(hi_line.a)[0]
-        middle_row = (low_row + hi_row) // 2
-
-        middle_line = view.full_line(view.text_point(middle_row, 0))
+    return _reverse_search(view, term, start, end, flags)
 
-        lo_region = Region(lo_line.a, middle_line.b)
-        hi_region = Region(middle_line.b, min(hi_line.b, end))
 
-        if find_in_range(view, term, hi_region.a, hi_region.b, flags):
-            lo_line = view.full_line(middle_line.b)
-        elif find_in_range(view, term, lo_region.a, lo_region.b, flags):
-            hi_line = view.full_line(middle_line.a)
-        else:
-            return None
+# Returns the last non-empty match ending at or before end and starting at or
+# after start. The scan goes backwards from end, so its cost is proportional to
+# the distance to the match rather than to the size of the buffer.
+def _reverse_search(view, term: str, start: int, end: int, flags: int):
+    for match in view_rfind_all(view, term, end, flags):
+        if match.a < start:
+            # The backwards scan finds the matches of a search from the start
+            # of a line, so one that overlaps start can hide a match of the
+            # search from start e.g. "aa" in "aaa" from 1. The search from
+            # start is bounded by the distance already scanned.
+            return find_last_in_range(view, term, start, end, flags)
 
-        if lo_line == hi_line:
-            # we found the line we were looking for, now extract the match.
-            return find_last_in_range(view, term, max(hi_line.a, start), min(hi_line.b, end), flags)
+        if not match.empty():
+            return match
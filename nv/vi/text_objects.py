@@ -1,13 +1,16 @@
 import re
 import logging
+from bisect import bisect_left
 import time
 from datetime import datetime
 
 from sublime import CLASS_EMPTY_LINE, CLASS_LINE_END, CLASS_LINE_START, CLASS_PUNCTUATION_END, CLASS_PUNCTUATION_START, CLASS_WORD_END, CLASS_WORD_START, IGNORECASE
 from sublime import Region
 
+from NeoVintageous.nv.brackets  import find_closing_bracket, find_opening_bracket, get_lone_bracket_selector, get_single_char_brackets
 from NeoVintageous.nv.log       import DEFAULT_LOG_LEVEL, TFMT
-from NeoVintageous.nv.polyfill  import re_escape, view_find, view_find_in_range, view_indentation_level, view_indented_region, view_rfind_all
+from NeoVintageous.nv.polyfill  import re_escape, view_find, view_find_in_range, view_indentation_level, view_indented_region
+from NeoVintageous.nv.session   import get_session_view_value, set_session_view_value
 from NeoVintageous.nv.settings  import get_setting
 from NeoVintageous.nv.utils     import get_insertion_point_at_b, next_non_blank, next_non_ws, prev_non_blank, prev_non_ws
 from NeoVintageous.nv.vi.search import find_in_range, reverse_search_by_pt
@@ -413,7 +416,7 @@ def _get_text_object_tag(view, s: Region, inclusive: bool, count: int) -> Region
                 s.a = tag_in_line.end()
                 s.b = tag_in_line.end() + 1
 
-    begin_tag, end_tag, _ = find_containing_tag(view, s.begin())
+    begin_tag, end_tag, _ = find_containing_tag(view, s.begin(), count)
     if not (begin_tag and end_tag):
         return s
 
@@ -594,6 +597,22 @@ def get_text_object_region(view, s: Region, text_object: str, inclusive: bool =
 
 
 def find_next_lone_bracket(view, start: int, items, unbalanced: int = 0):
+    brackets = get_single_char_brackets(items)
+    if brackets:
+        if view.substr(start) == brackets[0]:
+            start += 1
+
+        selector = get_lone_bracket_selector(view, start)
+        closing = find_closing_bracket(view, start, *brackets, unbalanced or 1, escapable=True, selector=selector)
+        if closing is not None:
+            return Region(closing, closing + 1)
+
+        return None
+
+    return _search_next_lone_bracket(view, start, items, unbalanced)
+
+
+def _search_next_lone_bracket(view, start: int, items, unbalanced: int = 0):
     # TODO: Extract common functionality from here and the % motion instead of
     # duplicating code.
     new_start = start
@@ -636,14 +655,30 @@ def find_next_lone_bracket(view, start: int, items, unbalanced: int = 0):
         start = next_opening_bracket.end()
 
     if nested > 0:
-        return find_next_lone_bracket(view, next_closing_bracket.end(),
-                                      items,
-                                      nested)
+        return _search_next_lone_bracket(view, next_closing_bracket.end(),
+                                         items,
+                                         nested)
     else:
         return next_closing_bracket
 
 
-def find_prev_lone_bracket(view, start: int, tags, unbalanced: int = 0): # TODO: Extract common functionality from here and the % motion instead of duplicating code.
+def find_prev_lone_bracket(view, start: int, tags, unbalanced: int = 0):
+    brackets = get_single_char_brackets(tags)
+    if brackets:
+        if not unbalanced and view.substr(start) == brackets[0] and view.substr(start - 1) != '\\':
+            return Region(start, start + 1)
+
+        selector = get_lone_bracket_selector(view, start)
+        opening = find_opening_bracket(view, start, *brackets, unbalanced or 1, escapable=True, selector=selector)
+        if opening is not None:
+            return Region(opening, opening + 1)
+
+        return None
+
+    return _search_prev_lone_bracket(view, start, tags, unbalanced)
+
+
+def _search_prev_lone_bracket(view, start: int, tags, unbalanced: int = 0): # TODO: Extract common functionality from here and the % motion instead of duplicating code.
     if view.substr(start) == (tags[0][1] if len(tags[0]) > 1 else tags[0]):
         if not unbalanced and view.substr(start - 1) != '\\':
             return Region(start, start + 1)
@@ -666,7 +701,7 @@ def find_prev_lone_bracket(view, start: int, tags, unbalanced: int = 0): # TODO:
         nested += 1
         start = next_closing_bracket.begin()
     if nested > 0:
-        return find_prev_lone_bracket(view, prev_opening_bracket.begin(), tags, nested)
+        return _search_prev_lone_bracket(view, prev_opening_bracket.begin(), tags, nested)
     else:
         return prev_opening_bracket
 
@@ -983,7 +1018,7 @@ def get_closest_tag(view, pt: int):
     return next_tag
 
 
-def find_containing_tag(view, start: int) -> tuple:
+def find_containing_tag(view, start: int, count: int = 1) -> tuple:
     # Args:
     #   view (sublime.View)
     #
@@ -998,6 +1033,32 @@ def find_containing_tag(view, start: int) -> tuple:
     if closest_tag.contains(start) and view.substr(closest_tag)[1] == '/':
         start = closest_tag.a
 
+    index = get_tag_index(view)
+    containing = index.find_containing(start, count)
+    end = containing[1].a if containing else view.size()
+
+    # End tags without a begin tag are resolved by searching for a begin tag
+    # with the same name, which is what the index doesn't model.
+    if not index.has_unmatched_end_tag(start, end):
+        if containing:
+            return containing
+
+        return None, None, None
+
+    # Each count searches for the element containing the begin tag of the one
+    # found by the count before.
+    containing = None, None, None
+    for _ in range(max(count, 1)):
+        containing = _search_containing_tag(view, start)
+        if not containing[0]:
+            break
+
+        start = containing[0].a
+
+    return containing
+
+
+def _search_containing_tag(view, start: int) -> tuple:
     end_region, tag_name = next_unbalanced_tag(
         view,
         search=next_end_tag,
@@ -1025,7 +1086,99 @@ def find_containing_tag(view, start: int) -> tuple:
     return begin_region, end_region, tag_name
 
 
-def next_unbalanced_tag(view, search=None, search_args={}, restart_at=None, tags: list = []) -> tuple:
+class TagIndex:
+    """The nesting of the HTML/XML tags in a view.
+
+    The tags are tokenized with one pass over the text of the view and paired
+    up like the tag searches do: an end tag closes the innermost open begin tag
+    with the same name, and any begin tags opened after that one are left
+    unclosed e.g. <br>. The index is valid until the view is modified.
+    """
+
+    def __init__(self, view):
+        self.change_count = view.change_count()
+
+        # The sorted begin points, regions and names of the tags.
+        self.starts = []  # type: list
+        self.regions = []  # type: list
+        self.names = []  # type: list
+
+        # The index of the innermost open begin tag after each tag, or -1.
+        self.enclosing = []  # type: list
+
+        # The index of the enclosing begin tag of each begin tag, or -1.
+        self.parents = {}  # type: dict
+
+        # The index of the end tag of each closed begin tag.
+        self.end_tags = {}  # type: dict
+
+        # The sorted begin points of the end tags without a begin tag.
+        self.unmatched = []  # type: list
+
+        text = view.substr(Region(0, view.size()))
+        stack = []  # type: list
+        open_names = {}  # type: dict
+        for i, match in enumerate(re.finditer(RX_ANY_TAG, text, re.IGNORECASE)):
+            name = match.group(1)
+            self.starts.append(match.start())
+            self.regions.append(Region(match.start(), match.end()))
+            self.names.append(name)
+
+            if not match.group(0).startswith('</'):
+                self.parents[i] = stack[-1] if stack else -1
+                stack.append(i)
+                open_names[name] = open_names.get(name, 0) + 1
+            elif open_names.get(name):
+                while True:
+                    j = stack.pop()
+                    open_names[self.names[j]] -= 1
+                    if self.names[j] == name:
+                        self.end_tags[j] = i
+                        break
+            else:
+                self.unmatched.append(match.start())
+
+            self.enclosing.append(stack[-1] if stack else -1)
+
+    def is_valid(self, view) -> bool:
+        return self.change_count == view.change_count()
+
+    def find_containing(self, pt: int, count: int = 1):
+        """Return the count-th closed element containing the tags from pt onwards.
+
+        Returns a tuple of the begin tag region, end tag region and tag name, or
+        None if there is no such element.
+        """
+        i = bisect_left(self.starts, pt) - 1
+        j = self.enclosing[i] if i >= 0 else -1
+        for _ in range(max(count, 1)):
+            while j >= 0 and j not in self.end_tags:
+                j = self.parents[j]
+
+            if j < 0:
+                return None
+
+            found = j
+            j = self.parents[j]
+
+        return self.regions[found], self.regions[self.end_tags[found]], self.names[found]
+
+    def has_unmatched_end_tag(self, start: int, end: int) -> bool:
+        i = bisect_left(self.unmatched, start)
+
+        return i < len(self.unmatched) and self.unmatched[i] < end
+
+
+def get_tag_index(view) -> TagIndex:
+    index = get_session_view_value(view, 'tag_index')
+    if index is None or not index.is_valid(view):
+        index = TagIndex(view)
+        set_session_view_value(view, 'tag_index', index)
+
+    return index
+
+
+def next_unbalanced_tag(view, search=None, search_args=None, restart_at=None, tags: list = None) -> tuple:
     # Args:
     #   view (sublime.View)
     #   search (callable)
@@ -1037,6 +1190,12 @@ def next_unbalanced_tag(view, search=None, search_args={}, restart_at=None, tags
     #   tuple[Region, str]
     #   tuple[None, None]
     assert search and restart_at, 'wrong call'
+    if search_args is None:
+        search_args = {}
+
+    if tags is None:
+        tags = []
+
     region, tag, is_end_tag = search(view, **search_args)
 
     if not region:
@@ -1083,59 +1242,19 @@ def find_next_item_match_pt(view, s: Region):
                     if begin_tag:
                         return begin_tag.a + 1 if end_tag.contains(pt) else end_tag.a + 1
 
-    # Find the next item after or under the cursor.
-    bracket = view_find(view, '|'.join(map(re_escape, targets)), pt)
+    # Find the next item after or under the cursor, within the cursor line.
+    bracket = view_find_in_range(view, '|'.join(map(re_escape, targets)), pt, view.line(pt).b)
     if not bracket:
         return
 
-    # Only accept items found within the current cursor line.
-    if bracket.b > view.line(pt).b:
-        return
-
     target = view.substr(bracket)
     target_index = targets.index(target)
     targets_open = targets[::2]
-    forward = True if target in targets_open else False
-
-    if target in targets_open:
-        target_pair = (targets[target_index], targets[target_index + 1])
-    else:
-        target_pair = (targets[target_index - 1], targets[target_index])
 
+    # Items in strings for example are skipped.
     accepted_selector = 'punctuation|text.plain|comment'
 
-    if forward:
-        counter = 0
-        start = bracket.b
-        while True:
-            bracket = view_find(view, '|'.join(map(re_escape, target_pair)), start)
-            if not bracket:
-                return
-
-            if view.match_selector(bracket.a, accepted_selector):
-                if view.substr(bracket) == target:
-                    counter += 1
-                else:
-                    if counter == 0:
-                        return bracket.a
-
-                    counter -= 1
-
-            start = bracket.b
-    else:
-        # Note the use of view_rfind_all(), because Sublime doesn't have any
-        # APIs to do reverse searches and finding *all* matches before a point
-        # is easier and more effiecient, at least in a userland implemention.
-        counter = 0
-        start = bracket.a
-        for bracket in view_rfind_all(view, '|'.join(map(re_escape, target_pair)), start):
-            if view.match_selector(bracket.a, accepted_selector):
-                if view.substr(bracket) == target:
-                    counter += 1
-                else:
-                    if counter == 0:
-                        return bracket.a
-
-                    counter -= 1
+    if target in targets_open:
+        return find_closing_bracket(view, bracket.b, target, targets[target_index + 1], selector=accepted_selector)
 
-            start = bracket.a
+    return find_opening_bracket(view, bracket.a, targets[target_index - 1], target, selector=accepted_selector)
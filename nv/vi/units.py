@@ -44,21 +44,96 @@ def at_word(view, pt: int):
     return at_word_start(view, pt) or _WORD_PATTERN.match(view.substr(pt))
 
 
+# WORDs are separated by white space only. In minified code a WORD can span
+# thousands of word and punctuation boundaries, so rather than asking the view
+# for each boundary, the WORD motions scan the text in chunks with a regex. The
+# patterns look behind one character at most, which is included in the chunk.
+_SCAN_CHUNK_SIZE = 4096
+_WHITE_SPACE_PATTERN = re.compile('\\s')
+_BIG_WORD_START_PATTERN = re.compile('(?<=\\n)|(?<=\\s)\\S')
+_BIG_WORD_INTERNAL_START_PATTERN = re.compile('\\n|(?<=\\s)\\S')
+_BIG_WORD_END_PATTERN = re.compile('(?<=\\S)\\s')
+
+
+# Returns the start of the first match at or after pt, or the view size.
+def _scan_forward(view, pattern, pt: int) -> int:
+    size = view.size()
+    chunk_size = _SCAN_CHUNK_SIZE
+    while pt < size:
+        begin = max(0, pt - 1)
+        end = min(size, pt + chunk_size)
+        match = pattern.search(view.substr(Region(begin, end)), pt - begin)
+        if match:
+            return begin + match.start()
+
+        pt = end
+        chunk_size *= 2
+
+    return size
+
+
 def skip_word(view, pt: int) -> int:
-    while True:
-        if at_punctuation(view, pt):
-            pt = view.find_by_class(pt, forward=True, classes=CLASS_PUNCTUATION_END)
-        elif at_word(view, pt):
-            pt = view.find_by_class(pt, forward=True, classes=CLASS_WORD_END)
-        else:
+    return _scan_forward(view, _WHITE_SPACE_PATTERN, pt)
+
+
+# The small word motions classify the characters like the view does, from the
+# word_separators setting: separators are punctuation, white space is neither
+# punctuation nor a word, and everything else is part of a word. The boundary
+# patterns are built from that classification, and the text is scanned in
+# chunks, instead of asking the view for each boundary with find_by_class().
+_CLASS_PATTERNS = (
+    (CLASS_WORD_START, '(?<!{word})(?={word})'),
+    (CLASS_WORD_END, '(?<={word})(?!{word})'),
+    (CLASS_PUNCTUATION_START, '(?<!{punctuation})(?={punctuation})'),
+    (CLASS_PUNCTUATION_END, '(?<={punctuation})(?!{punctuation})'),
+    (CLASS_LINE_START, '(?<=\\n)'),
+    (CLASS_LINE_END, '(?=\\n)'),
+)
+_class_patterns = {}  # type: dict
+
+
+def _get_class_pattern(view, classes: int):
+    separators = view.settings().get('word_separators') or ''
+    key = (separators, classes)
+    pattern = _class_patterns.get(key)
+    if pattern is None:
+        separators = ''.join(map(re.escape, separators))
+        word = '[^\\s{}]'.format(separators)
+        punctuation = '[{}]'.format(separators) if separators else '(?!)'
+        pattern = _class_patterns[key] = re.compile('|'.join(
+            class_pattern.format(word=word, punctuation=punctuation)
+            for class_, class_pattern in _CLASS_PATTERNS if classes & class_))
+
+    return pattern
+
+
+# Returns the first point after pt that is in one of the classes, or the view
+# size, like view.find_by_class(pt, forward=True, classes=classes). A boundary
+# at the end of a chunk depends on the character after it, so it's only found
+# by the next chunk, unless the chunk ends the view.
+def _find_by_class(view, pt: int, classes: int) -> int:
+    pattern = _get_class_pattern(view, classes)
+    size = view.size()
+    chunk_size = _SCAN_CHUNK_SIZE
+    while pt < size:
+        begin = max(0, pt - 1)
+        end = min(size, pt + chunk_size)
+        match = pattern.search(view.substr(Region(begin, end)), pt + 1 - begin)
+        if match and (begin + match.start() < end or end == size):
+            return begin + match.start()
+
+        if end == size:
             break
 
-    return pt
+        pt = end - 1
+        chunk_size *= 2
+
+    return size
 
 
 def next_word_start(view, start: int, internal: bool = False) -> int:
     classes = _CLASS_VI_WORD_START if not internal else _CLASS_VI_INTERNAL_WORD_START
-    pt = view.find_by_class(start, forward=True, classes=classes)
+    pt = _find_by_class(view, start, classes)
     if internal and at_eol(view, pt):
         # Unreachable?
         return pt
@@ -67,23 +142,21 @@ def next_word_start(view, start: int, internal: bool = False) -> int:
 
 
 def next_big_word_start(view, start: int, internal: bool = False) -> int:
-    classes = _CLASS_VI_WORD_START if not internal else _CLASS_VI_INTERNAL_WORD_START
     pt = skip_word(view, start)
-    seps = ''
     if internal and at_eol(view, pt):
         return pt
 
-    pt = view.find_by_class(pt, forward=True, classes=classes, separators=seps)
+    pattern = _BIG_WORD_START_PATTERN if not internal else _BIG_WORD_INTERNAL_START_PATTERN
 
-    return pt
+    return _scan_forward(view, pattern, pt + 1)
 
 
 def next_word_end(view, start: int, internal: bool = False, nosep:bool = False) -> int:
     classes = _CLASS_VI_WORD_END if not internal else _CLASS_VI_INTERNAL_WORD_END
-    pt     = view.find_by_class(start , forward=True, classes=classes              )
-    pt_p   = view.find_by_class(start , forward=True, classes=CLASS_PUNCTUATION_END)
+    pt     = _find_by_class(view, start , classes              )
+    pt_p   = _find_by_class(view, start , CLASS_PUNCTUATION_END)
     if nosep and pt == pt_p: # we're at word's end before puncts, so skip them
-        pt = view.find_by_class(pt_p+1, forward=True, classes=classes              )
+        pt = _find_by_class(view, pt_p+1, classes              )
     if internal and at_eol(view, pt):
         return pt # Unreachable?
     return     pt
@@ -147,7 +220,9 @@ def word_ends(view, start: int, count: int = 1, big: bool = False, nosep:bool=Fa
     if not view.substr(start).isspace():
         pt = start + 1
     for i in range(count):
-        if big:
+        if big and not nosep:
+            pt = _scan_forward(view, _BIG_WORD_END_PATTERN, pt + 1)
+        elif big:
             while True:
                 pt = next_word_end(view, pt, nosep=nosep)
                 if      pt >= view.size() or view.substr(pt).isspace():
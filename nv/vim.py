@@ -5,6 +5,7 @@ from sublime import windows as _windows
 
 from NeoVintageous.nv.polyfill import status_message as _status_message
 from NeoVintageous.nv.rc import cfgU
+from NeoVintageous.nv.session import set_session_view_value
 
 from NeoVintageous.nv.log import DEFAULT_LOG_LEVEL
 _log = logging.getLogger(__name__)
@@ -127,6 +128,7 @@ def mode_to_char(mode: str) -> str:
 
 
 def reset_status_line(view, mode: str) -> None:
+    set_session_view_value(view, 'status_line', None) # invalidate values last written by update_status_line
     view.erase_status(CFG['idseq'])
     if mode == NORMAL:
         view.set_status(CFG['idmode'], _MODES[M.Normal])
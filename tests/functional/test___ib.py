@@ -97,3 +97,16 @@ class Test_ib(unittest.ResetRegisters, unittest.FunctionalTestCase):
             self.eq('x(\nfi|zz\nbuzz\n)y', 'yi' + target, 'x(\n|fizz\nbuzz\n)y')
             self.assertLinewiseRegisters('"0', 'fizz\nbuzz\n', '-1')
             self.resetRegisters()
+
+
+class Test_ib_in_Python_syntax(unittest.FunctionalTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.syntax('Packages/Python/Python.sublime-syntax')
+
+    def test_dib_skips_brackets_in_strings(self):
+        self.eq('f(a, ")", b|b)\n', 'dib', 'f(|)\n')
+        self.eq('f(a|a, "(", b)\n', 'dib', 'f(|)\n')
+        self.eq('f(a, "(x|x)", b)\n', 'dib', 'f(a, "(|)", b)\n')
+        self.eq('f(a, "x", b)  # (fi|zz)\n', 'dib', 'f(a, "x", b)  # (|)\n')
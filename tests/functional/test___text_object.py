@@ -163,6 +163,15 @@ class TestTextObjectSelection(unittest.FunctionalTestCase):
         self.eq('<div>\n  |<h1>fizz</h1>\n</div>', 'v_at', '<div>\n  |<h1>fizz</h1>|\n</div>')
         self.eq('<div>\n|\n<h1>fizz</h1>\n</div>', 'v_at', '|<div>\n\n<h1>fizz</h1>\n</div>|')
 
+    def test_vat_count(self):
+        self.eq('<ul><li><b>fi|zz</b></li></ul>', 'v_2at', '<ul>|<li><b>fizz</b></li>|</ul>')
+        self.eq('<ul><li><b>fi|zz</b></li></ul>', 'v_3at', '|<ul><li><b>fizz</b></li></ul>|')
+
+    def test_vat_count_with_unmatched_end_tag(self):
+        self.eq('<ul><li><b>fi|zz</b></i></li></ul>', 'v_at', '<ul><li>|<b>fizz</b>|</i></li></ul>')
+        self.eq('<ul><li><b>fi|zz</b></i></li></ul>', 'v_2at', '<ul><li><b>fi|z|z</b></i></li></ul>')
+        self.eq('<ul><li><b>fi|zz</b></i></li></ul>', 'v_2it', '<ul><li><b>fi|z|z</b></i></li></ul>')
+
     def test_vit(self):
         self.eq('x<p>a|bc</p>x', 'v_it', 'x<p>|abc|</p>x')
         self.eq('x<p>_<i>_</i>a|bc<i>_</i>d</p>x', 'v_it', 'x<p>|_<i>_</i>abc<i>_</i>d|</p>x')
@@ -33,14 +33,44 @@ class Test_ex_global(unittest.FunctionalTestCase):
         self.eq('|fizz\nxyz\nbuzz\nfizz\nxyz\nbuzz\n', ':global/^x/d', 'fizz\nbuzz\nfizz\n|buzz\n')
         self.eq('|fizz\nxyz\nbuzz\n', ':global/^./d', '|')
         self.eq('|fizz\nxyz\nbuzz\n', ':global/^/d', '|')
-        self.eq('|fizz\n\nbuzz\nfizz\n\n\n\n\n\nbuzz\n', ':global/^$/d', 'fizz\nbuzz\nfizz\nbuz|z\n')
-        self.eq('|fizz\n\nbuzz\nfizz\n\n\n\n\n\nbuzz\n', ':%global/^$/d', 'fizz\nbuzz\nfizz\nbuz|z\n')
+        self.eq('|fizz\n\nbuzz\nfizz\n\n\n\n\n\nbuzz\n', ':global/^$/d', 'fizz\nbuzz\nfizz\n|buzz\n')
+        self.eq('|fizz\n\nbuzz\nfizz\n\n\n\n\n\nbuzz\n', ':%global/^$/d', 'fizz\nbuzz\nfizz\n|buzz\n')
         self.eq('|1\nx2\n3\n4\nx5\n6\nx7\nx8\n9\n0', ':3,7g/^x/d', '1\nx2\n3\n4\n6\n|x8\n9\n0')
 
+    def test_global_delete_stores_lines_in_register(self):
+        self.eq('|a\nx1\nb\nx2\nx3\nc\n', ':g/^x/d', 'a\nb\n|c\n')
+        self.assertRegister('"', 'x1\nx2\nx3\n')
+
     def test_global_not_match_delete(self):
         self.eq('|fizz\nxyz\nbuzz\n', ':global!/^x/d', 'xyz\n|')
         self.eq('|fizz\nxyz\nbuzz\nfizz\nxyz\nbuzz\n', ':global!/^x/d', 'xyz\nxyz\n|')
 
+    def test_global_substitute(self):
+        self.eq('|fizz\nxyz\nbuzz\nxyz\n', ':global/^x/s/y/Y/', 'fizz\nxYz\nbuzz\n|xYz\n')
+        self.eq('|fizz\nxyz\nab\n', ':g/z/s//Z/g', 'fiZZ\n|xyZ\nab\n')
+        self.eq('|fizz\nxyz\nab\n', ':g!/z/s/$/;/', 'fizz\nxyz\n|ab;\n')
+
+    def test_global_move(self):
+        self.eq('|a\nx1\nb\nx2\n', ':g/^x/m0', '|x2\nx1\na\nb\n')
+        self.eq('|a\nx1\nb\nx2', ':g/^x/m0', '|x2\nx1\na\nb')
+        self.eq('|a\nx1\nb\nx2\n', ':g/^x/move $', 'a\nb\nx1\n|x2\n')
+        self.eq('|a\nx1\nb', ':g/^x/m$', 'a\nb\n|x1')
+
+    def test_global_copy(self):
+        self.eq('|a\nx1\nb\nx2\n', ':g/^x/co0', '|x2\nx1\na\nx1\nb\nx2\n')
+        self.eq('|a\nx1\nb\nx2\n', ':g/^x/copy $', 'a\nx1\nb\nx2\nx1\n|x2\n')
+        self.eq('|a\nx1\nb\nx2', ':g/^x/co$', 'a\nx1\nb\nx2\nx1\n|x2')
+
+    @unittest.mock_status_message()
+    def test_global_move_to_line_not_supported(self):
+        self.eq('|a\nx1\nb\nx2\n', ':g/^x/m1', '|a\nx1\nb\nx2\n')
+        self.assertStatusMessage('Command not supported: move 1')
+
+    @unittest.mock_status_message()
+    def test_global_not_match_every_line(self):
+        self.eq('|fizz\nbuzz\n', ':g!/z/d', '|fizz\nbuzz\n')
+        self.assertStatusMessage('Pattern found in every line: z')
+
     @unittest.mock_status_message()
     def test_global_delete_pattern_not_found(self):
         self.normal('|fizz\nxyz\nbuzz\n')
@@ -71,10 +101,10 @@ class Test_ex_global(unittest.FunctionalTestCase):
         self.assertStatusMessage('Command not supported: nohlsearch')
 
     def test_issue_78_with_range(self):
-        self.eq('|1\n2\n3\n4\n5\n6\n7\n8\n9\n0', ':3,6g/^/d', '1\n2\n|8\n9\n0')
+        self.eq('|1\n2\n3\n4\n5\n6\n7\n8\n9\n0', ':3,6g/^/d', '1\n2\n|7\n8\n9\n0')
 
     def test_issue_78_delete(self):
-        self.eq('|fizz\n\nbuzz\n', ':global/^$/d', 'fizz\nbuz|z\n')
+        self.eq('|fizz\n\nbuzz\n', ':global/^$/d', 'fizz\n|buzz\n')
 
     def test_issue_78_print_with_newline(self):
         self.eq('|1\n2\n3\n', ':g/\\d/p', '|1\n2\n3\n')
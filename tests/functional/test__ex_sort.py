@@ -21,33 +21,56 @@ from NeoVintageous.tests import unittest
 class Test_ex_sort(unittest.FunctionalTestCase):
 
     def test_sort(self):
-        if unittest.ST_VERSION >= 4138:  # fixed in 4138
-            self.eq('d\nb\n|c\na', ':sort', '|a\nb\nc\nd')
-        else:
-            self.eq('d\nb\n|c\na', ':sort', 'a\nb\n|c\nd')
+        self.eq('d\nb\n|c\na', ':sort', '|a\nb\nc\nd')
+        self.eq('d\nb\n|c\na\n', ':sort', '|a\nb\nc\nd\n')
+        self.eq('d\n|c\nb\na\n', ':2,3sort', 'd\n|b\nc\na\n')
+        self.eq('|b\n    a\nc', ':sort', '    |a\nb\nc')
 
     def test_sort_reverse(self):
-        if unittest.ST_VERSION >= 4138:  # fixed in 4138
-            self.eq('|1\n2\n3\n4\n5\n', ':sort!', '|5\n4\n3\n2\n1\n')
-            self.eq('|1\n2\n5\n3\n4\n2\n5\n', ':sort! u', '|5\n4\n3\n2\n1\n')
-        else:
-            self.eq('|1\n2\n3\n4\n5\n', ':sort!', '|5\n4\n3\n2\n1')
-            self.eq('|1\n2\n5\n3\n4\n2\n5\n', ':sort! u', '|5\n4\n3\n2\n1')
+        self.eq('|1\n2\n3\n4\n5\n', ':sort!', '|5\n4\n3\n2\n1\n')
+        self.eq('|1\n2\n5\n3\n4\n2\n5\n', ':sort! u', '|5\n4\n3\n2\n1\n')
 
     def test_sort_options(self):
-        if unittest.ST_VERSION >= 4138:  # fixed in 4138
-            self.eq('1\n1\n2\n|3\n2\n4', ':sort u', '|1\n2\n3\n4')
-        else:
-            self.eq('1\n1\n2\n|3\n2\n4', ':sort u', '1\n|2\n3\n4')
+        self.eq('1\n1\n2\n|3\n2\n4', ':sort u', '|1\n2\n3\n4')
         self.eq('|a\nA\nB\nb', ':sort i', '|a\nA\nB\nb')
         self.eq('|b\nA\na\nB', ':sort i', '|A\na\nb\nB')
         self.eq('|b\na\nA\nB', ':sort i', '|a\nA\nb\nB')
-        self.eq('|1\nb\n1\nb\na\nA\na\nB', ':sort iu', '|1\na\nA\nb\nB')
+        self.eq('|1\nb\n1\nb\na\nA\na\nB', ':sort iu', '|1\na\nb')
+
+    def test_sort_numbers(self):
+        self.eq('|x10\nx-2\nnone\nx3\ny', ':sort n', '|none\ny\nx-2\nx3\nx10')
+        self.eq('|x10\nx-2\nnone\nx3\ny', ':sort! n', '|x10\nx3\nx-2\ny\nnone')
+        self.eq('|0x1F\n0xA\nff\nz', ':sort x', '|z\n0xA\n0x1F\nff')
+        self.eq('|17\n010\n7', ':sort o', '|7\n010\n17')
+        self.eq('|19\n9\n010\n0o17\n018', ':sort o', '|010\n9\n0o17\n018\n19')
+        self.eq('|b110\nb11\nb0', ':sort b', '|b0\nb11\nb110')
+        self.eq('|1.5\n-2e1\nabc\n\n3', ':sort f', '|\n-2e1\nabc\n1.5\n3')
+        self.eq('|2\n1\n2\n02', ':sort nu', '|1\n2\n02')
+
+    @unittest.mock_status_message()
+    def test_sort_numbers_invalid_argument(self):
+        self.eq('|2\n1', ':sort nx', '|2\n1')
+        self.assertStatusMessage('E474: Invalid argument')
+
+    def test_sort_pattern(self):
+        self.eq('|a3 b\nc1 a\nzz\nd2 c', ':sort /\\d /', '|zz\nc1 a\na3 b\nd2 c')
+        self.eq('|a3 b\nc1 a\nzz\nd2 c', ':sort /\\d/ r', '|zz\nc1 a\nd2 c\na3 b')
+        self.eq('|a3 b\nc1 a\nzz\nd2 c', ':sort! /\\d/ r', '|a3 b\nd2 c\nc1 a\nzz')
+        self.eq('|a3 b\nc1 a\nzz\nd2 c', ':sort n /\\w/', '|zz\nc1 a\nd2 c\na3 b')
+        self.eq('|abz bc\nbd\nxb ba', ':sort /\\<b/', '|xb ba\nabz bc\nbd')
+
+    def test_sort_pattern_uses_ignorecase(self):
+        self.set_option('ignorecase', False)
+        self.eq('|aX2\nbx1', ':sort /x/', '|aX2\nbx1')
+        self.set_option('ignorecase', True)
+        self.eq('|aX2\nbx1', ':sort /x/', '|bx1\naX2')
+        self.set_option('smartcase', True)
+        self.eq('|aX2\nbx1', ':sort /X/', '|bx1\naX2')
 
     def test_v_sort(self):
         self.eq('9\n|7\n3\n5|\n1', ":'<,'>sort", 'n_9\n|3\n5\n7\n1')
         self.eq('9\n|7\n    3\n5|\n1', ":'<,'>sort", 'n_9\n    |3\n5\n7\n1')
-        self.eq('6\n7\n|1\nb\n1\nb\na\nA\na\nB|\n2\n3', ":'<,'>sort iu", 'n_6\n7\n|1\na\nA\nb\nB\n2\n3')
+        self.eq('6\n7\n|1\nb\n1\nb\na\nA\na\nB|\n2\n3', ":'<,'>sort iu", 'n_6\n7\n|1\na\nb\n2\n3')
 
     def test_sort_undo_glues_groups(self):
         self.normal('|b\n3\na\n3\nb\n3\nA\n1\nB')
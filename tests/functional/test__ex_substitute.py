@@ -67,6 +67,9 @@ class Test_ex_substitute(unittest.FunctionalTestCase):
         self.set_option('ignorecase', False)
         self.eq('|aA', ':s/a/x/gI', '|xA')
 
+    def test_word_boundaries(self):
+        self.eq('|foo <foo> foobar', ':s/\\<foo\\>/x/g', '|x <x> foobar')
+
     def test_smartcase(self):
         self.set_option('ignorecase', True)
         self.set_option('smartcase', True)
@@ -87,6 +90,8 @@ class Test_ex_substitute(unittest.FunctionalTestCase):
         self.eq('xx\n|xx\nxx\nxx\nxx', ':2,4substitute/x/y/', 'xx\nyx\nyx\n|yx\nxx')
         self.eq('xx\n|xx\nxx\nxx\nxx', ':1,3substitute/x/y/', 'yx\nyx\n|yx\nxx\nxx')
         self.eq('xx\n|xx\nxx\nxx\nxx', ':2,4substitute/x/y/g', 'xx\nyy\nyy\n|yy\nxx')
+        self.eq('xx\n|xx\nxx\nxx\nxx', ':2,4substitute/x/yyy/g', 'xx\nyyyyyy\nyyyyyy\n|yyyyyy\nxx')
+        self.eq('xx\n|xx\nxx\nxx\nxx', ':2,4substitute/xx//', 'xx\n\n\n|\nxx')
 
     def test_in_visual_mode(self):
         self.eq('xx\n|xx\nxx\nxx|\nxx', ':\'<,\'>substitute/x/y/g', 'n_xx\nyy\nyy\n|yy\nxx')
@@ -114,6 +119,53 @@ class Test_ex_substitute(unittest.FunctionalTestCase):
         self.eq('a|bc', ':substitute', 'a|bc')
         self.assertStatusMessage('E33: No previous substitute regular expression')
 
+    def answer_confirm(self, *answers):
+        for answer in answers:
+            self.view.run_command('nv_view', {'action': 'substitute_confirm', 'answer': answer})
+
+    @unittest.mock.patch('sublime.Window.show_quick_panel')
+    def test_confirm(self, show_quick_panel):
+        self.normal('|xx\nxx\nxx\n')
+        self.feed(':%substitute/x/y/gc')
+        self.assertEqual(1, show_quick_panel.call_count)
+        self.answer_confirm('y', 'n', 'y')
+        self.assertContent('xx\nxx\nxx\n')
+        self.assertEqual([self.Region(4, 5)], self.view.get_regions('s_confirm'))
+        self.assertEqual([self.Region(0, 1), self.Region(3, 4)], self.view.get_regions('s_confirm_accepted'))
+        self.assertEqual(4, show_quick_panel.call_count)
+        self.answer_confirm('a')
+        self.assertContent('yx\nyy\nyy\n')
+        self.assertEqual(4, show_quick_panel.call_count)
+        self.assertEqual([], self.view.get_regions('s_confirm'))
+        self.assertEqual([], self.view.get_regions('s_confirm_accepted'))
+
+    @unittest.mock.patch('sublime.Window.show_quick_panel')
+    def test_confirm_last_and_quit(self, show_quick_panel):
+        self.normal('|xx\nxx\nxx\n')
+        self.feed(':%substitute/x/yy/gc')
+        self.answer_confirm('n', 'l')
+        self.assertContent('xyy\nxx\nxx\n')
+        self.feed(':%substitute/x/yy/c')
+        self.answer_confirm('y', 'q')
+        self.assertContent('yyyy\nxx\nxx\n')
+        self.assertEqual(4, show_quick_panel.call_count)
+
+    @unittest.mock.patch('sublime.Window.show_quick_panel')
+    def test_confirm_is_undone_in_one_step(self, show_quick_panel):
+        self.normal('|xx\nxx\nxx\n')
+        self.feed(':%substitute/x/y/gc')
+        self.answer_confirm('y', 'n', 'y', 'a')
+        self.assertContent('yx\nyy\nyy\n')
+        self.feed('u')
+        self.assertContent('xx\nxx\nxx\n')
+
+    @unittest.mock_status_message()
+    def test_reports_substitutions(self):
+        self.eq('|xx\nxx\nyy\n', ':%substitute/x/z/g', 'zz\nzz\n|yy\n')
+        self.assertStatusMessage('4 substitutions on 2 lines')
+        self.eq('|xxx\nyy\n', ':%substitute/x/z/g', 'zzz\n|yy\n')
+        self.assertStatusMessage('3 substitutions on 1 line')
+
     def test_repeat(self):
         self.eq('|abc abc', ':substitute/b/x/', '|axc abc')
         self.eq('|abc abc', ':substitute', '|axc abc')
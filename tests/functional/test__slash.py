@@ -183,6 +183,21 @@ class Test_slash_cmdline_prompt(unittest.FunctionalTestCase):
         self.assertSearchCurrent('x |buz| x buz x')
         self.assertSearchIncremental('x buz x |buz| x')
 
+    @unittest.mock.patch('NeoVintageous.nv.cmdline_search.set_timeout')
+    @unittest.mock.patch('NeoVintageous.nv.commands.history_update')
+    @unittest.mock.patch('NeoVintageous.nv.cmdline_search.Cmdline')
+    def test_on_change_with_incsearch_delay(self, cmdline, history_update, set_timeout):
+        self.set_setting('incsearch_delay', 100)
+        self.normal('x b|uz x buz x')
+        self.initCmdlineSearchMock(cmdline, '/', 'on_change', 'buz')
+        self.feed('n_/')
+        self.assertSearch('x buz x buz x')
+        self.assertSearchIncremental('x buz x |buz| x')
+        set_timeout.call_args[0][0]()
+        self.assertSearch('x |buz| x |buz| x')
+        self.assertSearchCurrent('x |buz| x buz x')
+        self.assertSearchIncremental('x buz x |buz| x')
+
     @unittest.mock_status_message()
     @unittest.mock.patch('NeoVintageous.nv.commands.history_update')
     @unittest.mock.patch('NeoVintageous.nv.cmdline_search.Cmdline')
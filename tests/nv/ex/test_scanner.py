@@ -257,7 +257,7 @@ class TestScanner(unittest.TestCase):
     def test_can_scan_empty_range(self):
         scanner = Scanner("s")
         tokens = list(scanner.scan())
-        self.assertEqual([TokenCommand('substitute', addressable=True), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True), TokenEof()], tokens)  # noqa: E501
         self.assertEqual(1, scanner.state.position)
 
     def test_whitespace_is_ingored(self):
@@ -321,19 +321,19 @@ class TestScannerCommandName(unittest.TestCase):
     def test_can_instantiate(self):
         scanner = Scanner("substitute")
         tokens = list(scanner.scan())
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=None), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=None), TokenEof()], tokens)  # noqa: E501
 
     def test_can_scan_substitute_paramaters(self):
         scanner = Scanner("substitute:foo:bar:")
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": [], "count": 1}
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
     def test_can_scan_substitute_paramaters_with_flags(self):
         scanner = Scanner("substitute:foo:bar:r")
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": ['r'], "count": 1}
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
     def test_scan_can_fail_if_substitute_paramaters_flags_have_wrong_order(self):
         scanner = Scanner("substitute:foo:bar:r&")
@@ -343,13 +343,13 @@ class TestScannerCommandName(unittest.TestCase):
         scanner = Scanner("substitute:foo:bar: 10")
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": [], "count": 10}
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
     def test_can_scan_substitute_paramater_with_range(self):
         scanner = Scanner(r'%substitute:foo:bar: 10')
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": [], "count": 10}
-        self.assertEqual([TokenPercent(), TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)  # noqa: E501
+        self.assertEqual([TokenPercent(), TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
 
 class TestScannerMarksScanner(unittest.TestCase):
@@ -516,9 +516,9 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['cd'], cmd('cd'))
         self.assertCommand(['close!', 'clo!'], cmd('close', forced=True))
         self.assertCommand(['close', 'clo'], cmd('close'))
-        self.assertCommand(['copy .', 'co .'], cmd('copy', params={'address': '.'}, addressable=True))
-        self.assertCommand(['copy .+3', 'co .+3'], cmd('copy', params={'address': '.+3'}, addressable=True))
-        self.assertCommand(['copy', 'co'], cmd('copy', addressable=True))
+        self.assertCommand(['copy .', 'co .'], cmd('copy', params={'address': '.'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['copy .+3', 'co .+3'], cmd('copy', params={'address': '.+3'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['copy', 'co'], cmd('copy', addressable=True, cooperates_with_global=True))
         self.assertCommand(['cquit', 'cq'], cmd('cquit'))
         self.assertCommand(['delete x', 'd x'], cmd('delete', params={'count': None, 'register': 'x'}, addressable=True, cooperates_with_global=True))  # noqa: E501
         self.assertCommand(['delete', 'd'], cmd('delete', params={'count': None, 'register': '"'}, addressable=True, cooperates_with_global=True))  # noqa: E501
@@ -549,9 +549,9 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['inoremap', 'ino'], cmd('inoremap'))
         self.assertCommand(['let n=v'], cmd('let', params={'name': 'n', 'value': 'v'}))
         self.assertCommand(['marks'], cmd('marks'))
-        self.assertCommand(['move .', 'm .'], cmd('move', params={'address': '.'}, addressable=True))
-        self.assertCommand(['move 3', 'm 3'], cmd('move', params={'address': '3'}, addressable=True))
-        self.assertCommand(['move', 'm'], cmd('move', addressable=True))
+        self.assertCommand(['move .', 'm .'], cmd('move', params={'address': '.'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['move 3', 'm 3'], cmd('move', params={'address': '3'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['move', 'm'], cmd('move', addressable=True, cooperates_with_global=True))
         self.assertCommand(['new /tmp/fizz/buzz.txt'], cmd('new', params={'file': '/tmp/fizz/buzz.txt'}))  # noqa: E501
         self.assertCommand(['new file.txt'], cmd('new', params={'file': 'file.txt'}))
         self.assertCommand(['new tmp/file.txt'], cmd('new', params={'file': 'tmp/file.txt'}))
@@ -615,17 +615,22 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['sort! iu', 'sor! iu'], cmd('sort', params={'options': 'iu'}, forced=True, addressable=True))  # noqa: E501
         self.assertCommand(['sort!', 'sor!'], cmd('sort', forced=True, addressable=True))
         self.assertCommand(['sort', 'sor'], cmd('sort', addressable=True))
+        self.assertCommand(['sort n', 'sor n'], cmd('sort', params={'options': 'n'}, addressable=True))
+        self.assertCommand(['sort /x/', 'sor/x/'], cmd('sort', params={'pattern': 'x'}, addressable=True))
+        self.assertCommand(['sort //', 'sor //'], cmd('sort', params={'pattern': ''}, addressable=True))
+        self.assertCommand(['sort n /x/ u', 'sor n/x/u'], cmd('sort', params={'options': 'nu', 'pattern': 'x'}, addressable=True))  # noqa: E501
+        self.assertCommand(['sort /a\\/b/ r', 'sor/a\\/b/r'], cmd('sort', params={'options': 'r', 'pattern': 'a\\/b'}, addressable=True))  # noqa: E501
         self.assertCommand(['spellgood fizz', 'spe fizz'], cmd('spellgood', params={'word': 'fizz'}))
         self.assertCommand(['spellundo fizz', 'spellu fizz'], cmd('spellundo', params={'word': 'fizz'}))
         self.assertCommand(['split /tmp/fizz/buzz.txt', 'sp /tmp/fizz/buzz.txt'], cmd('split', params={'file': '/tmp/fizz/buzz.txt'}))  # noqa: E501
         self.assertCommand(['split file.txt', 'sp file.txt'], cmd('split', params={'file': 'file.txt'}))
         self.assertCommand(['split tmp/file.txt', 'sp tmp/file.txt'], cmd('split', params={'file': 'tmp/file.txt'}))
         self.assertCommand(['split', 'sp'], cmd('split'))
-        self.assertCommand(['substitute', 's'], cmd('substitute', addressable=True))
-        self.assertCommand(['substitute/x/', 's/x/'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True))  # noqa: E501
-        self.assertCommand(['substitute/x//', 's/x//'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True))  # noqa: E501
-        self.assertCommand(['substitute/x/y/', 's/x/y/'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': [], 'count': 1}, addressable=True))  # noqa: E501
-        self.assertCommand(['substitute/x/y/ic', 's/x/y/ic'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': ['i', 'c'], 'count': 1}, addressable=True))  # noqa: E501
+        self.assertCommand(['substitute', 's'], cmd('substitute', addressable=True, cooperates_with_global=True))
+        self.assertCommand(['substitute/x/', 's/x/'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['substitute/x//', 's/x//'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['substitute/x/y/', 's/x/y/'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': [], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['substitute/x/y/ic', 's/x/y/ic'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': ['i', 'c'], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
         self.assertCommand(['sunmap xyz', 'sunm xyz'], cmd('sunmap', params={'lhs': 'xyz'}))
         self.assertCommand(['tabNext 11', 'tabN 11', 'tabprevious 11', 'tabp 11'], cmd('tabprevious', params={'count': 11}))  # noqa: E501
         self.assertCommand(['tabNext', 'tabN', 'tabprevious', 'tabp'], cmd('tabprevious'))
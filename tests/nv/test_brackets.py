@@ -0,0 +1,107 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.brackets import find_closing_bracket
+from NeoVintageous.nv.brackets import find_opening_bracket
+from NeoVintageous.nv.brackets import get_single_char_brackets
+from NeoVintageous.nv.session import get_session_view_value
+
+
+class TestFindBracket(unittest.ViewTestCase):
+
+    def find_closing(self, pt: int, count: int = 1, **kwargs):
+        return find_closing_bracket(self.view, pt, '(', ')', count, **kwargs)
+
+    def find_opening(self, pt: int, count: int = 1, **kwargs):
+        return find_opening_bracket(self.view, pt, '(', ')', count, **kwargs)
+
+    def test_find_closing(self):
+        self.write('(a (b) \\) (c (d)) e)')
+        self.assertEqual(19, self.find_closing(1, escapable=True))
+        self.assertEqual(5, self.find_closing(4, escapable=True))
+        self.assertEqual(19, self.find_closing(6, escapable=True))
+        self.assertEqual(16, self.find_closing(11, escapable=True))
+        self.assertEqual(15, self.find_closing(14, escapable=True))
+        self.assertEqual(16, self.find_closing(14, 2, escapable=True))
+        self.assertEqual(19, self.find_closing(14, 3, escapable=True))
+        self.assertIsNone(self.find_closing(14, 4, escapable=True))
+        self.assertIsNone(self.find_closing(20, escapable=True))
+
+    def test_find_opening(self):
+        self.write('(a (b) \\( (c (d)) e)')
+        self.assertIsNone(self.find_opening(0, escapable=True))
+        self.assertEqual(0, self.find_opening(1, escapable=True))
+        self.assertEqual(3, self.find_opening(4, escapable=True))
+        self.assertEqual(0, self.find_opening(6, escapable=True))
+        self.assertEqual(0, self.find_opening(9, escapable=True))
+        self.assertEqual(13, self.find_opening(14, escapable=True))
+        self.assertEqual(10, self.find_opening(14, 2, escapable=True))
+        self.assertEqual(0, self.find_opening(14, 3, escapable=True))
+        self.assertIsNone(self.find_opening(14, 4, escapable=True))
+
+    @unittest.mock.patch('NeoVintageous.nv.brackets._WINDOW_SIZE', 2)
+    def test_windows_grow_until_the_bracket_is_found(self):
+        self.test_find_closing()
+        self.test_find_opening()
+
+    def test_unmatched(self):
+        self.write('a) (b')
+        self.assertEqual(1, self.find_closing(0))
+        self.assertIsNone(self.find_closing(2))
+        self.assertEqual(3, self.find_opening(5))
+        self.assertIsNone(self.find_opening(4, 2))
+
+    @unittest.mock.patch('sublime.View.match_selector')
+    def test_selector(self, match_selector):
+        match_selector.side_effect = lambda pt, selector: pt not in (5, 12)
+        self.write('(a (")" b) ")" c)')
+        self.assertEqual(16, self.find_closing(1, selector='punctuation'))
+        self.assertEqual(0, self.find_opening(16, selector='punctuation'))
+        self.assertEqual(3, self.find_opening(9, selector='punctuation'))
+        self.assertIsNone(self.find_closing(17, selector='punctuation'))
+        self.assertEqual(5, self.find_closing(4))
+
+    @unittest.mock.patch('NeoVintageous.nv.brackets._WINDOW_SIZE', 8)
+    def test_index_is_local_to_the_query(self):
+        self.write('(' + 'x' * 100 + '(a)' + 'x' * 100 + ')')
+        self.assertEqual(103, self.find_closing(102))
+        index = get_session_view_value(self.view, 'bracket_index')[('(', ')', False, None)]
+        self.assertEqual((94, 110), (index.region.a, index.region.b))
+        self.assertEqual(204, self.find_closing(104))
+        self.assertEqual(0, self.find_opening(104))
+
+    def test_index_is_rebuilt_when_the_view_changes(self):
+        self.write('(a)')
+        self.assertEqual(2, self.find_closing(1))
+        index = get_session_view_value(self.view, 'bracket_index')[('(', ')', False, None)]
+        self.assertEqual(2, self.find_closing(1))
+        self.assertIs(index, get_session_view_value(self.view, 'bracket_index')[('(', ')', False, None)])
+        self.write('((a)')
+        self.assertIsNone(self.find_closing(1))
+        self.assertIsNot(index, get_session_view_value(self.view, 'bracket_index')[('(', ')', False, None)])
+
+
+class TestGetSingleCharBrackets(unittest.TestCase):
+
+    def test_get_single_char_brackets(self):
+        self.assertEqual(('(', ')'), get_single_char_brackets(('\\(', '\\)')))
+        self.assertEqual(('<', '>'), get_single_char_brackets(('<', '>')))
+        self.assertIsNone(get_single_char_brackets(('\\w', '\\W')))
+        self.assertIsNone(get_single_char_brackets(('"', '"')))
+        self.assertIsNone(get_single_char_brackets(('<<', '>>')))
@@ -26,6 +26,8 @@ from NeoVintageous.tests import unittest
 
 from NeoVintageous.nv.cmdline import CmdlineOutput
 from NeoVintageous.nv.events import NeoVintageousEvents
+from NeoVintageous.nv.events import get_query_context_counts
+from NeoVintageous.nv.events import profile_query_context
 
 
 class TestCommandModeAware(unittest.ViewTestCase):
@@ -66,15 +68,15 @@ class TestCommandModeAware(unittest.ViewTestCase):
             self.assertEqual(False, self.events.on_query_context(panel, key, OP_EQUAL, True, True))
 
     @unittest.mock.patch('NeoVintageous.nv.events.is_view')
-    def test_is_command_mode_should_return_early_if_not_in_command_mode(self, is_view):
+    def test_is_command_mode_is_cached_until_settings_change(self, is_view):
         self.settings().set('command_mode', True)
         for key in self.KEYS:
             self.events.on_query_context(self.view, key, OP_EQUAL, True, True)
-        self.assertEqual(is_view.call_count, 2)
+        self.assertEqual(is_view.call_count, 1)
         self.settings().set('command_mode', False)
         for key in self.KEYS:
             self.events.on_query_context(self.view, key, OP_EQUAL, True, True)
-        self.assertEqual(is_view.call_count, 3)
+        self.assertEqual(is_view.call_count, 2)
 
 
 class TestInsertModeAware(unittest.ViewTestCase):
@@ -121,15 +123,15 @@ class TestInsertModeAware(unittest.ViewTestCase):
             self.assertEqual(False, self.events.on_query_context(self.view, key, OP_REGEX_MATCH, False, True))  # noqa: E501
 
     @unittest.mock.patch('NeoVintageous.nv.events.is_view')
-    def test_is_insert_mode_should_return_early_if_not_command_mode(self, is_view):
+    def test_is_insert_mode_is_cached_until_settings_change(self, is_view):
         self.settings().set('command_mode', False)
         for key in self.KEYS:
             self.events.on_query_context(self.view, key, OP_EQUAL, True, False)
-        self.assertEqual(is_view.call_count, 2)
+        self.assertEqual(is_view.call_count, 1)
         self.settings().set('command_mode', True)
         for key in self.KEYS:
             self.events.on_query_context(self.view, key, OP_EQUAL, True, False)
-        self.assertEqual(is_view.call_count, 3)
+        self.assertEqual(is_view.call_count, 2)
 
     def test_query_contexts_can_be_disabled_by_external_plugins(self):
         self.settings().set('command_mode', True)
@@ -191,6 +193,17 @@ class TestOnQueryContextDisabledOrIgnored(unittest.ViewTestCase):
         self.assertEqual(None, self.events.on_query_context(self.view, 'foo', OP_EQUAL, False, True))
         self.assertEqual(None, self.events.on_query_context(self.view, 'foo', OP_NOT_EQUAL, False, True))
 
+    def test_profile_query_context(self):
+        profile_query_context()
+        try:
+            self.events.on_query_context(self.view, 'foo', OP_EQUAL, True, True)
+            self.events.on_query_context(self.view, 'vi_command_mode_aware', OP_EQUAL, True, True)
+            self.events.on_query_context(self.view, 'foo', OP_EQUAL, True, True)
+            self.assertEqual([('foo', 2), ('vi_command_mode_aware', 1)], get_query_context_counts())
+        finally:
+            profile_query_context(False)
+        self.assertEqual([], get_query_context_counts())
+
 
 class TestOnQueryContextHandleKey(unittest.ViewTestCase):
 
@@ -132,7 +132,7 @@ class Test_ex_route_substitute(unittest.TestCase):
 
     def test_none(self):
         actual = _ex_route_substitute(_ScannerState(''))
-        self.assertEqual(actual, TokenCommand('substitute', addressable=True))
+        self.assertEqual(actual, TokenCommand('substitute', addressable=True, cooperates_with_global=True))
 
     def test_raises_exception(self):
         with self.assertRaisesRegex(ValueError, 'bad command'):
@@ -144,7 +144,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def _test_ex_route_substitute(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -155,7 +155,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def test_empty(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('///')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': '',
                 'replacement': '',
                 'count': 1,
@@ -166,7 +166,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def test_flags(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/g')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -176,7 +176,7 @@ class Test_ex_route_substitute(unittest.TestCase):
 
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/i')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -186,7 +186,7 @@ class Test_ex_route_substitute(unittest.TestCase):
 
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/gi')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -197,7 +197,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def test_closing_delimiter_is_not_required(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -31,9 +31,11 @@ from NeoVintageous.nv.mappings import _has_partial_matches
 from NeoVintageous.nv.mappings import _seq_to_command
 from NeoVintageous.nv.mappings import _seq_to_mapping
 from NeoVintageous.nv.mappings import clear_mappings
+from NeoVintageous.nv.mappings import compile_keymaps
 from NeoVintageous.nv.mappings import mappings_add
 from NeoVintageous.nv.mappings import mappings_remove
 from NeoVintageous.nv.mappings import mappings_resolve
+from NeoVintageous.nv.mappings import mappings_resolve_key
 from NeoVintageous.nv.plugin_commentary import CommentaryLines
 from NeoVintageous.nv.plugin_sneak import SneakS
 from NeoVintageous.nv.plugin_surround import SurroundS
@@ -279,6 +281,24 @@ class TestMappings(unittest.ViewTestCase):
         self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'fj1'))
         self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 't'))
 
+    @unittest.mock_mappings()
+    def test_find_partial_match_sees_mappings_added_after_lookup(self):
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'q'))
+        mappings_add(unittest.NORMAL, 'qa', 'g')
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 'q'))
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 'qa'))
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'qb'))
+        clear_mappings()
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'q'))
+
+    @unittest.mock_mappings()
+    def test_find_partial_match_lone_less_than(self):
+        mappings_add(unittest.NORMAL, '<C-w>', 'g')
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, '<'))
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, '<C'))
+        mappings_add(unittest.NORMAL, '<lt>x', 'g')
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, '<'))
+
     @unittest.mock_mappings()
     def test_find_full_match(self):
         self.assertEqual(_find_full_match(self.view, unittest.NORMAL, ''), None)
@@ -329,6 +349,19 @@ class TestMappings(unittest.ViewTestCase):
         self.assignFileName('test.go')
         self.assertEqual(_find_full_match(self.view, unittest.NORMAL, 'xd'), 'ahtmlgo')
 
+    @unittest.mock_mappings()
+    def test_find_full_match_sees_mappings_added_after_compile(self):
+        mappings_add(unittest.NORMAL, 'xd', 'abc')
+        self.assertIsInstance(compile_keymaps(), float)
+        self.assertEqual(_find_full_match(self.view, unittest.NORMAL, 'xd'), 'abc')
+        mappings_add(unittest.NORMAL, 'xd', 'def')
+        mappings_add(unittest.NORMAL, 'FileType', 'php xd ghi')
+        self.assertEqual(_find_full_match(self.view, unittest.NORMAL, 'xd'), 'def')
+        self.assignFileName('test.php')
+        self.assertEqual(_find_full_match(self.view, unittest.NORMAL, 'xd'), 'ghi')
+        clear_mappings()
+        self.assertEqual(_find_full_match(self.view, unittest.NORMAL, 'xd'), None)
+
     @unittest.mock_mappings()
     @unittest.mock.patch('NeoVintageous.nv.mappings.get_partial_sequence')
     @unittest.mock.patch('NeoVintageous.nv.mappings.get_mode')
@@ -513,3 +546,59 @@ class TestSeqToCommand(unittest.TestCase):
             def settings(self):
                 pass
         self.assertIsInstance(_seq_to_command(seq='foobar', view=View(), mode='a'), CommandNotFound)
+
+
+class TestResolveKey(unittest.ViewTestCase):
+
+    @unittest.mock_mappings()
+    @unittest.mock.patch('NeoVintageous.nv.mappings.get_partial_text')
+    @unittest.mock.patch('NeoVintageous.nv.mappings.get_partial_sequence')
+    @unittest.mock.patch('NeoVintageous.nv.mappings.get_mode')
+    def test_resolve_key(self, get_mode, get_partial_sequence, get_partial_text):
+        get_mode.return_value = NORMAL
+        get_partial_sequence.return_value = ''
+        get_partial_text.return_value = []
+        mappings_add(NORMAL, 'aa', 'y')
+        mappings_add(NORMAL, 'b', 'x')
+
+        res = mappings_resolve_key(self.view, 'a')
+        self.assertFalse(res.can_resolve_text)
+        self.assertTrue(res.can_resolve_seq)
+        self.assertEqual(res.part_seq, 'a')
+        self.assertEqual(res.part_text, ['a'])
+        self.assertIsInstance(res.cmd_seq, IncompleteMapping)
+
+        res = mappings_resolve_key(self.view, 'b')
+        self.assertTrue(res.can_resolve_seq)
+        self.assertIsInstance(res.cmd_seq, Mapping)
+        self.assertEqual(res.cmd_seq.rhs, 'x')
+
+        get_partial_sequence.return_value = 'a'
+        get_partial_text.return_value = ['a']
+        res = mappings_resolve_key(self.view, 'a')
+        self.assertEqual(res.part_seq, 'aa')
+        self.assertIsInstance(res.cmd_seq, Mapping)
+        self.assertEqual(res.cmd_seq.rhs, 'y')
+
+        get_partial_sequence.return_value = ''
+        get_partial_text.return_value = []
+        res = mappings_resolve_key(self.view, 'w')
+        self.assertFalse(res.can_resolve_seq)
+        self.assertIsInstance(res.cmd_seq, ViMoveByWords)
+        self.assertIs(res.resolve_sequence('w'), res.cmd_seq)
+        self.assertIsInstance(res.resolve_sequence('e'), ViMoveByWordEnds)
+
+    @unittest.mock_mappings()
+    @unittest.mock.patch('NeoVintageous.nv.mappings.get_partial_text')
+    @unittest.mock.patch('NeoVintageous.nv.mappings.get_partial_sequence')
+    @unittest.mock.patch('NeoVintageous.nv.mappings.get_mode')
+    def test_resolve_key_without_user_mappings(self, get_mode, get_partial_sequence, get_partial_text):
+        get_mode.return_value = NORMAL
+        get_partial_sequence.return_value = ''
+        get_partial_text.return_value = []
+        mappings_add(NORMAL, 'w', 'b')
+        res = mappings_resolve_key(self.view, 'w', check_user_mappings=False)
+        self.assertTrue(res.can_resolve_seq)
+        self.assertIsInstance(res.cmd_seq, ViMoveByWords)
+        self.assertIsInstance(res.resolve_sequence('w', check_user_mappings=False), ViMoveByWords)
+        self.assertIsInstance(res.resolve_sequence('w'), Mapping)
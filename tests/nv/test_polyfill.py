@@ -16,10 +16,16 @@
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
 
+from sublime import IGNORECASE
+from sublime import LITERAL
+from sublime import View
+
 from NeoVintageous.tests import unittest
 
 from NeoVintageous.nv.polyfill import view_find
+from NeoVintageous.nv.polyfill import view_find_all_in_range
 from NeoVintageous.nv.polyfill import view_find_in_range
+from NeoVintageous.nv.polyfill import view_rfind_all
 
 
 class TestViewFind(unittest.ViewTestCase):
@@ -54,3 +60,78 @@ class TestViewFindInRange(unittest.ViewTestCase):
         self.normal('|fizz buzz')
         self.assertIsNone(view_find_in_range(self.view, 'x', 0, 9))
         self.assertIsNone(view_find_in_range(self.view, 'u', 1, 6))
+
+    def test_match_at_line_boundaries(self):
+        self.normal('|fizz buzz\nbuzz fizz')
+        self.assertRegion(view_find_in_range(self.view, '^buzz', 1, 19), (10, 14))
+        self.assertRegion(view_find_in_range(self.view, 'buzz$', 1, 19), (5, 9))
+        self.assertRegion(view_find_in_range(self.view, '\\bfizz', 1, 19), (15, 19))
+        self.assertIsNone(view_find_in_range(self.view, '^fizz', 1, 19))
+
+    def test_long_line(self):
+        self.normal('|' + 'fizz ' * 20000 + 'buzz')
+        with unittest.mock.patch('sublime.View.substr', autospec=True, side_effect=View.substr) as substr:
+            self.assertRegion(view_find_in_range(self.view, '^fizz', 0, 9), (0, 4))
+            self.assertRegion(view_find_in_range(self.view, '\\bfizz\\b', 1, 9), (5, 9))
+            self.assertRegion(view_find_in_range(self.view, 'i', 50001, 50009), (50001, 50002))
+            self.assertIsNone(view_find_in_range(self.view, '^fizz', 50000, 50009))
+            self.assertRegion(view_find_in_range(self.view, 'buzz$', 99990, 100004), (100000, 100004))
+
+        self.assertLess(max(region.size() for (_, region), _ in substr.call_args_list), 20)
+
+    def test_literal(self):
+        self.normal('|f.zz fizz')
+        self.assertRegion(view_find_in_range(self.view, 'i', 0, 9, LITERAL), (6, 7))
+        self.assertRegion(view_find_in_range(self.view, '.', 0, 9, LITERAL), (1, 2))
+        self.assertRegion(view_find_in_range(self.view, 'F', 2, 9, LITERAL | IGNORECASE), (5, 6))
+
+    def test_word_boundaries(self):
+        self.normal('|a foo <foo> foobar')
+        self.assertRegion(view_find_in_range(self.view, '\\<foo\\>', 0, 18), (2, 5))
+        self.assertRegion(view_find_in_range(self.view, '\\<foo\\>', 3, 18), (7, 10))
+        self.assertIsNone(view_find_in_range(self.view, '\\<foo\\>', 8, 18))
+
+
+class TestViewFindAllInRange(unittest.ViewTestCase):
+
+    def test_match(self):
+        self.normal('|fizz buzz\nfizz buzz')
+        self.assertEqual(view_find_all_in_range(self.view, 'z+', 0, 19), [
+            self.Region(2, 4), self.Region(7, 9), self.Region(12, 14), self.Region(17, 19)])
+        self.assertEqual(view_find_all_in_range(self.view, 'z+', 3, 13), [self.Region(3, 4), self.Region(7, 9)])
+        self.assertEqual(view_find_all_in_range(self.view, 'x', 0, 19), [])
+
+    def test_zero_length_match(self):
+        self.normal('|fizz\nbuzz\n')
+        self.assertEqual(view_find_all_in_range(self.view, '^', 0, 10), [
+            self.Region(0, 0), self.Region(5, 5), self.Region(10, 10)])
+
+    def test_patterns_that_python_does_not_support(self):
+        self.normal('|fizz buzz')
+        self.assertEqual(view_find_all_in_range(self.view, '[[:alpha:]]++', 0, 9), [
+            self.Region(0, 4), self.Region(5, 9)])
+
+    def test_word_boundaries(self):
+        self.normal('|a foo <foo> foobar')
+        self.assertEqual(view_find_all_in_range(self.view, '\\<foo\\>', 0, 18), [
+            self.Region(2, 5), self.Region(7, 10)])
+
+
+class TestViewRfindAll(unittest.ViewTestCase):
+
+    def test_nearest_first(self):
+        self.normal('|fizz buzz\nfizz buzz')
+        self.assertEqual(list(view_rfind_all(self.view, 'z', 19)), [
+            self.Region(18, 19), self.Region(17, 18), self.Region(13, 14), self.Region(12, 13),
+            self.Region(8, 9), self.Region(7, 8), self.Region(3, 4), self.Region(2, 3)])
+        self.assertEqual(list(view_rfind_all(self.view, 'fizz', 13)), [self.Region(0, 4)])
+        self.assertEqual(list(view_rfind_all(self.view, 'x', 19)), [])
+
+    @unittest.mock.patch('NeoVintageous.nv.polyfill._RFIND_WINDOW_SIZE', 4)
+    def test_windows(self):
+        self.normal('|fizz\nbuzz\nfizz\nbuzz\nfizz\nbuzz\n')
+        self.assertEqual(list(view_rfind_all(self.view, 'fizz', 30)), [
+            self.Region(20, 24), self.Region(10, 14), self.Region(0, 4)])
+        self.assertEqual(list(view_rfind_all(self.view, 'z\nb', 30)), [
+            self.Region(23, 26), self.Region(13, 16), self.Region(3, 6)])
+        self.assertEqual(next(view_rfind_all(self.view, 'buzz', 28)), self.Region(15, 19))
@@ -17,6 +17,12 @@
 
 from NeoVintageous.tests import unittest
 
+from NeoVintageous.nv.search import _search_patterns
+from NeoVintageous.nv.search import add_search_highlighting
+from NeoVintageous.nv.search import clear_search_highlighting
+from NeoVintageous.nv.search import compile_search_pattern
+from NeoVintageous.nv.search import get_search_index
+from NeoVintageous.nv.search import get_search_occurrences
 from NeoVintageous.nv.search import process_search_pattern
 from NeoVintageous.nv.search import process_word_search_pattern
 
@@ -37,6 +43,41 @@ class Test_flags(unittest.ViewTestCase):
         self.set_option('magic', False)
         self.assertEqual(('[0-9]', 3), process_search_pattern(self.view, '[0-9]'))
 
+    def test_process_search_pattern_is_cached(self):
+        self.set_option('ignorecase', False)
+        self.set_option('magic', True)
+        self.assertEqual(('[0-9]', 0), process_search_pattern(self.view, '[0-9]'))
+        hits = _search_patterns.hits
+        self.assertEqual(('[0-9]', 0), process_search_pattern(self.view, '[0-9]'))
+        self.assertEqual(hits + 1, _search_patterns.hits)
+        self.set_option('ignorecase', True)
+        self.assertEqual(('[0-9]', 2), process_search_pattern(self.view, '[0-9]'))
+
+    def test_compile_search_pattern(self):
+        self.set_option('ignorecase', False)
+        self.set_option('smartcase', False)
+        self.set_option('magic', True)
+        self.assertEqual(['foo', 'foo'], compile_search_pattern(self.view, '\\<foo\\>').findall('foo <foo> foobar'))
+        self.assertEqual(['(', '('], compile_search_pattern(self.view, '(').findall('a(b('))
+        self.assertEqual(['x'], compile_search_pattern(self.view, 'x').findall('xX'))
+        self.assertEqual(['x', 'X'], compile_search_pattern(self.view, 'x', ignorecase=True).findall('xX'))
+        self.assertEqual(['x', 'X'], compile_search_pattern(self.view, '\\cx').findall('xX'))
+        self.set_option('ignorecase', True)
+        self.assertEqual(['x', 'X'], compile_search_pattern(self.view, 'x').findall('xX'))
+        self.assertEqual(['x'], compile_search_pattern(self.view, 'x', ignorecase=False).findall('xX'))
+        self.set_option('smartcase', True)
+        self.assertEqual(['X'], compile_search_pattern(self.view, 'X').findall('xX'))
+
+    def test_compile_search_pattern_is_cached_with_the_search_pattern(self):
+        self.set_option('ignorecase', False)
+        self.set_option('magic', True)
+        regex = compile_search_pattern(self.view, 'a+')
+        hits = _search_patterns.hits
+        self.assertIs(regex, compile_search_pattern(self.view, 'a+'))
+        self.assertEqual(('a+', 0), process_search_pattern(self.view, 'a+'))
+        self.assertEqual(hits + 2, _search_patterns.hits)
+        self.assertIsNot(regex, compile_search_pattern(self.view, 'a+', ignorecase=True))
+
     def test_process_search_pattern_non_regex_in_magic_mode(self):
         self.set_option('ignorecase', False)
         self.set_option('magic', True)
@@ -71,3 +112,61 @@ class Test_flags(unittest.ViewTestCase):
         self.set_option('magic', False)
         self.set_option('ignorecase', True)
         self.assertEqual(('\\bfizz\\b', 2), process_word_search_pattern(self.view, 'fizz'))
+
+
+class TestSearchIndex(unittest.ViewTestCase):
+
+    def test_index_is_reused_until_the_buffer_changes(self):
+        self.write('xxx\naaa xxx aaa xxx')
+        index = get_search_index(self.view, 'xxx', 0)
+        self.assertEqual([self.Region(0, 3), self.Region(8, 11), self.Region(16, 19)], index.regions)
+        self.assertIs(index, get_search_index(self.view, 'xxx', 0))
+        self.assertIsNot(index, get_search_index(self.view, 'aaa', 0))
+        self.write('xxx')
+        self.assertEqual([self.Region(0, 3)], get_search_index(self.view, 'xxx', 0).regions)
+
+    def test_find(self):
+        self.write('xxx\naaa xxx aaa xxx')
+        index = get_search_index(self.view, 'xxx', 0)
+        self.assertEqual(self.Region(0, 3), index.find(self.view, 0, self.view.size()))
+        self.assertEqual(self.Region(8, 11), index.find(self.view, 1, self.view.size()))
+        self.assertEqual(self.Region(16, 19), index.find(self.view, 9, self.view.size()))
+        self.assertIsNone(index.find(self.view, 9, 18))
+        self.assertIsNone(index.find(self.view, 17, self.view.size()))
+
+    def test_find_overlapping_match(self):
+        self.write('aaaa')
+        index = get_search_index(self.view, 'aa', 0)
+        self.assertEqual(self.Region(1, 3), index.find(self.view, 1, self.view.size()))
+
+    def test_rfind(self):
+        self.write('xxx\naaa xxx aaa xxx')
+        index = get_search_index(self.view, 'xxx', 0)
+        self.assertEqual(self.Region(16, 19), index.rfind(self.view, 0, self.view.size()))
+        self.assertEqual(self.Region(8, 11), index.rfind(self.view, 0, 18))
+        self.assertEqual(self.Region(0, 3), index.rfind(self.view, 0, 10))
+        self.assertIsNone(index.rfind(self.view, 5, 10))
+
+
+class TestAddSearchHighlighting(unittest.ViewTestCase):
+
+    def test_current_occurrences_with_multiple_cursors(self):
+        self.normal('a|bc x abc x|abc x a|bc')
+        add_search_highlighting(self.view, self.view.find_all('abc'))
+        self.assertSearch('|abc| x |abc| x |abc| x |abc|')
+        self.assertSearchCurrent('|abc| x abc x abc x |abc|')
+
+    def test_selection_must_be_inside_occurrence(self):
+        self.visual('a|bc x| abc')
+        add_search_highlighting(self.view, self.view.find_all('abc'))
+        self.assertSearchCurrent('abc x abc')
+
+    def test_viewport_only_keeps_all_occurrences(self):
+        self.set_setting('search_viewport_only', True)
+        self.normal('|abc x abc')
+        occurrences = self.view.find_all('abc')
+        add_search_highlighting(self.view, occurrences)
+        self.assertSearch('|abc| x |abc|')
+        self.assertEqual(occurrences, get_search_occurrences(self.view))
+        clear_search_highlighting(self.view)
+        self.assertEqual([], get_search_occurrences(self.view))
@@ -19,8 +19,11 @@ import os
 
 from NeoVintageous.tests import unittest
 
+from NeoVintageous.nv.settings import clear_settings_cache
 from NeoVintageous.nv.settings import get_cmdline_cwd
+from NeoVintageous.nv.settings import get_setting
 from NeoVintageous.nv.settings import set_cmdline_cwd
+from NeoVintageous.nv.settings import settings_cache_stats
 
 
 class TestCmdlineCwd(unittest.ViewTestCase):
@@ -56,3 +59,34 @@ class TestCmdlineCwd(unittest.ViewTestCase):
     def test_can_return_session_cwd(self):
         set_cmdline_cwd('/tmp/fizz')
         self.assertEqual(get_cmdline_cwd(), '/tmp/fizz')
+
+
+class TestSettingsCache(unittest.ViewTestCase):
+
+    def test_get_setting_is_cached(self):
+        self.settings().set('vintageous_test_cached', 'x')
+        self.assertEqual(get_setting(self.view, 'test_cached'), 'x')
+        hits = settings_cache_stats['hits']
+        self.assertEqual(get_setting(self.view, 'test_cached'), 'x')
+        self.assertEqual(settings_cache_stats['hits'], hits + 1)
+
+    def test_view_settings_changes_invalidate_cache(self):
+        self.settings().set('vintageous_test_cached', 'x')
+        self.assertEqual(get_setting(self.view, 'test_cached'), 'x')
+        self.settings().set('vintageous_test_cached', 'y')
+        self.assertEqual(get_setting(self.view, 'test_cached'), 'y')
+        self.settings().erase('vintageous_test_cached')
+        self.assertEqual(get_setting(self.view, 'test_cached', 'z'), 'z')
+
+    def test_set_setting_invalidates_cache(self):
+        self.set_setting('test_cached', 'x')
+        self.assertEqual(self.get_setting('test_cached'), 'x')
+        self.reset_setting('test_cached')
+        self.assertIsNone(self.get_setting('test_cached'))
+
+    def test_clear_settings_cache(self):
+        self.assertIsNone(get_setting(self.view, 'test_cached'))
+        clear_settings_cache()
+        misses = settings_cache_stats['misses']
+        self.assertIsNone(get_setting(self.view, 'test_cached'))
+        self.assertEqual(settings_cache_stats['misses'], misses + 1)
@@ -40,6 +40,7 @@ from NeoVintageous.nv.settings import set_mode
 from NeoVintageous.nv.settings import set_motion_count
 from NeoVintageous.nv.settings import set_partial_sequence
 from NeoVintageous.nv.settings import set_register
+from NeoVintageous.nv.settings import set_status_line_deferred
 from NeoVintageous.nv.state import _should_scroll_into_view
 from NeoVintageous.nv.state import get_action
 from NeoVintageous.nv.state import get_motion
@@ -48,6 +49,7 @@ from NeoVintageous.nv.state import is_runnable
 from NeoVintageous.nv.state import reset_command_data
 from NeoVintageous.nv.state import set_action
 from NeoVintageous.nv.state import set_motion
+from NeoVintageous.nv.state import update_status_line
 from NeoVintageous.nv.vi import cmd_defs
 from NeoVintageous.nv.vi.cmd_base import ViCommandDefBase
 
@@ -130,6 +132,19 @@ class TestState(unittest.ViewTestCase):
         set_motion(self.view, motion)
         self.assertTrue(_should_scroll_into_view(get_motion(self.view), get_action(self.view)))
 
+    def test_live_commands_are_private_copies(self):
+        registered = cmd_defs.ViReplaceCharacters()
+        set_action(self.view, registered)
+        action = get_action(self.view)
+        self.assertIsInstance(action, cmd_defs.ViReplaceCharacters)
+        self.assertIsNot(action, registered)
+        self.assertIs(get_action(self.view), action)
+        action.accept('x')
+        set_action(self.view, action)
+        self.assertIs(get_action(self.view), action)
+        self.assertEqual(get_action(self.view).inp, 'x')
+        self.assertEqual(registered.inp, '')
+
 
 class TestStateResettingState(unittest.ViewTestCase):
 
@@ -303,3 +318,27 @@ class TestStateSetCommand(unittest.ViewTestCase):
         operator = cmd_defs.ViDeleteByChars()
         self.handler._handle_command(operator, True)
         self.assertEqual(get_mode(self.view), unittest.OPERATOR_PENDING)
+
+
+class TestUpdateStatusLine(unittest.ViewTestCase):
+
+    @unittest.mock.patch('sublime.View.set_status')
+    def test_unchanged_values_are_not_written_again(self, set_status):
+        self.normal('f|izz')
+        append_sequence(self.view, 'd')
+        update_status_line(self.view)
+        call_count = set_status.call_count
+        self.assertGreater(call_count, 0)
+        update_status_line(self.view)
+        self.assertEqual(set_status.call_count, call_count)
+
+    @unittest.mock.patch('sublime.View.set_status')
+    def test_deferred_while_processing_notation(self, set_status):
+        self.normal('f|izz')
+        set_status_line_deferred(self.view, True)
+        try:
+            append_sequence(self.view, 'd')
+            update_status_line(self.view)
+            self.assertEqual(set_status.call_count, 0)
+        finally:
+            set_status_line_deferred(self.view, False)
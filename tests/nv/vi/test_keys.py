@@ -17,6 +17,10 @@
 
 import unittest
 
+from NeoVintageous.nv.modes import NORMAL, VISUAL
+from NeoVintageous.nv.vi import cmd_defs
+from NeoVintageous.nv.vi import keys
+from NeoVintageous.nv.vi import seqs
 from NeoVintageous.nv.vi.keys import to_bare_command_name
 from NeoVintageous.nv.vi.keys import tokenize_keys
 
@@ -162,6 +166,28 @@ class TestKeySequenceTokenizer(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, invalid_token_msg):
                 _tokenize(invalid_token)
 
+    @unittest.mock.patch('NeoVintageous.nv.vi.keys._tokens_cache', keys.LRUCache(512))
+    def test_tokenize_is_cached(self):
+        self.assertEqual(_tokenize('d2<C-a>w'), ['d', '2', '<C-a>', 'w'])
+        self.assertEqual((0, 1), (keys._tokens_cache.hits, keys._tokens_cache.misses))
+        tokens = keys._tokens_cache['d2<C-a>w']
+        self.assertEqual(_tokenize('d2<C-a>w'), ['d', '2', '<C-a>', 'w'])
+        self.assertEqual((1, 1), (keys._tokens_cache.hits, keys._tokens_cache.misses))
+        self.assertIs(tokens, keys._tokens_cache['d2<C-a>w'])
+
+    @unittest.mock.patch('NeoVintageous.nv.vi.keys._bare_command_name_cache', keys.LRUCache(512))
+    def test_to_bare_command_name_is_cached(self):
+        self.assertEqual(to_bare_command_name('2d2w'), 'dw')
+        self.assertEqual(to_bare_command_name('2d2w'), 'dw')
+        self.assertEqual((1, 1), (keys._bare_command_name_cache.hits, keys._bare_command_name_cache.misses))
+
+    def test_tokenize_does_not_cache_variables(self):
+        with unittest.mock.patch.dict('NeoVintageous.nv.variables._variables', {'mapleader': ','}, clear=True):
+            self.assertEqual(_tokenize('<leader>d'), [',', 'd'])
+        with unittest.mock.patch.dict('NeoVintageous.nv.variables._variables', {'mapleader': '<space>'}, clear=True):
+            self.assertEqual(_tokenize('<leader>d'), ['<space>', 'd'])
+            self.assertEqual(to_bare_command_name('2<leader>d'), '<space>d')
+
 
 class TestToBareCommandName(unittest.TestCase):
 
@@ -178,3 +204,17 @@ class TestToBareCommandName(unittest.TestCase):
         self.assertEqual('daw', to_bare_command_name('d2aw'))
         self.assertEqual('daw', to_bare_command_name('daw'))
         self.assertEqual('dd', to_bare_command_name('d2d'))
+
+
+class TestAssign(unittest.TestCase):
+
+    def test_commands_are_shared_across_sequences_and_modes(self):
+        w = seqs.SEQ['w'][0]
+        command = keys.mappings[NORMAL][w]
+        self.assertIsInstance(command, cmd_defs.ViMoveByWords)
+        self.assertIs(command, keys.mappings[VISUAL][w])
+        for seq in seqs.SEQ['⇧▶']:
+            self.assertIs(command, keys.mappings[NORMAL][seq])
+
+    def test_text_commands_are_not_shared(self):
+        self.assertIsNot(keys.mappings[NORMAL][seqs.SEQ['w'][0]], keys.map_textcmd2cmd['movebywords'])
@@ -66,6 +66,12 @@ class Test_reverse_search_by_pt(unittest.ViewTestCase):
         self.assertEqual(None, reverse_search_by_pt(self.view, 'a', start=0, end=1, flags=LITERAL))
         self.assertEqual(None, reverse_search_by_pt(self.view, 'a', start=0, end=0, flags=LITERAL))
 
+    def test_match_overlapping_start(self):
+        self.write('aaa')
+        self.assertEqual(self.Region(1, 3), reverse_search_by_pt(self.view, 'aa', start=1, end=3))
+        self.assertEqual(self.Region(0, 2), reverse_search_by_pt(self.view, 'aa', start=0, end=3))
+        self.assertEqual(None, reverse_search_by_pt(self.view, 'aa', start=2, end=3))
+
     def test_out_of_bounds(self):
         self.normal('ab|c def')
         self.assertEqual(reverse_search_by_pt(self.view, 'a', -4, self.view.size()), None)
@@ -33,6 +33,10 @@ TESTS_CONTAINING_TAG = (
     test_data(content='<div>foo</div>', args={'start': 13}, expected=(unittest.Region(0, 5), unittest.Region(8, 14), 'div'), msg='find tag from within end tag'),  # noqa: E501
     test_data(content='<div>foo <p>bar</p></div>', args={'start': 12}, expected=(unittest.Region(9, 12), unittest.Region(15, 19), 'p'), msg='find nested tag from inside'),  # noqa: E501
     test_data(content='<head><link rel="shortcut icon" href="favicon.png"></head>', args={'start': 16}, expected=(unittest.Region(0, 6), unittest.Region(51, 58), 'head'), msg='find head'),  # noqa: E501
+    test_data(content='<div>foo <p>bar</p></div>', args={'start': 12, 'count': 2}, expected=(unittest.Region(0, 5), unittest.Region(19, 25), 'div'), msg='find enclosing tag with count'),  # noqa: E501
+    test_data(content='<div>foo <p>bar</p></div>', args={'start': 12, 'count': 3}, expected=(None, None, None), msg='find enclosing tag with count out of bounds'),  # noqa: E501
+    test_data(content='<div><p>foo<br>bar</div>', args={'start': 16}, expected=(unittest.Region(0, 5), unittest.Region(18, 24), 'div'), msg='find tag skips unclosed tags'),  # noqa: E501
+    test_data(content='foo</div>', args={'start': 1}, expected=(None, None, None), msg='find tag with no begin tag'),  # noqa: E501
 )
 
 
@@ -0,0 +1,80 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from sublime import CLASS_PUNCTUATION_END
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.vi import units
+
+
+CONTENTS = (
+    'foo (bar).baz  qux\n\nend',
+    'a.b,,c--d  e\n  f\n\n\t(g)\n',
+    '  ((x)) \n.\n,y',
+    'x=a.b(c,d);if(!x){y[0]="z";}' * 200,
+)
+
+
+# The word motions classify the text in Python. These compare them with the
+# same motions when they ask the view for each boundary.
+class TestWordMotionsMatchFindByClass(unittest.ViewTestCase):
+
+    def find_by_class(self, view, pt: int, classes: int) -> int:
+        return view.find_by_class(pt, forward=True, classes=classes)
+
+    def assertMatchesFindByClass(self, motion, *args, **kwargs):
+        for content in CONTENTS:
+            self.write(content)
+            size = self.view.size()
+            for pt in range(0, size, 1 if size < 100 else 7):
+                actual = motion(self.view, pt, *args, **kwargs)
+                with unittest.mock.patch('NeoVintageous.nv.vi.units._find_by_class', self.find_by_class):
+                    expected = motion(self.view, pt, *args, **kwargs)
+
+                self.assertEqual(expected, actual, 'at {} in {!r}'.format(pt, content[:40]))
+
+    def test_find_by_class(self):
+        for classes in (units._CLASS_VI_WORD_START, units._CLASS_VI_INTERNAL_WORD_START,
+                        units._CLASS_VI_WORD_END, CLASS_PUNCTUATION_END):
+            self.assertMatchesFindByClass(units._find_by_class, classes)
+
+    def test_next_word_start(self):
+        self.assertMatchesFindByClass(units.next_word_start)
+        self.assertMatchesFindByClass(units.next_word_start, internal=True)
+
+    def test_next_word_end(self):
+        self.assertMatchesFindByClass(units.next_word_end)
+        self.assertMatchesFindByClass(units.next_word_end, internal=True)
+        self.assertMatchesFindByClass(units.next_word_end, nosep=True)
+
+    def test_word_starts(self):
+        self.assertMatchesFindByClass(units.word_starts)
+        self.assertMatchesFindByClass(units.word_starts, count=3)
+        self.assertMatchesFindByClass(units.word_starts, internal=True)
+        self.assertMatchesFindByClass(units.word_starts, count=3, internal=True)
+
+    def test_word_ends(self):
+        self.assertMatchesFindByClass(units.word_ends)
+        self.assertMatchesFindByClass(units.word_ends, count=3)
+        self.assertMatchesFindByClass(units.word_ends, nosep=True)
+
+    def test_word_separators(self):
+        self.settings().set('word_separators', '-')
+        self.assertMatchesFindByClass(units.next_word_start)
+        self.assertMatchesFindByClass(units.next_word_end)
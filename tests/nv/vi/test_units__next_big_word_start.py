@@ -75,6 +75,12 @@ class Test_next_big_word_start_InNormalMode_FromWord(unittest.ViewTestCase):
 
         self.assertEqual(next_big_word_start(self.view, 1), 6)
 
+    def test_to_word_start_after_long_run_of_punctuation(self):
+        self.write('a.' * 3000 + ' bar\n')
+        self.select(1)
+
+        self.assertEqual(next_big_word_start(self.view, 1), 6001)
+
     def test_to_punctuation_start(self):
         self.write('(foo) (bar)\n')
         self.select(1)
@@ -45,6 +45,7 @@ TESTS_BIG = (
     test_data(content='a dog bees', args=(0,), kwargs={'big': True, 'count': 3}, expected=10, msg="find next word's end from 1-char word (count: 3)"),  # noqa: E501
     test_data(content='a. dog bee ants', args=(0,), kwargs={'big': True, 'count': 3}, expected=10, msg="find next word's end in contiguous punctuation (count: 3)"),  # noqa: E501
     test_data(content='a. (dog) bee, ants', args=(0,), kwargs={'big': True, 'count': 3}, expected=13, msg="find next word's skipping over many punctuation signs (count: 3)"),  # noqa: E501
+    test_data(content='a.' * 3000 + ' dog', args=(0,), kwargs={'big': True}, expected=6000, msg="find current word's end in long run of punctuation"),  # noqa: E501
 )
 
 